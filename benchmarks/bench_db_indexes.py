@@ -0,0 +1,169 @@
+"""Hot-path lookup latency over a million users, with and without the indexes.
+
+Builds the bot's schema in a scratch database, fills it, then times the
+lookups every verification makes -- the modal's "who else holds this VRChat
+id", the pending row by member and guild, the expiry sweep's range delete --
+once with the indexes dropped (a database from before they shipped) and once
+after _ensure_indexes() has put them back (the first boot after).
+
+    python benchmarks/bench_db_indexes.py              # 1,000,000 users, SQLite file
+    python benchmarks/bench_db_indexes.py 200000
+
+SQLite by default, in a temporary file that is deleted afterwards. Set
+BENCH_DATABASE_URL to a scratch Postgres to measure that instead -- never the
+production one: it creates and drops the bot's tables. Not collected by pytest
+(pytest.ini only looks in tests/).
+"""
+
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+_tmpdir = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = os.getenv(
+    "BENCH_DATABASE_URL", f"sqlite:///{os.path.join(_tmpdir.name, 'bench.db')}"
+)
+# bot.py reads its broker settings at import. Nothing here connects to it, so
+# any values will do.
+for name, value in {
+    "DISCORD_BOT_TOKEN": "bench",
+    "RABBITMQ_HOST": "localhost",
+    "RABBITMQ_PORT": "5672",
+    "RABBITMQ_USERNAME": "guest",
+    "RABBITMQ_PASSWORD": "guest",
+    "RABBITMQ_VHOST": "/",
+    "RABBITMQ_QUEUE_NAME": "bench_requests",
+    "RABBITMQ_RESULT_QUEUE": "bench_results",
+}.items():
+    os.environ.setdefault(name, value)
+
+from sqlalchemy import delete, select, text  # noqa: E402
+
+import bot  # noqa: E402
+
+LOOKUPS = 200
+BATCH = 20000
+PENDING_SHARE = 0.05  # pending rows per user: a busy verification drive
+
+
+def fill(users: int) -> None:
+    users_table = bot.User.__table__
+    pending_table = bot.PendingVerification.__table__
+    now = datetime.now(timezone.utc)
+    with bot.engine.begin() as conn:
+        conn.execute(delete(pending_table))
+        conn.execute(delete(users_table))
+    for start in range(0, users, BATCH):
+        rows = [
+            {
+                "discord_id": str(10**17 + n),
+                "verification_status": True,
+                "vrc_user_id": f"usr_{n:08d}",
+            }
+            for n in range(start, min(users, start + BATCH))
+        ]
+        pending = [
+            {
+                "discord_id": str(10**17 + n),
+                "guild_id": str(n % 5000),
+                "vrc_user_id": f"usr_{n:08d}",
+                "verification_code": "VRC-BENCH1",
+                # A sweep runs often, so only the last minute or so has expired.
+                "expires_at": now + timedelta(seconds=random.randint(-60, 3600)),
+            }
+            for n in range(start, min(users, start + BATCH))
+            if random.random() < PENDING_SHARE
+        ]
+        with bot.engine.begin() as conn:
+            conn.execute(users_table.insert(), rows)
+            if pending:
+                conn.execute(pending_table.insert(), pending)
+
+
+def drop_indexes() -> None:
+    for table in (bot.User.__table__, bot.PendingVerification.__table__):
+        for index in table.indexes:
+            with bot.engine.begin() as conn:
+                conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+
+
+def time_lookups(users: int) -> dict:
+    users_table = bot.User.__table__
+    pending_table = bot.PendingVerification.__table__
+    samples = {"users.vrc_user_id": [], "pending by member+guild": []}
+    with bot.engine.connect() as conn:
+        for _ in range(LOOKUPS):
+            n = random.randrange(users)
+            started = time.perf_counter()
+            conn.execute(
+                select(users_table.c.discord_id).where(
+                    users_table.c.vrc_user_id == f"usr_{n:08d}"
+                )
+            ).first()
+            samples["users.vrc_user_id"].append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            conn.execute(
+                select(pending_table.c.id).where(
+                    pending_table.c.discord_id == str(10**17 + n),
+                    pending_table.c.guild_id == str(n % 5000),
+                )
+            ).first()
+            samples["pending by member+guild"].append(time.perf_counter() - started)
+
+    # The sweep runs against a table it is about to change, so roll it back
+    # and measure both runs against the same rows.
+    with bot.engine.connect() as conn:
+        started = time.perf_counter()
+        conn.execute(
+            delete(pending_table).where(
+                pending_table.c.expires_at < datetime.now(timezone.utc)
+            )
+        )
+        sweep = time.perf_counter() - started
+        conn.rollback()
+
+    report = {}
+    for name, values in samples.items():
+        values.sort()
+        report[name] = (
+            statistics.median(values) * 1000,
+            values[int(len(values) * 0.99) - 1] * 1000,
+        )
+    report["expiry sweep (one delete)"] = (sweep * 1000, sweep * 1000)
+    return report
+
+
+def main() -> None:
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{bot.engine.dialect.name}: filling {users:,} users...")
+    started = time.perf_counter()
+    fill(users)
+    print(f"filled in {time.perf_counter() - started:.1f}s")
+
+    drop_indexes()
+    before = time_lookups(users)
+    started = time.perf_counter()
+    bot._ensure_indexes()
+    print(f"_ensure_indexes() on a live table: {time.perf_counter() - started:.1f}s")
+    after = time_lookups(users)
+
+    print(f"\n{'lookup':<28}{'no index p50/p99 ms':>24}{'indexed p50/p99 ms':>24}")
+    for name in before:
+        b50, b99 = before[name]
+        a50, a99 = after[name]
+        print(f"{name:<28}{b50:>12.3f}{b99:>12.3f}{a50:>12.3f}{a99:>12.3f}")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        bot.engine.dispose()
+        _tmpdir.cleanup()
@@ -0,0 +1,75 @@
+"""Publishes per second from the bot: connect-per-publish versus RabbitPublisher.
+
+Needs a real RabbitMQ -- the cost being measured is the TCP and AMQP handshake,
+which a fake broker would not have. Point it at a scratch broker, never the
+production one: it fills a throwaway queue and deletes it afterwards.
+
+    RABBITMQ_HOST=localhost RABBITMQ_PORT=5672 RABBITMQ_USERNAME=guest \
+    RABBITMQ_PASSWORD=guest RABBITMQ_VHOST=/ python benchmarks/bench_publish.py 500
+
+Not collected by pytest (pytest.ini only looks in tests/).
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# bot.py opens a database engine at import. Nothing here touches it, so keep
+# it off whatever .env names.
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("RABBITMQ_QUEUE_NAME", "bench_requests")
+os.environ.setdefault("RABBITMQ_RESULT_QUEUE", "bench_results")
+
+import pika  # noqa: E402
+
+import bot  # noqa: E402
+
+QUEUE = "vrcverify_bench_publish"
+BODY = json.dumps(
+    {"discordID": "1", "vrcUserID": "usr_bench", "guildID": "2", "verificationCode": None}
+)
+PROPERTIES = pika.BasicProperties(content_type="application/json", delivery_mode=2)
+
+
+def connect_per_publish(n: int) -> float:
+    """What publish_to_vrc_checker did before: a connection per message."""
+    started = time.perf_counter()
+    for _ in range(n):
+        conn = bot._rabbitmq_connect_with_retry(max_tries=1)
+        channel = conn.channel()
+        channel.queue_declare(queue=QUEUE, durable=True)
+        channel.basic_publish(
+            exchange="", routing_key=QUEUE, body=BODY, properties=PROPERTIES
+        )
+        conn.close()
+    return time.perf_counter() - started
+
+
+def shared_publisher(n: int) -> float:
+    publisher = bot.RabbitPublisher()
+    started = time.perf_counter()
+    for _ in range(n):
+        publisher.publish(QUEUE, BODY, PROPERTIES)
+    elapsed = time.perf_counter() - started
+    publisher.close()
+    return elapsed
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    before = connect_per_publish(n)
+    after = shared_publisher(n)
+    print(f"{n} publishes")
+    print(f"  connect per publish: {n / before:9.1f}/s  ({before * 1000 / n:.2f} ms each)")
+    print(f"  shared publisher:    {n / after:9.1f}/s  ({after * 1000 / n:.2f} ms each)")
+
+    conn = bot._rabbitmq_connect_with_retry(max_tries=1)
+    conn.channel().queue_delete(queue=QUEUE)
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Checker jobs per second: connect-per-result versus ResultPublisher.
+
+Runs against a fake broker, so it needs nothing but the repo. The fake charges
+a fixed latency for each round trip a real broker would need: a handshake to
+open a connection, one each to open a channel, declare a queue, and confirm a
+publish. The numbers are only as good as those latencies, which default to a
+broker on the same LAN; set BENCH_RTT_MS to model a different one.
+
+    python benchmarks/bench_result_publish.py 300
+
+Each "job" is the checker's worker pool calling send_verification_result, so
+the ResultPublisher run also pays the hand-over to the consumer thread. Not
+collected by pytest (pytest.ini only looks in tests/).
+"""
+
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# The checker reads its broker and VRChat settings at import. Nothing here
+# connects to either, so any values will do.
+for name, value in {
+    "RABBITMQ_HOST": "localhost",
+    "RABBITMQ_PORT": "5672",
+    "RABBITMQ_USERNAME": "guest",
+    "RABBITMQ_PASSWORD": "guest",
+    "RABBITMQ_VHOST": "/",
+    "RABBITMQ_QUEUE_NAME": "bench_requests",
+    "RABBITMQ_RESULT_QUEUE": "bench_results",
+    "VRCHAT_USERNAME": "bench",
+    "VRCHAT_PASSWORD": "bench",
+}.items():
+    os.environ.setdefault(name, value)
+
+import vrc_online_checker as checker  # noqa: E402
+from result_publisher import ResultPublisher  # noqa: E402
+
+RTT = float(os.getenv("BENCH_RTT_MS", "0.5")) / 1000.0
+# Opening a connection is several round trips: TCP, then AMQP's
+# start/tune/open exchange.
+HANDSHAKE_ROUND_TRIPS = 4
+
+
+class FakeChannel:
+    is_open = True
+
+    def confirm_delivery(self):
+        time.sleep(RTT)
+
+    def queue_declare(self, queue, durable=True, arguments=None):
+        time.sleep(RTT)
+
+    def basic_publish(self, exchange, routing_key, body, properties=None):
+        # Unconfirmed publishes (the old path) are fire-and-forget; the cost
+        # there was the connection, not the publish. Confirmed ones wait.
+        if getattr(self, "confirming", False):
+            time.sleep(RTT)
+
+
+class ConfirmingChannel(FakeChannel):
+    confirming = True
+
+
+class FakeConnection:
+    """A consumer connection: callbacks run on its own thread, in order."""
+
+    is_open = True
+
+    def __init__(self, channel_class=FakeChannel):
+        time.sleep(RTT * HANDSHAKE_ROUND_TRIPS)
+        self._channel_class = channel_class
+        self._callbacks: queue.Queue = queue.Queue()
+
+    def channel(self):
+        time.sleep(RTT)
+        return self._channel_class()
+
+    def add_callback_threadsafe(self, callback):
+        self._callbacks.put(callback)
+
+    def run(self, stop: threading.Event):
+        while not stop.is_set():
+            try:
+                self._callbacks.get(timeout=0.05)()
+            except queue.Empty:
+                pass
+
+    def close(self):
+        pass
+
+
+RESULT = {"discord_id": "1", "guild_id": "2", "status": "ok", "vrc_user_id": "usr_bench"}
+
+
+def run_jobs(n: int) -> float:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=checker.VRCHAT_LOOKUP_CONCURRENCY) as pool:
+        for future in [pool.submit(checker.send_verification_result, RESULT) for _ in range(n)]:
+            future.result()
+    return time.perf_counter() - started
+
+
+def connect_per_result(n: int) -> float:
+    checker.result_publisher = None
+    checker._rabbitmq_connect_with_retry = lambda max_tries=0: FakeConnection()
+    return run_jobs(n)
+
+
+def shared_result_publisher(n: int) -> float:
+    stop = threading.Event()
+    ready = threading.Event()
+    holder = {}
+
+    def consumer_thread():
+        # The publisher must be built on the thread that owns the connection,
+        # as listen_for_verifications does.
+        conn = FakeConnection(ConfirmingChannel)
+        holder["publisher"] = ResultPublisher(conn)
+        ready.set()
+        conn.run(stop)
+
+    t = threading.Thread(target=consumer_thread, daemon=True)
+    t.start()
+    ready.wait()
+    checker.result_publisher = holder["publisher"]
+    try:
+        return run_jobs(n)
+    finally:
+        checker.result_publisher = None
+        stop.set()
+        t.join()
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    # Keep the per-result log line out of the timing.
+    checker.logging.disable(checker.logging.INFO)
+
+    per_result = connect_per_result(n)
+    shared = shared_result_publisher(n)
+
+    print(f"{n} results, {RTT * 1000:.2f} ms broker round trip")
+    print(f"  connect per result: {per_result:7.3f}s  {n / per_result:8.1f} jobs/s")
+    print(f"  ResultPublisher:    {shared:7.3f}s  {n / shared:8.1f} jobs/s")
+    print(f"  speed-up:           {per_result / shared:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,16 @@ import json
 import asyncio
 import logging
 import secrets
+import math
 import hashlib
 import random
 import string
 import re
 import time
+import threading
+import functools
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from dataclasses import dataclass
 from html import escape
@@ -20,8 +25,10 @@ from discord.ext import commands
 from discord.ui import View, Button, Select
 
 import pika
+from pika.adapters.asyncio_connection import AsyncioConnection
 from pika.exceptions import AMQPError
 from sqlalchemy import (
+    bindparam,
     create_engine,
     Column,
     Integer,
@@ -29,12 +36,17 @@ from sqlalchemy import (
     Boolean,
     Date,
     DateTime,
+    Index,
     text,
     inspect,
     func,
+    select,
+    update,
 )
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import QueuePool, StaticPool
+from sqlalchemy.exc import IntegrityError, TimeoutError as SQLAlchemyTimeoutError
+from sqlalchemy.schema import CreateIndex, DropIndex
 from contextlib import contextmanager
 from datetime import date, datetime, timezone, timedelta
 from dotenv import load_dotenv
@@ -274,6 +286,105 @@ logging.getLogger("discord").setLevel(
 install_log_scrubbing()
 logger = logging.getLogger(__name__)
 
+# -------------------------------------------------------------------
+# Runtime stats
+# -------------------------------------------------------------------
+# The bot exports no metrics endpoint -- bot_api is an mTLS door for the
+# dashboard and deliberately serves nothing else. What it does have is a log,
+# so counters and gauges collected here are written out as one "Runtime
+# stats" line every BOT_STATS_INTERVAL_SECONDS (0 turns that off).
+BOT_STATS_INTERVAL_SECONDS = _int_env("BOT_STATS_INTERVAL_SECONDS", 300, minimum=0)
+
+
+class RuntimeStats:
+    """Process-local counters, plus gauges read when the line is written."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = {}
+        self._gauges: dict[str, object] = {}
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        # Locked because a few callers run on executor threads.
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def get(self, name: str) -> int:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def gauge(self, name: str, read) -> None:
+        """Register `read()` to be sampled for every stats line."""
+        self._gauges[name] = read
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            values = dict(self._counters)
+        for name, read in list(self._gauges.items()):
+            try:
+                values[name] = read()
+            except Exception:
+                values[name] = "error"
+        return dict(sorted(values.items()))
+
+
+runtime_stats = RuntimeStats()
+
+
+async def runtime_stats_log_task(interval_seconds: int = BOT_STATS_INTERVAL_SECONDS):
+    """Write the runtime stats to the log every `interval_seconds`."""
+    if interval_seconds <= 0:
+        return
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            logger.info(
+                "Runtime stats: %s",
+                " ".join(f"{name}={value}" for name, value in runtime_stats.snapshot().items()),
+            )
+        except Exception:
+            logger.exception("Could not log runtime stats")
+
+
+# How far behind schedule the event loop runs. A task asks to wake every
+# EVENT_LOOP_LAG_INTERVAL seconds and measures how late it actually woke;
+# anything blocking the loop -- a synchronous query, a slow file read --
+# shows up here as lag. Reported as the latest and worst reading since the
+# last stats line, and logged at once when it passes the warning threshold.
+EVENT_LOOP_LAG_INTERVAL = _float_env("EVENT_LOOP_LAG_INTERVAL", 1.0) or 1.0
+EVENT_LOOP_LAG_WARN_SECONDS = _float_env("EVENT_LOOP_LAG_WARN_SECONDS", 0.5)
+
+
+class LoopLagMonitor:
+    def __init__(self):
+        self.last = 0.0
+        self._worst = 0.0
+
+    def observe(self, lag: float) -> None:
+        self.last = lag
+        self._worst = max(self._worst, lag)
+        if EVENT_LOOP_LAG_WARN_SECONDS and lag >= EVENT_LOOP_LAG_WARN_SECONDS:
+            logger.warning("Event loop was blocked for %.0f ms", lag * 1000)
+
+    def take_worst(self) -> float:
+        """The worst lag since the previous call, which starts a new period."""
+        worst, self._worst = self._worst, self.last
+        return worst
+
+
+loop_lag = LoopLagMonitor()
+runtime_stats.gauge("event_loop_lag_ms", lambda: round(loop_lag.last * 1000, 1))
+runtime_stats.gauge("event_loop_lag_max_ms", lambda: round(loop_lag.take_worst() * 1000, 1))
+
+
+async def event_loop_lag_monitor(interval_seconds: float = EVENT_LOOP_LAG_INTERVAL):
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(interval_seconds)
+        loop_lag.observe(max(0.0, loop.time() - started - interval_seconds))
+
+
 # -------------------------------------------------------------------
 # The invite-account roster (issue #49, phase 6)
 # -------------------------------------------------------------------
@@ -447,7 +558,126 @@ SEAT_SWEEP_SPACING = _float_env("SEAT_SWEEP_SPACING", 2.0)
 # -------------------------------------------------------------------
 # SQLAlchemy setup
 # -------------------------------------------------------------------
-engine = create_engine(DATABASE_URL)
+def _is_in_memory_sqlite(url: str | None) -> bool:
+    return bool(url) and url.startswith("sqlite") and (":memory:" in url or url.rstrip("/") == "sqlite:")
+
+
+# The connection pool. SQLAlchemy's defaults -- five connections, no liveness
+# check, connections kept for ever -- were sized for a bot that queried from
+# the event loop one statement at a time. With database work on the DB threads,
+# background flushes and the result consumer all running at once, the pool is
+# the ceiling for the whole bot, so it is sized here and measured below.
+#
+# Pre-ping costs a round trip per checkout and buys never handing a handler a
+# connection Postgres (or a proxy in front of it) closed while it sat idle --
+# which otherwise surfaces as one failed verification after every quiet spell.
+# Recycle retires connections before such idle timeouts are likely; 0 = never.
+DB_POOL_SIZE = _int_env("DB_POOL_SIZE", 10)
+DB_MAX_OVERFLOW = _int_env("DB_MAX_OVERFLOW", 5, minimum=0)
+DB_POOL_TIMEOUT = _float_env("DB_POOL_TIMEOUT", 30.0) or 30.0
+DB_POOL_RECYCLE_SECONDS = _int_env("DB_POOL_RECYCLE_SECONDS", 1800, minimum=0)
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+class DurationMonitor:
+    """Average and worst of a duration, per stats period.
+
+    The average and the worst since the last stats line are what tell a
+    resource that is merely busy from one that is too small.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._total = 0.0
+        self._count = 0
+        self._worst = 0.0
+
+    def observe(self, waited: float) -> None:
+        with self._lock:
+            self._total += waited
+            self._count += 1
+            self._worst = max(self._worst, waited)
+
+    def take(self) -> tuple[float, float]:
+        """(average, worst) since the previous call, which starts a new period."""
+        with self._lock:
+            average = self._total / self._count if self._count else 0.0
+            worst = self._worst
+            self._total, self._count, self._worst = 0.0, 0, 0.0
+        return average, worst
+
+
+def register_duration_stats(prefix: str, monitor: DurationMonitor) -> None:
+    """Report `monitor` as <prefix>_avg_ms and <prefix>_max_ms."""
+    period = {}
+
+    def take_average():
+        period["average"], period["worst"] = monitor.take()
+        return round(period["average"] * 1000, 2)
+
+    # Sampled in registration order, so the average (which starts the period)
+    # is read before the worst from the same period.
+    runtime_stats.gauge(f"{prefix}_avg_ms", take_average)
+    runtime_stats.gauge(f"{prefix}_max_ms", lambda: round(period.get("worst", 0.0) * 1000, 2))
+
+
+# A wait is the time pool.connect() took: queueing behind other checkouts when
+# the pool is exhausted, plus opening a new connection when it is not.
+pool_waits = DurationMonitor()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited."""
+
+    def connect(self):
+        started = time.monotonic()
+        try:
+            return super().connect()
+        except SQLAlchemyTimeoutError:
+            runtime_stats.incr("db_pool_checkout_timeouts")
+            raise
+        finally:
+            pool_waits.observe(time.monotonic() - started)
+
+
+def _engine_options(url: str | None) -> dict:
+    # An in-memory SQLite database lives inside one connection. SQLAlchemy's
+    # default for it is a connection per thread -- a separate, empty database
+    # in every thread -- which the DB threads below would each see. One shared
+    # connection keeps it one database.
+    if _is_in_memory_sqlite(url):
+        return {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE_SECONDS or -1,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+engine = create_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
+
+
+def _register_pool_stats(pool) -> None:
+    """Pool occupancy in the "Runtime stats" line.
+
+    checked_out near size + overflow means the next burst queues; waits are
+    what that queueing costs. Only QueuePool keeps these numbers -- the
+    single-connection pool used for in-memory SQLite has nothing to report.
+    """
+    if not isinstance(pool, QueuePool):
+        return
+    runtime_stats.gauge("db_pool_size", pool.size)
+    runtime_stats.gauge("db_pool_checked_out", pool.checkedout)
+    # overflow() counts down from -size while the pool is filling; only the
+    # connections opened beyond pool_size are overflow in the sense that matters.
+    runtime_stats.gauge("db_pool_overflow", lambda: max(0, pool.overflow()))
+    register_duration_stats("db_pool_wait", pool_waits)
+
+
+_register_pool_stats(engine.pool)
 Session = sessionmaker(bind=engine)
 Base = declarative_base()
 
@@ -466,6 +696,46 @@ def session_scope():
         session.close()
 
 
+# Database work from interaction handlers runs on these threads, never on the
+# event loop. A query is a blocking network round trip, and on the loop a
+# Postgres latency spike stalled everything at once: gateway heartbeats, every
+# other interaction, and the 3-second window Discord gives an interaction to
+# be answered.
+#
+# Bounded, and kept below the engine's connection pool, so a burst queues for
+# a thread here instead of piling up waiting on a connection. An in-memory
+# SQLite database is a single connection, so it gets a single thread.
+DB_THREADS = 1 if _is_in_memory_sqlite(DATABASE_URL) else _int_env("DB_THREADS", 4)
+if not _is_in_memory_sqlite(DATABASE_URL) and DB_THREADS > DB_POOL_SIZE + DB_MAX_OVERFLOW:
+    logger.warning(
+        "DB_THREADS=%s exceeds the connection pool (%s + %s overflow); the extra "
+        "threads will only wait for connections. Raise DB_POOL_SIZE or lower "
+        "DB_THREADS.",
+        DB_THREADS,
+        DB_POOL_SIZE,
+        DB_MAX_OVERFLOW,
+    )
+
+_db_executor: ThreadPoolExecutor | None = None
+
+
+def db_executor() -> ThreadPoolExecutor:
+    global _db_executor
+    if _db_executor is None:
+        _db_executor = ThreadPoolExecutor(max_workers=DB_THREADS, thread_name_prefix="db")
+    return _db_executor
+
+
+async def run_db(fn, *args, **kwargs):
+    """Await blocking database work `fn(*args, **kwargs)` on the DB threads.
+
+    `fn` should open its own session_scope and return plain values, not ORM
+    objects: the session is closed by the time the result reaches the loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(db_executor(), functools.partial(fn, *args, **kwargs))
+
+
 # -------------------------------------------------------------------
 # Database Models
 # -------------------------------------------------------------------
@@ -499,7 +769,9 @@ class User(Base):
     id = Column(Integer, primary_key=True)
     discord_id = Column(String(30), unique=True, nullable=False)
     verification_status = Column(Boolean, default=False)
-    vrc_user_id = Column(String(50), nullable=True)
+    # Indexed: every modal submit asks whether another Discord account already
+    # holds this VRChat id. Added to a live table by _ensure_indexes().
+    vrc_user_id = Column(String(50), nullable=True, index=True)
     last_verification_attempt = Column(DateTime(timezone=True))
 
 
@@ -511,7 +783,14 @@ class PendingVerification(Base):
     vrc_user_id = Column(String(50), nullable=False)
     verification_code = Column(String(20), nullable=False)
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    expires_at = Column(DateTime(timezone=True), nullable=False)
+    # Indexed for the expiry sweep's range delete.
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+
+    # Every result, button press and modal submit finds its row by member and
+    # guild. Both indexes are added to a live table by _ensure_indexes().
+    __table_args__ = (
+        Index("ix_pending_verifications_discord_id_guild_id", "discord_id", "guild_id"),
+    )
 
 
 class InstructionPanelView(Base):
@@ -547,6 +826,12 @@ class GuildOnboarding(Base):
     setup_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     panel_nudge_dm_sent = Column(Boolean, nullable=False, default=False)
 
+    # The nudge sweep asks for rows not yet nudged and set up before a cutoff.
+    # Flag first: it is an equality, so the range on setup_at can use the rest.
+    __table_args__ = (
+        Index("ix_guild_onboarding_nudge_due", "panel_nudge_dm_sent", "setup_at"),
+    )
+
 
 class PremiumCutoverNotice(Base):
     """Which guilds have already had the one-time premium announcement DM.
@@ -1028,6 +1313,12 @@ class GroupInviteRequest(Base):
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
 
+    # The key already serves every lookup by member. The worker's answer only
+    # carries the job id, so settling it needs this one.
+    __table_args__ = (
+        Index("ix_group_invite_request_server_id_job_id", "server_id", "job_id"),
+    )
+
 
 class GroupSeatLease(Base):
     """Which invite account holds a guild's seat, and since when (issue #49).
@@ -1299,11 +1590,118 @@ class PremiumEntitlementSeen(Base):
     )
 
 
+class PremiumEntitlementCursor(Base):
+    """How far sweep_entitlement_history() has read, per SKU.
+
+    Discord hands entitlements back oldest first when asked for those `after`
+    an id, and ids are snowflakes, so the largest one the sweep has recorded
+    is a complete description of its progress: everything at or below it is
+    already in the ledger. Each boot asks only for what came after, which
+    makes the sweep cost what changed since the last start rather than the
+    whole history of the business.
+
+    Keyed by SKU because the cursor describes one SKU's list. Pointing
+    PREMIUM_SKU_ID at a new product starts that product's walk from the
+    beginning instead of skipping its history with the old product's mark.
+
+    Advanced in the same transaction as the ledger rows it covers, never
+    ahead of them -- a cursor past an unrecorded guild would be a hole the
+    next sweep never looks at again. A separate table for the same reason as
+    the others: create_all() adds tables, never columns.
+    """
+
+    __tablename__ = "premium_entitlement_cursor"
+    sku_id = Column(String, primary_key=True)
+    # A snowflake, kept as a string like every other Discord id here.
+    last_entitlement_id = Column(String, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+
 # Creates any missing tables. Note this does NOT add columns to tables that
 # already exist — those still need a manual ALTER.
 Base.metadata.create_all(engine)
 
 
+def _ensure_indexes() -> None:
+    """Create any index in the models that the database does not have yet.
+
+    create_all() builds a table's indexes only when it builds the table, so an
+    index added to a model later would exist only in the code -- the same trap
+    as a column, except that nothing fails: every query still works, just as a
+    full scan. Unlike a column, an index can be added safely from here, so this
+    does rather than warns.
+
+    CREATE INDEX IF NOT EXISTS, so a boot that finds everything in place costs
+    one no-op statement per index. On Postgres the build is CONCURRENTLY: a
+    plain CREATE INDEX holds a lock that blocks every write to the table until
+    it finishes, and on a table the size of `users` that is every verification
+    stalled for as long as the build takes, on the very boot that is meant to
+    make them faster. CONCURRENTLY cannot run in a transaction, so each
+    statement goes through an AUTOCOMMIT connection; SQLite has no such form
+    and locks the whole file for any write anyway, so it keeps the plain one.
+    Derived from the metadata, like the column check below, so there is no
+    list to forget to update.
+
+    A concurrent build that dies halfway leaves an INVALID index behind, which
+    IF NOT EXISTS would then skip forever while the planner ignores it. Those
+    are dropped and built again.
+
+    Each index on its own, and a failure is a warning: a missing index makes a
+    query slow, which is no reason to refuse to start.
+    """
+    concurrently = engine.dialect.name == "postgresql"
+    invalid = set()
+    if concurrently:
+        try:
+            with engine.connect() as conn:
+                invalid = set(
+                    conn.execute(
+                        text(
+                            "SELECT c.relname FROM pg_index i "
+                            "JOIN pg_class c ON c.oid = i.indexrelid "
+                            "WHERE NOT i.indisvalid"
+                        )
+                    ).scalars()
+                )
+        except Exception:
+            logger.warning("Could not look for invalid indexes.", exc_info=True)
+
+    for table in Base.metadata.sorted_tables:
+        for index in sorted(table.indexes, key=lambda idx: idx.name):
+            try:
+                if not concurrently:
+                    with engine.begin() as conn:
+                        conn.execute(CreateIndex(index, if_not_exists=True))
+                    continue
+                options = index.dialect_options["postgresql"]
+                # Set for this statement only: create_all() compiles the same
+                # Index inside its transaction, where CONCURRENTLY is an error.
+                options["concurrently"] = True
+                try:
+                    with engine.connect().execution_options(
+                        isolation_level="AUTOCOMMIT"
+                    ) as conn:
+                        if index.name in invalid:
+                            conn.execute(DropIndex(index, if_exists=True))
+                        conn.execute(CreateIndex(index, if_not_exists=True))
+                finally:
+                    options["concurrently"] = False
+            except Exception:
+                logger.warning(
+                    "Could not create index %s on %s; queries using it will "
+                    "scan the table until it exists.",
+                    index.name,
+                    table.name,
+                    exc_info=True,
+                )
+
+_ensure_indexes()
+
+
 def _ddl_type_for(table: str, column: str) -> str:
     """The column's real SQL type, so the statement in the log can be pasted.
 
@@ -1431,6 +1829,310 @@ def _rabbitmq_connect_with_retry(max_tries: int = 0) -> pika.BlockingConnection:
 
             time.sleep(delay)
 
+
+class RabbitPublisher:
+    """One long-lived RabbitMQ connection that every publish in the bot shares.
+
+    Publishing used to open a connection, open a channel, declare the queue,
+    send one message and tear the lot down again -- a TCP and AMQP handshake
+    for every Verify press, which during a verification drive was most of what
+    a publish cost. This keeps the connection and its channel open between
+    publishes and remembers which queues it has already declared.
+
+    One channel, not a pool of them. pika's BlockingConnection is not
+    thread-safe, so every channel on it would still have to be driven under
+    the same lock; a pool would only look concurrent. Publishes come from the
+    default executor, so the lock is what keeps two of them from interleaving
+    frames on the wire.
+
+    A broker restart or an idle disconnect is only discovered by using the
+    connection. A publish that fails on a connection this object had already
+    been holding is therefore retried once, immediately, on a fresh one --
+    the stale connection is not the caller's failure, and charging it an
+    attempt (and the sleep that comes with one) would make the first publish
+    after every quiet spell slower than the old connect-per-publish code.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connection = None
+        self._channel = None
+        self._declared: set[str] = set()
+        # Read by the benchmark and by anyone wondering whether reuse is
+        # actually happening: a healthy process connects once and publishes
+        # many times.
+        self.connects = 0
+        self.publishes = 0
+
+    def publish(self, queue: str, body: str, properties, arguments=None) -> None:
+        """Send one message to `queue`. Raises AMQPError if it could not."""
+        with self._lock:
+            reused = self._channel is not None
+            try:
+                self._publish_locked(queue, body, properties, arguments)
+            except Exception as error:
+                self._discard_locked()
+                if (
+                    not reused
+                    or not isinstance(error, (AMQPError, OSError))
+                    or is_queue_argument_mismatch(error)
+                ):
+                    raise
+                logger.info("RabbitMQ publish connection went stale; reconnecting.")
+                try:
+                    self._publish_locked(queue, body, properties, arguments)
+                except Exception:
+                    self._discard_locked()
+                    raise
+
+    def _publish_locked(self, queue, body, properties, arguments) -> None:
+        if self._channel is None:
+            self._connection = _rabbitmq_connect_with_retry(max_tries=1)
+            self.connects += 1
+            self._channel = self._connection.channel()
+        else:
+            # Services heartbeats and surfaces a connection the broker has
+            # already closed, so the failure lands here rather than half-way
+            # through a publish.
+            self._connection.process_data_events(time_limit=0)
+        if queue not in self._declared:
+            self._channel.queue_declare(queue=queue, durable=True, arguments=arguments)
+            self._declared.add(queue)
+        self._channel.basic_publish(
+            exchange="", routing_key=queue, body=body, properties=properties
+        )
+        self.publishes += 1
+
+    def _discard_locked(self) -> None:
+        connection = self._connection
+        self._connection = None
+        self._channel = None
+        # Declarations belong to the connection that made them as far as this
+        # object knows: a queue deleted while we were away must be recreated.
+        self._declared.clear()
+        try:
+            if connection is not None and connection.is_open:
+                connection.close()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """Drop the connection. The next publish opens a new one."""
+        with self._lock:
+            self._discard_locked()
+
+
+rabbit_publisher = RabbitPublisher()
+
+
+def publish_retry_delay(attempt: int) -> float:
+    """How long a failed publish waits before attempt `attempt + 1`."""
+    return min(10.0, 1.5 * attempt)
+
+
+class AsyncRabbitChannel:
+    """One RabbitMQ connection and channel owned by the event loop.
+
+    The consumers used to be blocking pika loops parked for ever in the
+    default executor, which pinned two of its threads for the life of the
+    process and handed every message back to the loop with
+    run_coroutine_threadsafe. pika's asyncio adapter does the socket work on
+    the loop itself, so a message arrives as an ordinary callback on the loop
+    and the executor is left to work that actually blocks.
+
+    pika's asynchronous API is callbacks; this turns the few calls the bot
+    makes into awaitables. `closed` resolves -- with the reason, never an
+    exception -- the moment either the connection or the channel goes away,
+    and anything still awaiting a reply fails with that same reason. That
+    includes a 406 on queue_declare, which the broker delivers by closing the
+    channel rather than by answering, so is_queue_argument_mismatch works on
+    what this raises exactly as it does on the blocking client's errors.
+    """
+
+    def __init__(self):
+        self.connection = None
+        self.channel = None
+        self.closed = None
+        self._pending: set = set()
+
+    async def open(self) -> "AsyncRabbitChannel":
+        loop = asyncio.get_running_loop()
+        self.closed = loop.create_future()
+        opened = self._expect_reply()
+
+        def on_channel_open(channel):
+            self.channel = channel
+            channel.add_on_close_callback(lambda _ch, reason: self._on_closed(reason))
+            if not opened.done():
+                opened.set_result(self)
+
+        self.connection = AsyncioConnection(
+            _rabbitmq_parameters(),
+            on_open_callback=lambda conn: conn.channel(on_open_callback=on_channel_open),
+            on_open_error_callback=lambda _conn, error: self._on_closed(error),
+            on_close_callback=lambda _conn, reason: self._on_closed(reason),
+            custom_ioloop=loop,
+        )
+        return await opened
+
+    @property
+    def is_open(self) -> bool:
+        return (
+            self.channel is not None
+            and self.channel.is_open
+            and self.closed is not None
+            and not self.closed.done()
+        )
+
+    def _expect_reply(self) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return future
+
+    def _on_closed(self, reason) -> None:
+        if not isinstance(reason, BaseException):
+            reason = pika.exceptions.AMQPConnectionError(reason)
+        if self.closed is not None and not self.closed.done():
+            self.closed.set_result(reason)
+        for future in list(self._pending):
+            if not future.done():
+                future.set_exception(reason)
+
+    async def queue_declare(self, queue: str, durable: bool = True, arguments=None):
+        reply = self._expect_reply()
+        self.channel.queue_declare(
+            queue,
+            durable=durable,
+            arguments=arguments,
+            callback=lambda frame: reply.done() or reply.set_result(frame),
+        )
+        return await reply
+
+    async def basic_qos(self, prefetch_count: int):
+        reply = self._expect_reply()
+        self.channel.basic_qos(
+            prefetch_count=prefetch_count,
+            callback=lambda frame: reply.done() or reply.set_result(frame),
+        )
+        return await reply
+
+    def basic_consume(self, queue: str, on_message) -> None:
+        self.channel.basic_consume(queue, on_message, auto_ack=False)
+
+    def basic_publish(self, exchange: str, routing_key: str, body, properties) -> None:
+        self.channel.basic_publish(
+            exchange=exchange, routing_key=routing_key, body=body, properties=properties
+        )
+
+    def close(self) -> None:
+        connection = self.connection
+        try:
+            if connection is not None and not (connection.is_closed or connection.is_closing):
+                connection.close()
+        except Exception:
+            pass
+
+
+async def _open_async_rabbitmq() -> AsyncRabbitChannel:
+    """A freshly opened loop-owned channel. Tests replace this with a fake."""
+    return await AsyncRabbitChannel().open()
+
+
+class AsyncRabbitPublisher:
+    """The loop-owned counterpart of RabbitPublisher, for async callers.
+
+    Same contract: one connection kept open between publishes, each queue
+    declared once per connection, AMQPError raised when a publish could not
+    be handed to the broker. No lock against threads is needed, only one
+    against two coroutines both opening a connection at once.
+
+    Bound to the loop it first published on. A second loop -- every
+    asyncio.run() in the test suite, in practice -- starts from nothing,
+    because a connection belongs to the loop that opened it.
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._lock = None
+        self._client = None
+        self._declared: set[str] = set()
+        self.connects = 0
+        self.publishes = 0
+
+    async def publish(self, queue: str, body: str, properties, arguments=None) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._client = None
+            self._declared.clear()
+        async with self._lock:
+            try:
+                if self._client is None or not self._client.is_open:
+                    self._discard()
+                    self._client = await _open_async_rabbitmq()
+                    self.connects += 1
+                if queue not in self._declared:
+                    await self._client.queue_declare(
+                        queue, durable=True, arguments=arguments
+                    )
+                    self._declared.add(queue)
+                self._client.basic_publish("", queue, body, properties)
+                self.publishes += 1
+            except Exception:
+                self._discard()
+                raise
+
+    def _discard(self) -> None:
+        client = self._client
+        self._client = None
+        self._declared.clear()
+        if client is not None:
+            client.close()
+
+    def close(self) -> None:
+        self._discard()
+
+
+async_rabbit_publisher = AsyncRabbitPublisher()
+
+
+async def consume_rabbitmq_queue(
+    queue: str, on_message, *, prefetch_count: int, arguments=None, label: str
+) -> None:
+    """Consume `queue` on the event loop for ever, reconnecting as needed.
+
+    `on_message(channel, method, properties, body)` runs on the loop and owns
+    the ack. A dropped connection, a broker restart and a refused declare all
+    end the same way: log, wait three seconds, connect again -- which is what
+    the executor-bound loops this replaces did.
+    """
+    while True:
+        client = None
+        try:
+            client = await _open_async_rabbitmq()
+            await client.queue_declare(queue, durable=True, arguments=arguments)
+            await client.basic_qos(prefetch_count)
+            client.basic_consume(queue, on_message)
+            logger.info("Listening for %s on '%s'...", label, queue)
+            reason = await client.closed
+            logger.warning(
+                "%s consumer disconnected (%s); reconnecting soon...", label, reason
+            )
+        except (AMQPError, OSError):
+            logger.warning(
+                "%s consumer could not connect; reconnecting soon...",
+                label,
+                exc_info=True,
+            )
+        except Exception:
+            logger.exception("Unexpected error in the %s consumer; restarting", label)
+        finally:
+            if client is not None:
+                client.close()
+        await asyncio.sleep(3)
+
 # -------------------------------------------------------------------
 # Discord Bot
 # -------------------------------------------------------------------
@@ -1443,38 +2145,108 @@ REST_CACHE_MAX = int(os.getenv("REST_CACHE_MAX", "10000"))
 REST_CONCURRENCY = int(os.getenv("REST_CONCURRENCY", "8"))
 
 
-class _TTLCache:
-    def __init__(self, maxsize: int, ttl: int):
-        self.maxsize = maxsize
-        self.ttl = ttl
-        self._store: dict[tuple[int, int], tuple[float, object]] = {}
+# How often a cache clears out entries that expired without being read again.
+# Expired entries are never returned either way; this only stops them holding
+# slots that live ones could use.
+REST_CACHE_SWEEP_SECONDS = _int_env("REST_CACHE_SWEEP_SECONDS", 60, minimum=1)
+
+
+class LRUTTLCache:
+    """A bounded cache that evicts the least recently used entry first.
+
+    Every entry also expires `ttl` seconds after it was set, read or not.
+    get/set are O(1): an OrderedDict keeps recency order, moved on every hit.
+    Expiry is enforced on read, and a full sweep runs at most once every
+    `sweep_interval` seconds, piggybacked on a set -- so an entry nobody asks
+    for again does not sit in the cache until LRU order finally reaches it.
 
-    def get(self, key):
+    Only touched from the event loop, so there is no lock.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        *,
+        sweep_interval: float = REST_CACHE_SWEEP_SECONDS,
+        clock=time.monotonic,
+    ):
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self.sweep_interval = sweep_interval
+        self.clock = clock
+        self._store: "OrderedDict[object, tuple[float, object]]" = OrderedDict()
+        self._next_sweep = clock() + sweep_interval
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None):
         item = self._store.get(key)
-        if not item:
-            return None
+        if item is None:
+            self.misses += 1
+            return default
         expires_at, value = item
-        if expires_at < asyncio.get_event_loop().time():
-            # expired
-            self._store.pop(key, None)
-            return None
+        if expires_at <= self.clock():
+            del self._store[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._store.move_to_end(key)
+        self.hits += 1
         return value
 
-    def set(self, key, value):
-        # simple eviction: pop random when over limit
-        if len(self._store) >= self.maxsize:
-            try:
-                self._store.pop(next(iter(self._store)))
-            except StopIteration:
-                pass
-        self._store[key] = (asyncio.get_event_loop().time() + self.ttl, value)
-
-    def drop(self, key):
+    def set(self, key, value) -> None:
+        now = self.clock()
+        if now >= self._next_sweep:
+            self.sweep(now)
+        self._store[key] = (now + self.ttl, value)
+        self._store.move_to_end(key)
+        while len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+            self.evictions += 1
+
+    def drop(self, key) -> None:
         """Forget one entry now, rather than when it expires."""
         self._store.pop(key, None)
 
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Remove every expired entry; returns how many went."""
+        now = self.clock() if now is None else now
+        expired = [key for key, (expires_at, _v) in self._store.items() if expires_at <= now]
+        for key in expired:
+            del self._store[key]
+        self.expirations += len(expired)
+        self._next_sweep = now + self.sweep_interval
+        return len(expired)
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._store),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
 
-_member_fetch_cache = _TTLCache(REST_CACHE_MAX, REST_TTL_SECONDS)
+def register_cache_stats(name: str, cache: LRUTTLCache) -> None:
+    """Put a cache's counters in the Runtime stats line as `<name>_<counter>`."""
+    for counter in ("size", "hits", "misses", "evictions", "expirations"):
+        runtime_stats.gauge(
+            f"{name}_{counter}", lambda counter=counter: cache.stats()[counter]
+        )
+
+
+_member_fetch_cache = LRUTTLCache(REST_CACHE_MAX, REST_TTL_SECONDS)
+register_cache_stats("member_cache", _member_fetch_cache)
 _rest_semaphore = asyncio.Semaphore(REST_CONCURRENCY)
 
 # Dashboard Administrator verdicts, cached separately from the member fetches
@@ -1487,7 +2259,46 @@ _rest_semaphore = asyncio.Semaphore(REST_CONCURRENCY)
 # revocation effectively immediate. Set 0 to expire entries as fast as the
 # clock allows, paying a REST call per check.
 BOT_API_ADMIN_TTL = _int_env("BOT_API_ADMIN_TTL", 15, minimum=0)
-_admin_check_cache = _TTLCache(REST_CACHE_MAX, BOT_API_ADMIN_TTL)
+_admin_check_cache = LRUTTLCache(REST_CACHE_MAX, BOT_API_ADMIN_TTL)
+register_cache_stats("admin_cache", _admin_check_cache)
+
+# Members Discord just told us are not in the guild. A result, its nickname
+# change and a group invite for one departed member would otherwise each pay a
+# REST call to hear the same 404. Short, because the answer changes the moment
+# they rejoin -- and on_member_join drops the entry when they do.
+MEMBER_ABSENT_TTL_SECONDS = _int_env("MEMBER_ABSENT_TTL_SECONDS", 10, minimum=0)
+_member_absent_cache = LRUTTLCache(REST_CACHE_MAX, MEMBER_ABSENT_TTL_SECONDS)
+
+# Lookups in progress, by key. A burst of callers that all miss the cache for
+# the same member wait on the one REST call the first of them made.
+_member_fetches_inflight: dict = {}
+_admin_checks_inflight: dict = {}
+
+
+def _forget_inflight(registry: dict, key, future) -> None:
+    if registry.get(key) is future:
+        del registry[key]
+    # Every waiter may have been cancelled; read the outcome so an error is
+    # not reported as "never retrieved".
+    if not future.cancelled():
+        future.exception()
+
+
+async def _single_flight(registry: dict, key, lookup, stat: str):
+    """Await `lookup()`, sharing one run among concurrent callers of `key`.
+
+    Shielded, so a caller that gives up (an interaction timing out) cancels
+    only its own wait, not the lookup the others are waiting on.
+    """
+    future = registry.get(key)
+    if future is None:
+        future = asyncio.ensure_future(lookup())
+        registry[key] = future
+        future.add_done_callback(functools.partial(_forget_inflight, registry, key))
+    else:
+        runtime_stats.incr(stat)
+    return await asyncio.shield(future)
+
 
 async def fetch_member_cached(
     guild: discord.Guild, user_id: int, *, fresh: bool = False
@@ -1507,6 +2318,11 @@ async def fetch_member_cached(
 
     A fresh lookup that comes back empty also drops any stale entry, so the
     other callers stop being told the member is still there.
+
+    Concurrent lookups of one member share a single REST call, fresh or not:
+    a fetch already in flight is no older than the caller's request. A 404 is
+    remembered for MEMBER_ABSENT_TTL_SECONDS, except by fresh lookups, which
+    always ask.
     """
     if not guild:
         return None
@@ -1515,14 +2331,23 @@ async def fetch_member_cached(
         cached = _member_fetch_cache.get(key)
         if cached:
             return cached  # type: ignore
-    async with _rest_semaphore:
-        try:
-            member = await guild.fetch_member(user_id)
+        if _member_absent_cache.get(key):
+            return None
+
+    async def lookup():
+        async with _rest_semaphore:
+            runtime_stats.incr("member_fetch_rest_calls")
+            try:
+                member = await guild.fetch_member(user_id)
+            except discord.NotFound:
+                _member_fetch_cache.drop(key)
+                _member_absent_cache.set(key, True)
+                return None
+            _member_absent_cache.drop(key)
             _member_fetch_cache.set(key, member)
             return member
-        except discord.NotFound:
-            _member_fetch_cache.drop(key)
-            return None
+
+    return await _single_flight(_member_fetches_inflight, key, lookup, "member_fetch_coalesced")
 
 
 class VRCVerifyBot(discord.Client):
@@ -1553,7 +2378,12 @@ class VRCVerifyBot(discord.Client):
         # Stop listening before the gateway goes away, so the dashboard gets a
         # refused connection rather than requests the bot can no longer answer.
         await stop_bot_api()
+        # Counts still in the buffer are written while the gateway is up, so
+        # a milestone they cross can still be DMed.
+        await flush_verification_counters()
         await super().close()
+        rabbit_publisher.close()
+        async_rabbit_publisher.close()
 
 
 bot = VRCVerifyBot()
@@ -2217,6 +3047,12 @@ class PremiumStatusCache:
         self.ttl = ttl
         self._fresh: dict[str, tuple[float, bool]] = {}
         self._last_known: dict[str, bool] = {}
+        # When each guild was last invalidated, so a bulk load that started
+        # before an entitlement event cannot overwrite what the event meant.
+        self._invalidated_at: dict[str, float] = {}
+        # The last complete bulk read, if any: who was paying and when the
+        # read began. See prefetch_premium_status.
+        self.bulk: Optional["PremiumPrefetch"] = None
 
     def get_fresh(self, guild_id: str) -> bool | None:
         entry = self._fresh.get(guild_id)
@@ -2256,10 +3092,52 @@ class PremiumStatusCache:
         then fails.
         """
         self._fresh.pop(guild_id, None)
+        self._invalidated_at[guild_id] = time.monotonic()
+
+    def set_many(self, values: dict[str, bool], started_at: float) -> int:
+        """`set` every guild in `values` from a bulk read begun at `started_at`.
+
+        A guild invalidated since the read began is skipped: the event that
+        invalidated it may postdate what the read saw, and the next lookup
+        will ask about it individually. Returns how many were set.
+        """
+        written = 0
+        for guild_id, value in values.items():
+            if self._invalidated_at.get(guild_id, float("-inf")) >= started_at:
+                continue
+            self.set(guild_id, value)
+            written += 1
+        return written
+
+    def replace(self, values: dict[str, bool], started_at: float) -> int:
+        """Swap in a complete bulk read as the whole fresh layer, in one step.
+
+        Readers see either the old map or the new one, never a half-filled
+        mix. A guild invalidated since the read began keeps whatever entry it
+        has now instead -- usually none, so its next read asks individually.
+        Returns how many entries came from `values`.
+        """
+        now = time.monotonic()
+        fresh: dict[str, tuple[float, bool]] = {}
+        last_known = dict(self._last_known)
+        taken = 0
+        for guild_id, value in values.items():
+            if self._invalidated_at.get(guild_id, float("-inf")) >= started_at:
+                current = self._fresh.get(guild_id)
+                if current is not None:
+                    fresh[guild_id] = current
+                continue
+            fresh[guild_id] = (now + self.ttl, value)
+            last_known[guild_id] = value
+            taken += 1
+        self._fresh, self._last_known = fresh, last_known
+        return taken
 
     def clear(self) -> None:
         self._fresh.clear()
         self._last_known.clear()
+        self._invalidated_at.clear()
+        self.bulk = None
 
 
 premium_status_cache = PremiumStatusCache(PREMIUM_STATUS_TTL)
@@ -2310,6 +3188,7 @@ def stripe_active(guild_id) -> bool:
             # (see the model docstring), and being double-billed must not be
             # able to switch premium off — the warning about it is the
             # website's job, and the gate's only job is to keep saying yes.
+            # load_stripe_paid_by_guild applies the same rule in bulk.
             rows = (
                 session.query(
                     StripeSubscription.status,
@@ -2342,6 +3221,77 @@ def stripe_active(guild_id) -> bool:
         return answer
 
 
+# Refresh-ahead for the cache above. Every guild's answer is recomputed from
+# one read of the whole table and swapped in before the TTL runs out, so a
+# verification never waits on the database because an entry happened to
+# expire under it. The webhook still invalidates directly; this only replaces
+# the expiry-driven re-reads.
+STRIPE_STATUS_REFRESH_INTERVAL = _int_env(
+    "STRIPE_STATUS_REFRESH_INTERVAL", max(60, STRIPE_STATUS_TTL * 4 // 5), minimum=0
+)
+
+
+def load_stripe_paid_by_guild() -> dict[str, bool]:
+    """Every guild with a subscription row, and whether any row is paid."""
+    now = datetime.now(timezone.utc)
+    paid: dict[str, bool] = {}
+    with session_scope() as session:
+        rows = session.query(
+            StripeSubscription.server_id,
+            StripeSubscription.status,
+            StripeSubscription.current_period_end,
+        ).all()
+        for row in rows:
+            key = panel_view_key(row.server_id)
+            paid[key] = paid.get(key, False) or _stripe_row_is_paid(
+                row.status, row.current_period_end, now
+            )
+    return paid
+
+
+async def refresh_stripe_status() -> Optional[int]:
+    """Recompute stripe_status_cache for every guild and swap it in.
+
+    Guilds the bot is in with no subscription row at all are cached as not
+    paying, which is what stripe_active would conclude from the same table.
+    Returns how many guilds were refreshed, or None if the read failed -- the
+    cache is then left as it was, and stripe_active's own fallback applies.
+    """
+    if not STRIPE_ENABLED:
+        return 0
+    started_at = time.monotonic()
+    try:
+        paid = await run_db(load_stripe_paid_by_guild)
+    except Exception:
+        logger.warning(
+            "Could not refresh Stripe subscription status; entries will be "
+            "re-read one guild at a time as they expire.",
+            exc_info=True,
+        )
+        runtime_stats.incr("stripe_status_refresh_failures")
+        return None
+    values = {str(g.id): False for g in bot.guilds}
+    values.update(paid)
+    refreshed = stripe_status_cache.replace(values, started_at)
+    runtime_stats.incr("stripe_status_refreshes")
+    return refreshed
+
+
+async def stripe_status_refresh_task(interval_seconds: int = STRIPE_STATUS_REFRESH_INTERVAL):
+    """Keep stripe_status_cache refreshed ahead of its TTL."""
+    if not STRIPE_ENABLED or interval_seconds <= 0:
+        return
+    while True:
+        try:
+            await refresh_stripe_status()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Stripe status refresh failed; retrying next interval.")
+        # Jittered downwards only, so a refresh never lands after the TTL.
+        await asyncio.sleep(interval_seconds - random.uniform(0, min(30, interval_seconds / 10)))
+
+
 def record_entitlement_seen(guild_id, source: str = "discord") -> bool:
     """Remember that this guild has held a paid plan. Idempotent.
 
@@ -2666,18 +3616,186 @@ async def guild_has_premium(guild_id) -> bool:
         return answer
 
 
-# How many entitlements the startup sweep will page through before giving up.
-# Not a limit on the business, a limit on a boot: an unbounded walk of Discord's
-# entitlement list on every start is the kind of thing that is free for a year
-# and then is not. Overflow is logged loudly, because it means the ledger is
-# incomplete and some server will be offered a second free trial.
-ENTITLEMENT_SWEEP_MAX = _int_env("ENTITLEMENT_SWEEP_MAX", 2000, minimum=1)
+# The bulk alternative to asking per guild. One walk of our SKU's live
+# entitlements answers "premium?" for every guild at once -- the guilds in it
+# yes, every other guild no -- so the per-verification check becomes a cache hit
+# and the seat sweep stops paging the API once per guild. Refreshed comfortably
+# inside PREMIUM_STATUS_TTL so entries are replaced before they expire.
+PREMIUM_PREFETCH_INTERVAL = _int_env(
+    "PREMIUM_PREFETCH_INTERVAL", max(60, PREMIUM_STATUS_TTL * 4 // 5), minimum=0
+)
+# The walk's page budget. Past it the list is incomplete, and an incomplete
+# list can only say yes: the guilds it did not reach are left to the
+# per-guild lookup rather than cached as not paying.
+PREMIUM_PREFETCH_MAX = _int_env("PREMIUM_PREFETCH_MAX", 5000, minimum=1)
 
 
-async def sweep_entitlement_history() -> int:
-    """Record every guild Discord has ever issued our SKU to.
+@dataclass
+class PremiumPrefetch:
+    """The last complete bulk read: who was paying, and when it began."""
 
-    The gateway only tells this process about entitlements that change while it
+    paying: frozenset
+    started_at: float
+
+
+async def prefetch_premium_status(extra_guild_ids=(), max_age: Optional[float] = None) -> Optional[int]:
+    """Fill premium_status_cache for every guild from one entitlement walk.
+
+    Covers every guild the bot is in plus `extra_guild_ids` -- the seat sweep
+    passes the guilds it is about to look at, which include ones the bot has
+    left. With `max_age`, a complete read younger than that is reused instead
+    of walking again.
+
+    Returns how many guilds were cached, or None if the walk failed, in which
+    case the cache is left exactly as it was: the per-guild lookup and its
+    fail-open rule still stand behind every miss.
+    """
+    if not PREMIUM_ENFORCED:
+        return 0
+
+    guild_ids = {str(g.id) for g in bot.guilds} | {str(g) for g in extra_guild_ids}
+    previous = premium_status_cache.bulk
+    if (
+        max_age is not None
+        and previous is not None
+        and time.monotonic() - previous.started_at < max_age
+    ):
+        return premium_status_cache.set_many(
+            {g: g in previous.paying for g in guild_ids}, previous.started_at
+        )
+
+    started_at = time.monotonic()
+    paying = set()
+    seen = 0
+    complete = True
+    try:
+        async for entitlement in bot.entitlements(
+            skus=[discord.Object(id=PREMIUM_SKU_ID)],
+            exclude_ended=True,
+            exclude_deleted=True,
+            # One past the cap: discord.py stops at `limit`, so asking for
+            # exactly the cap could never tell a full walk from a cut-off one.
+            limit=PREMIUM_PREFETCH_MAX + 1,
+        ):
+            seen += 1
+            if seen > PREMIUM_PREFETCH_MAX:
+                complete = False
+                break
+            guild_id = getattr(entitlement, "guild_id", None)
+            if guild_id is not None and entitlements_grant_premium([entitlement]):
+                paying.add(str(guild_id))
+    except Exception:
+        logger.warning(
+            "Could not prefetch premium status; guilds will be checked one by one.",
+            exc_info=True,
+        )
+        runtime_stats.incr("premium_prefetch_failures")
+        return None
+
+    if complete:
+        values = {g: g in paying for g in guild_ids | paying}
+        premium_status_cache.bulk = PremiumPrefetch(frozenset(paying), started_at)
+    else:
+        logger.warning(
+            "Premium prefetch reached PREMIUM_PREFETCH_MAX (%s) entitlements; only "
+            "the paying guilds it saw were cached.",
+            PREMIUM_PREFETCH_MAX,
+        )
+        values = {g: True for g in paying}
+    written = premium_status_cache.set_many(values, started_at)
+    runtime_stats.incr("premium_prefetches")
+    logger.debug("Premium prefetch: %s paying guild(s), %s cached.", len(paying), written)
+    return written
+
+
+async def premium_prefetch_task(interval_seconds: int = PREMIUM_PREFETCH_INTERVAL):
+    """Keep premium_status_cache filled ahead of its TTL."""
+    if not PREMIUM_ENFORCED or interval_seconds <= 0:
+        return
+    while True:
+        try:
+            await prefetch_premium_status()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Premium prefetch failed; retrying next interval.")
+        # Jittered downwards only, so a refresh never lands after the TTL.
+        await asyncio.sleep(interval_seconds - random.uniform(0, min(30, interval_seconds / 10)))
+
+
+# How many entitlements one startup sweep will page through. Not a limit on the
+# business, a limit on a boot: the sweep resumes from its saved cursor, so a
+# walk cut short here is finished by the next start rather than lost. In
+# practice only the first sweep after a fresh database comes anywhere near it.
+ENTITLEMENT_SWEEP_MAX = _int_env("ENTITLEMENT_SWEEP_MAX", 2000, minimum=1)
+
+# Entitlements recorded per transaction. Discord's page size, so a batch is one
+# page of the walk and the cursor never trails what was fetched by much.
+ENTITLEMENT_SWEEP_BATCH = 100
+
+
+def load_entitlement_cursor(sku_id) -> Optional[int]:
+    """The last entitlement id the sweep recorded for this SKU, or None."""
+    with session_scope() as session:
+        row = (
+            session.query(PremiumEntitlementCursor)
+            .filter_by(sku_id=str(sku_id))
+            .first()
+        )
+        return int(row.last_entitlement_id) if row is not None else None
+
+
+def record_entitlement_batch(sku_id, guild_ids, last_entitlement_id: int) -> int:
+    """Record a page of the sweep and advance its cursor, atomically.
+
+    Returns the number of guilds newly added to the ledger. Raises on a
+    database failure, unlike record_entitlement_seen(): the sweep must stop
+    where the ledger stopped, and a swallowed error would let it carry on and
+    save a cursor past rows that were never written.
+    """
+    keys = sorted({str(guild_id) for guild_id in guild_ids})
+
+    def write() -> int:
+        with session_scope() as session:
+            existing = set()
+            if keys:
+                existing = {
+                    server_id
+                    for (server_id,) in session.query(PremiumEntitlementSeen.server_id)
+                    .filter(PremiumEntitlementSeen.server_id.in_(keys))
+                    .all()
+                }
+            fresh = [key for key in keys if key not in existing]
+            for key in fresh:
+                session.add(PremiumEntitlementSeen(server_id=key, source="discord"))
+            cursor = (
+                session.query(PremiumEntitlementCursor)
+                .filter_by(sku_id=str(sku_id))
+                .first()
+            )
+            if cursor is None:
+                session.add(
+                    PremiumEntitlementCursor(
+                        sku_id=str(sku_id),
+                        last_entitlement_id=str(last_entitlement_id),
+                    )
+                )
+            elif int(cursor.last_entitlement_id) < last_entitlement_id:
+                cursor.last_entitlement_id = str(last_entitlement_id)
+        return len(fresh)
+
+    try:
+        return write()
+    except IntegrityError:
+        # A gateway event recorded one of these guilds between our read and
+        # our insert. Its row is as good as ours; reading again sees it.
+        return write()
+
+
+async def sweep_entitlement_history() -> int:
+    """Record every guild Discord has ever issued our SKU to.
+
+    The gateway only tells this process about entitlements that change while it
     is connected, which leaves two holes the ledger cannot afford: everything
     that happened before this code shipped — the tier launched 2026-08-03 and
     every server that subscribed and cancelled since then is invisible — and
@@ -2688,10 +3806,13 @@ async def sweep_entitlement_history() -> int:
     entire point: a live entitlement is already visible everywhere, and an
     ended one is the case the trial gate exists to remember.
 
-    Runs on every boot rather than once. Inserts are idempotent, so repeating
-    it costs a little API and buys self-healing: a gap opened by downtime is
-    closed by the next start rather than needing anyone to notice it. Returns
-    the number of guilds newly recorded.
+    Runs on every boot rather than once, but only over entitlements newer than
+    the saved cursor (see PremiumEntitlementCursor). An entitlement ending
+    does not change its id, and the ledger only records that a guild held one,
+    so nothing at or below the cursor can tell it anything new. A gap opened
+    by downtime is still closed by the next start, at the cost of that gap
+    rather than of the whole history. Returns the number of guilds newly
+    recorded.
     """
     if not (PREMIUM_ENFORCED and STRIPE_ENABLED):
         # Nothing offers a trial, so nothing needs the ledger yet. This keeps
@@ -2701,29 +3822,55 @@ async def sweep_entitlement_history() -> int:
     seen = 0
     added = 0
     try:
+        cursor = await run_db(load_entitlement_cursor, PREMIUM_SKU_ID) or 0
+        batch: list = []
+        batch_high = cursor
+
+        async def flush():
+            nonlocal added, batch, cursor
+            if batch_high > cursor:
+                # Entitlements with no guild (a user subscription) still move
+                # the cursor; they just add nothing to the ledger.
+                added += await run_db(
+                    record_entitlement_batch,
+                    PREMIUM_SKU_ID,
+                    [gid for gid in batch if gid is not None],
+                    batch_high,
+                )
+                cursor = batch_high
+            batch = []
+
+        # `after` is what makes Discord return oldest first, which is what
+        # lets one number stand for everything already read. 0 precedes every
+        # snowflake, so a first sweep starts at the beginning of the list.
+        # One past the cap is requested only to tell "exactly at the cap" from
+        # "more left over".
         async for entitlement in bot.entitlements(
-            skus=[discord.Object(id=PREMIUM_SKU_ID)], limit=ENTITLEMENT_SWEEP_MAX
+            skus=[discord.Object(id=PREMIUM_SKU_ID)],
+            after=discord.Object(id=cursor),
+            limit=ENTITLEMENT_SWEEP_MAX + 1,
         ):
             seen += 1
             if seen > ENTITLEMENT_SWEEP_MAX:
-                logger.error(
-                    "Entitlement sweep hit its %s cap. The ever-paid ledger is "
-                    "INCOMPLETE, and a server past the cap can be offered a "
-                    "second free trial. Raise ENTITLEMENT_SWEEP_MAX or replace "
-                    "this with an incremental sweep.",
+                logger.warning(
+                    "Entitlement sweep hit its %s cap for this start. Progress "
+                    "is saved; the next start carries on from entitlement %s.",
                     ENTITLEMENT_SWEEP_MAX,
+                    batch_high,
                 )
                 break
-            guild_id = getattr(entitlement, "guild_id", None)
-            if guild_id is None:
-                continue
-            if record_entitlement_seen(guild_id):
-                added += 1
+            batch.append(getattr(entitlement, "guild_id", None))
+            batch_high = max(batch_high, int(entitlement.id))
+            if len(batch) >= ENTITLEMENT_SWEEP_BATCH:
+                await flush()
+        await flush()
     except Exception:
         # A failed sweep is not a failed boot. The ledger keeps whatever it
-        # already had, gateway events keep adding to it, and the next start
-        # tries again -- and trial_eligible fails closed meanwhile, so the
-        # worst outcome is a trial not offered rather than one given twice.
+        # already had -- including every batch committed before the failure,
+        # with the cursor that covers them -- gateway events keep adding to
+        # it, and the next start carries on. trial_eligible fails closed
+        # meanwhile, so the worst outcome is a trial not offered rather than
+        # one given twice.
         logger.warning(
             "Could not sweep entitlement history; the trial ledger may be "
             "incomplete until the next start.",
@@ -2992,13 +4139,7 @@ def load_log_channel_id(guild_id) -> Optional[str]:
     if guild_id is None:
         return None
     try:
-        with session_scope() as session:
-            row = (
-                session.query(VerificationLogChannel)
-                .filter_by(server_id=panel_view_key(guild_id))
-                .first()
-            )
-            return row.channel_id if row else None
+        return load_guild_config(guild_id).log_channel_id
     except Exception:
         # Logging is never worth breaking verification over.
         logger.warning(
@@ -3017,13 +4158,159 @@ def set_log_channel(guild_id, channel_id: Optional[str]) -> None:
         if channel_id is None:
             if row is not None:
                 session.delete(row)
-            return
-        if row is None:
+        elif row is None:
             row = VerificationLogChannel(server_id=key, channel_id=str(channel_id))
+            row.updated_at = datetime.now(timezone.utc)
             session.add(row)
         else:
             row.channel_id = str(channel_id)
-        row.updated_at = datetime.now(timezone.utc)
+            row.updated_at = datetime.now(timezone.utc)
+    server_config_cache.invalidate(guild_id)
+
+
+# -------------------------------------------------------------------
+# Server config cache
+# -------------------------------------------------------------------
+# Every verification used to read its guild's servers row two or three times
+# (process_verification, assign_role, the locale lookup) plus the log-channel
+# row, for settings that change a few times in a server's life. Every writer of
+# those settings is in this process -- /vrcverify_setup, the dashboard save,
+# set_log_channel, and the two places that insert a bare row for a panel -- so
+# they invalidate here and the verification path reads memory instead.
+#
+# The TTL is only a backstop for writes this process cannot see: a hand-run
+# UPDATE, or the old container still serving during a deploy. Set it to 0 to
+# read the database every time.
+SERVER_CONFIG_CACHE_TTL_SECONDS = _int_env("SERVER_CONFIG_CACHE_TTL_SECONDS", 300, minimum=0)
+SERVER_CONFIG_CACHE_MAX = _int_env("SERVER_CONFIG_CACHE_MAX", 5000, minimum=1)
+
+
+@dataclass(frozen=True)
+class GuildConfig:
+    """The settings the verification path reads, detached from any session."""
+
+    exists: bool = False
+    role_id: Optional[str] = None
+    unverified_role_id: Optional[str] = None
+    auto_nickname_change: bool = False
+    # Raw, so a caller can tell "never chosen" from an explicit en-US.
+    instructions_locale: Optional[str] = None
+    custom_verification_requested_message: Optional[str] = None
+    auto_verify_new_members: bool = True
+    log_channel_id: Optional[str] = None
+
+
+def read_guild_config(guild_id) -> GuildConfig:
+    """One guild's config straight from the database, in one session."""
+    key = panel_view_key(guild_id)
+    with session_scope() as session:
+        server = session.query(Server).filter_by(server_id=key).first()
+        log_row = session.query(VerificationLogChannel).filter_by(server_id=key).first()
+        log_channel_id = log_row.channel_id if log_row else None
+        if server is None:
+            return GuildConfig(log_channel_id=log_channel_id)
+        # Treat None or a missing column as enabled, as it always has been.
+        raw_auto_verify = getattr(server, "auto_verify_new_members", None)
+        return GuildConfig(
+            exists=True,
+            role_id=server.role_id,
+            unverified_role_id=getattr(server, "unverified_role_id", None),
+            auto_nickname_change=bool(server.auto_nickname_change),
+            instructions_locale=server.instructions_locale or None,
+            custom_verification_requested_message=(
+                server.custom_verification_requested_message or None
+            ),
+            auto_verify_new_members=True if raw_auto_verify is None else bool(raw_auto_verify),
+            log_channel_id=log_channel_id,
+        )
+
+
+class ServerConfigCache:
+    """Bounded LRU of GuildConfig, with a TTL and explicit invalidation.
+
+    Read from the DB threads and the event loop alike, hence the lock. A load
+    that was already reading when its guild was invalidated does not store
+    what it read: that read may predate the write, and caching it would
+    undo the invalidation for a whole TTL.
+    """
+
+    def __init__(self, max_entries: int, ttl: float, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple[float, GuildConfig]]" = OrderedDict()
+        self._generation: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def peek(self, guild_id) -> Optional[GuildConfig]:
+        """The cached config, or None; never touches the database."""
+        key = panel_view_key(guild_id)
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, config = item
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return config
+
+    def get(self, guild_id, load=None) -> GuildConfig:
+        cached = self.peek(guild_id)
+        if cached is not None:
+            return cached
+        key = panel_view_key(guild_id)
+        with self._lock:
+            self.misses += 1
+            generation = self._generation.get(key, 0)
+        config = (load or read_guild_config)(key)
+        if self.ttl > 0:
+            with self._lock:
+                if self._generation.get(key, 0) == generation:
+                    self._entries[key] = (self._clock() + self.ttl, config)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+        return config
+
+    def invalidate(self, guild_id) -> None:
+        key = panel_view_key(guild_id)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generation[key] = self._generation.get(key, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+server_config_cache = ServerConfigCache(SERVER_CONFIG_CACHE_MAX, SERVER_CONFIG_CACHE_TTL_SECONDS)
+runtime_stats.gauge("server_config_cache_hits", lambda: server_config_cache.hits)
+runtime_stats.gauge("server_config_cache_misses", lambda: server_config_cache.misses)
+
+
+def load_guild_config(guild_id) -> GuildConfig:
+    """This guild's config, from the cache when it holds a current copy.
+
+    Blocking on a miss; from the event loop use guild_config() instead.
+    """
+    return server_config_cache.get(guild_id)
+
+
+async def guild_config(guild_id) -> GuildConfig:
+    """load_guild_config for async callers: a hit never leaves the loop."""
+    cached = server_config_cache.peek(guild_id)
+    if cached is not None:
+        return cached
+    return await run_db(load_guild_config, guild_id)
 
 
 def generate_group_claim_code() -> str:
@@ -4352,7 +5639,14 @@ async def seat_sweep_pass() -> dict:
 
     expire_stale_reservations()
 
-    for candidate in load_seat_sweep_candidates():
+    candidates = load_seat_sweep_candidates()
+    # One entitlement walk for the whole pass instead of one per guild, or
+    # none if the background prefetch has just done it.
+    await prefetch_premium_status(
+        (c["server_id"] for c in candidates), max_age=PREMIUM_STATUS_TTL / 2
+    )
+
+    for candidate in candidates:
         if candidate["released_at"] is not None:
             continue
         if asked >= SEAT_SWEEP_MAX_PER_PASS:
@@ -4857,6 +6151,8 @@ class VRCVerifyInstructionView(View):
         # Resolved once and reused for the queue priority below, so this costs
         # no extra entitlement read.
         flags = resolve_premium_flags_from_interaction(interaction)
+        if await refuse_when_saturated(interaction, flags):
+            return
         remaining = check_verification_cooldown(
             user_id, window_seconds=flags.cooldown_window()
         )
@@ -5103,129 +6399,279 @@ async def resolve_config_admin(guild: discord.Guild, owner_id) -> Optional[disco
     return member
 
 
-def _record_verification_day(guild_id: str) -> None:
-    """Add one to this guild's count for today (UTC).
+# How often buffered verification counts are written to the database. Every
+# completed verification used to cost two to four transactions just to bump
+# counters; buffering turns that into one flush per interval however many
+# verifications landed in it. 0 writes each verification through at once.
+VERIFICATION_COUNTER_FLUSH_SECONDS = _float_env("VERIFICATION_COUNTER_FLUSH_SECONDS", 5.0)
+
 
-    Its own function, and called before the milestone bookkeeping below, so the
-    two do not share a failure. `record_guild_verification` gives up entirely
-    when `servers` is missing the columns that feature needs — a deployment
-    that never ran that ALTER would otherwise silently never collect a day of
-    history either, and the Overview would show empty windows forever with
-    nothing to indicate why.
+class VerificationCounterBuffer:
+    """Verification counts not yet written, per guild and per (guild, day).
 
-    UPDATE-then-INSERT rather than a dialect-specific upsert: this runs on
-    Postgres in production and SQLite in the tests, and the ON CONFLICT syntax
-    is not the same in both. The IntegrityError branch is the race where two
-    verifications complete on the same day for the same guild at the same
-    moment — the loser retries the UPDATE, which now finds the row.
+    The day is taken when the verification is counted, not when the buffer is
+    flushed, so a flush just after midnight UTC still credits the evening's
+    verifications to the day they happened on.
+
+    Guild objects are kept alongside the totals only so the milestone DM can
+    be sent after the flush that crosses the line. A guild that was never
+    passed in (not in the bot's cache) still counts, and still consumes the
+    milestone, exactly as before; it just gets no DM.
     """
-    if not guild_id:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._days: dict[tuple[str, date], int] = {}
+        self._totals: dict[str, int] = {}
+        self._guilds: dict[str, discord.Guild] = {}
+
+    def add(self, guild_id, guild: Optional[discord.Guild] = None) -> None:
+        day_key = (panel_view_key(guild_id), datetime.now(timezone.utc).date())
+        key = str(guild_id)
+        with self._lock:
+            self._days[day_key] = self._days.get(day_key, 0) + 1
+            self._totals[key] = self._totals.get(key, 0) + 1
+            if guild is not None:
+                self._guilds[key] = guild
+
+    def take(self):
+        """Everything buffered so far, leaving the buffer empty."""
+        with self._lock:
+            taken = (self._days, self._totals, self._guilds)
+            self._days, self._totals, self._guilds = {}, {}, {}
+        return taken
+
+    def restore(self, days=None, totals=None, guilds=None) -> None:
+        """Put back counts a failed flush could not write, for the next one."""
+        with self._lock:
+            for key, count in (days or {}).items():
+                self._days[key] = self._days.get(key, 0) + count
+            for key, count in (totals or {}).items():
+                self._totals[key] = self._totals.get(key, 0) + count
+            for key, guild in (guilds or {}).items():
+                self._guilds.setdefault(key, guild)
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(self._days.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._days.clear()
+            self._totals.clear()
+            self._guilds.clear()
+
+
+verification_counters = VerificationCounterBuffer()
+runtime_stats.gauge("verification_counts_pending", verification_counters.pending)
+
+
+@dataclass(frozen=True)
+class MilestoneDue:
+    """A guild a flush carried over MILESTONE_VERIFICATION_COUNT."""
+
+    guild_id: str
+    owner_id: Optional[str]
+    count: int
+    locale: Optional[str]
+
+
+def write_verification_days(days: dict) -> None:
+    """Add buffered counts to verification_daily in one statement.
+
+    An upsert on Postgres and SQLite, which spell ON CONFLICT the same way
+    through SQLAlchemy's dialect inserts; anything else gets UPDATE-then-
+    INSERT per row inside the one transaction. Raises on failure, so the
+    caller can put the counts back rather than lose them.
+    """
+    if not days:
         return
-    key = panel_view_key(guild_id)
-    today = datetime.now(timezone.utc).date()
-    try:
-        for attempt in (1, 2):
-            with session_scope() as session:
-                updated = (
-                    session.query(VerificationDaily)
-                    .filter_by(server_id=key, day=today)
-                    .update(
-                        {VerificationDaily.count: VerificationDaily.count + 1},
-                        synchronize_session=False,
-                    )
+    table = VerificationDaily.__table__
+    rows = [
+        {"server_id": key, "day": day, "count": count}
+        for (key, day), count in days.items()
+    ]
+    dialect = engine.dialect.name
+    with session_scope() as session:
+        if dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            stmt = dialect_insert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.server_id, table.c.day],
+                set_={"count": table.c["count"] + stmt.excluded["count"]},
+            )
+            session.execute(stmt, rows)
+            return
+        for row in rows:
+            updated = session.execute(
+                update(table)
+                .where(table.c.server_id == row["server_id"], table.c.day == row["day"])
+                .values({"count": table.c["count"] + row["count"]})
+            ).rowcount
+            if not updated:
+                session.execute(table.insert().values(**row))
+
+
+def write_verification_totals(totals: dict) -> list:
+    """Add buffered counts to servers.verification_count; report milestones.
+
+    One executemany UPDATE, then one read of the rows it just locked, then the
+    milestone flag for whichever crossed the line -- all in one transaction,
+    so no other writer can slip between the count and the flag and the
+    milestone fires exactly once however the verifications were batched.
+
+    The count in the DM is the one the guild crossed at, as if the
+    verifications had been counted one by one: the threshold itself, or the
+    first verification of this batch for a guild that was already past it
+    with the flag unset.
+
+    Counts are dropped, as they always were, rather than held forever when
+    the columns do not exist yet because the manual migration hasn't been
+    applied. The check reflects the table, so it runs here, off the event
+    loop, with the write.
+    """
+    if not totals:
+        return []
+    if not (
+        server_has_column("verification_count") and server_has_column("milestone_dm_sent")
+    ):
+        return []
+    table = Server.__table__
+    keys = list(totals)
+    due = []
+    with session_scope() as session:
+        session.execute(
+            update(table)
+            .where(table.c.server_id == bindparam("b_server_id"))
+            .values(
+                verification_count=func.coalesce(table.c.verification_count, 0)
+                + bindparam("b_added")
+            ),
+            [{"b_server_id": key, "b_added": totals[key]} for key in keys],
+        )
+        crossed = session.execute(
+            select(
+                table.c.server_id,
+                table.c.owner_id,
+                table.c.verification_count,
+                table.c.instructions_locale,
+            ).where(
+                table.c.server_id.in_(keys),
+                table.c.verification_count >= MILESTONE_VERIFICATION_COUNT,
+                table.c.milestone_dm_sent.is_(False),
+            )
+        ).all()
+        if crossed:
+            # Flag first so a DM failure can never cause repeat sends.
+            session.execute(
+                update(table)
+                .where(table.c.server_id.in_([row.server_id for row in crossed]))
+                .values(milestone_dm_sent=True)
+            )
+        for row in crossed:
+            first_of_batch = row.verification_count - totals[row.server_id] + 1
+            due.append(
+                MilestoneDue(
+                    guild_id=row.server_id,
+                    owner_id=row.owner_id,
+                    count=max(MILESTONE_VERIFICATION_COUNT, first_of_batch),
+                    locale=row.instructions_locale,
                 )
-                if updated:
-                    return
-                if attempt == 2:
-                    # The insert below already failed once and the row still is
-                    # not there. Something is wrong that retrying will not fix.
-                    logger.warning(
-                        "Could not record a verification day for guild %s.", guild_id
-                    )
-                    return
-                try:
-                    session.add(
-                        VerificationDaily(server_id=key, day=today, count=1)
-                    )
-                    session.flush()
-                    return
-                except IntegrityError:
-                    # Someone else inserted the row between our UPDATE and our
-                    # INSERT. session_scope rolls back; the retry increments it.
-                    session.rollback()
+            )
+    return due
+
+
+async def flush_verification_counters() -> None:
+    """Write everything buffered, then send any milestone DMs it earned.
+
+    Never raises. A failed write puts its counts back for the next flush, so
+    a database blip delays a number on a page rather than losing it.
+    """
+    days, totals, guilds = verification_counters.take()
+    if not (days or totals):
+        return
+    flushed = True
+    try:
+        await run_db(write_verification_days, days)
     except Exception:
-        # Never let analytics bookkeeping break a verification. The member has
-        # already been verified by the time this runs, and a lost count is a
-        # gap in a chart, not a failure anyone is waiting on.
+        flushed = False
+        runtime_stats.incr("verification_count_flush_failures")
+        verification_counters.restore(days=days)
         logger.warning(
-            "Could not record the verification rollup for guild %s.",
-            guild_id,
+            "Could not write the verification rollup; retrying next flush.",
             exc_info=True,
         )
 
+    due = []
+    try:
+        due = await run_db(write_verification_totals, totals)
+    except Exception:
+        flushed = False
+        runtime_stats.incr("verification_count_flush_failures")
+        verification_counters.restore(totals=totals, guilds=guilds)
+        logger.warning("⚠️ Could not record guild verification count.", exc_info=True)
+    if flushed:
+        runtime_stats.incr("verification_count_flushes")
+
+    for milestone in due:
+        guild = guilds.get(milestone.guild_id)
+        if guild is None or milestone.owner_id is None:
+            continue
+        try:
+            member = await resolve_config_admin(guild, milestone.owner_id)
+            if member:
+                await dm_localized(
+                    member,
+                    guild,
+                    "milestone_owner_dm",
+                    milestone.locale,
+                    server=guild.name,
+                    count=milestone.count,
+                    kofi_link=KOFI_URL,
+                )
+        except Exception:
+            logger.warning(
+                "Could not send the milestone DM for guild %s.",
+                milestone.guild_id,
+                exc_info=True,
+            )
+
+
+async def verification_counter_flush_task(
+    interval_seconds: float = VERIFICATION_COUNTER_FLUSH_SECONDS,
+):
+    if interval_seconds <= 0:
+        return
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await flush_verification_counters()
+
 
 async def record_guild_verification(guild_id: str, guild: Optional[discord.Guild]):
     """
     Count a completed 18+ verification for a guild. When the guild crosses
     MILESTONE_VERIFICATION_COUNT, DM the admin who configured the bot
     (fallback: the guild owner) a one-time thank-you with the donation link.
+
+    Counted into verification_counters; the write, and the DM, happen at the
+    next flush.
     """
     if not guild_id:
         return
-
-    # First, and unconditionally: the daily rollup the dashboard's Overview
-    # reads. It shares nothing with the milestone counter below, including that
-    # counter's migration guard.
-    _record_verification_day(guild_id)
-
-    # Columns may not exist yet if the manual migration hasn't been applied.
-    if not (server_has_column("verification_count") and server_has_column("milestone_dm_sent")):
-        return
-
-    owner_to_dm = None
-    milestone_count = 0
-    instr_locale = None
-    try:
-        with session_scope() as session:
-            server = session.query(Server).filter_by(server_id=str(guild_id)).first()
-            if not server:
-                return
-            server.verification_count = (server.verification_count or 0) + 1
-            if (
-                server.verification_count >= MILESTONE_VERIFICATION_COUNT
-                and not server.milestone_dm_sent
-            ):
-                # Flag first so a DM failure can never cause repeat sends.
-                server.milestone_dm_sent = True
-                owner_to_dm = server.owner_id
-                milestone_count = server.verification_count
-                instr_locale = server.instructions_locale
-    except Exception:
-        logger.warning("⚠️ Could not record guild verification count.", exc_info=True)
-        return
-
-    if owner_to_dm is None or guild is None:
-        return
-    member = await resolve_config_admin(guild, owner_to_dm)
-    if member:
-        await dm_localized(
-            member,
-            guild,
-            "milestone_owner_dm",
-            instr_locale,
-            server=guild.name,
-            count=milestone_count,
-            kofi_link=KOFI_URL,
-        )
+    verification_counters.add(guild_id, guild)
+    if VERIFICATION_COUNTER_FLUSH_SECONDS <= 0:
+        await flush_verification_counters()
 
 
 def get_server_locale_code(guild_id: str | None, guild: Optional[discord.Guild] = None) -> str:
     if guild_id:
         try:
-            with session_scope() as session:
-                server = session.query(Server).filter_by(server_id=guild_id).first()
-                if server and server.instructions_locale in LANGUAGE_CODES:
-                    return str(server.instructions_locale)
+            locale = load_guild_config(guild_id).instructions_locale
+            if locale in LANGUAGE_CODES:
+                return str(locale)
         except Exception:
             logger.warning("Could not load server locale; falling back.", exc_info=True)
 
@@ -5273,6 +6719,25 @@ def build_vrchat_issue_message(data: dict, locale_code: str = "en-US") -> str:
 
     return get_message("vrchat_issue_unexpected", ctx)
 
+def load_verification_start(guild_id: str, user_id: str):
+    """What process_verification needs from the database, in one session.
+
+    None if the server is not set up. Otherwise (user, is_verified,
+    stored_vrc_user_id), where `user` is only a presence marker -- True, or
+    None for someone we have never seen -- and the attempt time is stamped
+    for a user we have.
+    """
+    if not load_guild_config(guild_id).role_id:
+        return None
+    with session_scope() as session:
+        user = session.query(User).filter_by(discord_id=user_id).first()
+        if not user:
+            return None, None, None
+        # Record attempt time when user clicks Begin Verification and already exists in DB
+        user.last_verification_attempt = datetime.now(timezone.utc)
+        return True, user.verification_status, user.vrc_user_id or ""
+
+
 async def process_verification(interaction: discord.Interaction):
     """
     Processes a verification request by doing one of the following:
@@ -5293,25 +6758,13 @@ async def process_verification(interaction: discord.Interaction):
     guild_id = str(interaction.guild_id)
     user_id = str(interaction.user.id)
 
-    # Use a session block to load data and extract only the necessary values.
-    with session_scope() as session:
-        server = session.query(Server).filter_by(server_id=guild_id).first()
-        if not server or not server.role_id:
-            await interaction.response.send_message(
-                get_message("setup_missing", interaction), ephemeral=True
-            )
-            return
-
-        # Extract the values you need from the user object while still in the session.
-        user = session.query(User).filter_by(discord_id=user_id).first()
-        if user:
-            # Record attempt time when user clicks Begin Verification and already exists in DB
-            user.last_verification_attempt = datetime.now(timezone.utc)
-            is_verified = user.verification_status
-            stored_vrc_user_id = user.vrc_user_id or ""
-        else:
-            is_verified = None
-            stored_vrc_user_id = None
+    state = await run_db(load_verification_start, guild_id, user_id)
+    if state is None:
+        await interaction.response.send_message(
+            get_message("setup_missing", interaction), ephemeral=True
+        )
+        return
+    user, is_verified, stored_vrc_user_id = state
 
     # CASE A: User exists and is verified.
     if user is not None and is_verified:
@@ -5329,7 +6782,13 @@ async def process_verification(interaction: discord.Interaction):
             await interaction.response.send_modal(VRCUsernameModal(interaction))
             return
 
+        # Before the cooldown, so a press that is turned away does not start one.
+        if await refuse_while_queued(interaction, user_id, guild_id):
+            return
+
         flags = resolve_premium_flags_from_interaction(interaction)
+        if await refuse_when_saturated(interaction, flags):
+            return
         remaining = check_verification_cooldown(
             user_id, window_seconds=flags.cooldown_window()
         )
@@ -5349,7 +6808,7 @@ async def process_verification(interaction: discord.Interaction):
             priority=flags.request_priority(),
         )
         await interaction.followup.send(
-            get_message("recheck_started", interaction), ephemeral=True
+            queued_reply("recheck_started", interaction, user_id, guild_id), ephemeral=True
         )
         return
 
@@ -5464,6 +6923,467 @@ def sanitize_custom_message(raw: str) -> tuple[str, list[str]]:
     return raw, invalid
 
 
+# Requests published to the checker and not yet answered. The cooldown only
+# throttles one user's presses of one action; presses from another guild, or
+# after the window, still stacked identical jobs in the request queue, each
+# one a VRChat call whose answer the first job was already going to deliver.
+#
+# Keyed by everything that makes the answer different: the user, the guild it
+# is for, the code being checked and whether the nickname is wanted. While a
+# key is here an identical publish is dropped; handle_verification_result
+# clears it when the answer arrives. Entries also expire, so an answer that
+# never comes -- the checker dropped it, the bot restarted -- cannot block the
+# user for longer than INFLIGHT_REQUEST_TTL_SECONDS.
+INFLIGHT_REQUEST_TTL_SECONDS = _int_env("INFLIGHT_REQUEST_TTL_SECONDS", 120)
+
+_inflight_requests: dict[tuple, float] = {}
+
+
+def inflight_request_key(discord_id, guild_id, code, update_nickname=False) -> tuple:
+    return (
+        str(discord_id),
+        str(guild_id),
+        code if isinstance(code, str) else None,
+        bool(update_nickname),
+    )
+
+
+def claim_inflight_request(key: tuple) -> bool:
+    """Mark `key` outstanding. False if an identical request already is."""
+    now = time.monotonic()
+    expires_at = _inflight_requests.get(key)
+    if expires_at is not None and now < expires_at:
+        return False
+    _inflight_requests[key] = now + INFLIGHT_REQUEST_TTL_SECONDS
+    # Opportunistic cleanup, as with the cooldown map.
+    if len(_inflight_requests) > 10_000:
+        for stale, expiry in list(_inflight_requests.items()):
+            if expiry <= now:
+                _inflight_requests.pop(stale, None)
+    return True
+
+
+def release_inflight_request(key: tuple) -> None:
+    _inflight_requests.pop(key, None)
+    request_scheduler.release(key)
+
+
+# Requests the checker may have outstanding at once, published and not yet
+# answered. Everything beyond it waits here, one queue per guild, instead of in
+# RabbitMQ's single FIFO -- where one server's verification drive put every
+# other server's members behind all of its own. The broker's priority still
+# orders what is inside the window; the window is what keeps the FIFO short
+# enough for the order here to be the one that counts. 0 publishes everything
+# at once, as before -- and, since nothing is then held here, it also turns
+# off the admission limits below, which measure only what is held.
+#
+# Held requests are in memory, so a restart drops them. The member's
+# duplicate-request marker goes with them, so pressing again works at once;
+# the pending code is in the database and untouched.
+REQUEST_PUBLISH_WINDOW = _int_env("REQUEST_PUBLISH_WINDOW", 20, minimum=0)
+# Turns a premium guild gets per round, against one for everybody else. On top
+# of the broker priority, which only reorders what has already been published.
+PREMIUM_REQUEST_WEIGHT = _int_env("PREMIUM_REQUEST_WEIGHT", 4)
+
+# A member whose request has to wait is told roughly how long. The estimate is
+# the requests ahead -- held here plus those in the window -- over the rate the
+# checker has answered them in the last QUEUE_ETA_WINDOW_SECONDS. Waits under
+# QUEUE_ETA_MIN_SECONDS are not worth a line; 0 shows every estimate.
+#
+# Only requests that are held get one. While the window has room the checker
+# is keeping up, and the answer rate then measures how often members press,
+# not how fast the checker can go.
+QUEUE_ETA_WINDOW_SECONDS = _int_env("QUEUE_ETA_WINDOW_SECONDS", 300)
+QUEUE_ETA_MIN_SECONDS = _int_env("QUEUE_ETA_MIN_SECONDS", 60, minimum=0)
+# Fewer answers than this in the window is too little to measure a rate from.
+QUEUE_ETA_MIN_ANSWERS = 5
+
+# Admission control. Past either limit the backlog is already longer than a
+# member will wait, and every request added to it is one more the checker
+# works through after its member has given up -- so new presses from free
+# guilds are turned away up front with a "busy, try later" instead. Paying
+# guilds are still admitted; they take their turns ahead of the backlog anyway.
+# With the tier off there is nobody to exempt, so every press is turned away.
+# The depth is requests held here; the age is how long the oldest of them has
+# waited. 0 turns either limit off.
+#
+# Both read the bot's own queue, not RabbitMQ's, which is what keeps the check
+# free on every press. With REQUEST_PUBLISH_WINDOW=0 that queue is always
+# empty -- the backlog is in the broker -- so the limits can never trip.
+REQUEST_QUEUE_MAX_DEPTH = _int_env("REQUEST_QUEUE_MAX_DEPTH", 200, minimum=0)
+REQUEST_QUEUE_MAX_AGE_SECONDS = _int_env("REQUEST_QUEUE_MAX_AGE_SECONDS", 300, minimum=0)
+if not REQUEST_PUBLISH_WINDOW and (REQUEST_QUEUE_MAX_DEPTH or REQUEST_QUEUE_MAX_AGE_SECONDS):
+    logger.warning(
+        "REQUEST_PUBLISH_WINDOW=0 publishes every request at once, so none are "
+        "held for REQUEST_QUEUE_MAX_DEPTH (%s) or REQUEST_QUEUE_MAX_AGE_SECONDS "
+        "(%s) to measure; no press will be turned away. Set a window to bound "
+        "the backlog, or set both limits to 0 to silence this.",
+        REQUEST_QUEUE_MAX_DEPTH,
+        REQUEST_QUEUE_MAX_AGE_SECONDS,
+    )
+
+# How long a request is worth answering. A Verify press is worth nothing
+# after its pending code expires (10 minutes after /vrcverify), and a re-check
+# nobody has heard back on for this long has been pressed again or given up
+# on. A request carries what is left of it: held here it is dropped at its
+# deadline, and once published RabbitMQ discards it unread (the AMQP
+# expiration property), so the checker spends no VRChat call on it.
+REQUEST_TTL_SECONDS = _int_env("REQUEST_TTL_SECONDS", 600)
+
+
+@dataclass
+class HeldRequest:
+    key: tuple
+    guild_id: str
+    body: str
+    properties: pika.BasicProperties
+    weight: int
+    queued_at: float
+    deadline: float = math.inf
+
+
+class RequestScheduler:
+    """Per-guild queues in front of the request queue, drained round robin.
+
+    The guild at the front of the rotation publishes up to its weight in
+    requests, then goes to the back -- weighted round robin, so a thousand
+    requests from one guild cost every other guild at most one round each.
+
+    A slot in the window is held from publish until the answer arrives
+    (release_inflight_request) or INFLIGHT_REQUEST_TTL_SECONDS passes, so an
+    answer the checker never sends cannot shrink the window for ever.
+
+    Only touched from the event loop, so there is no lock.
+    """
+
+    def __init__(self, window: int, clock=time.monotonic):
+        self.window = window
+        self.clock = clock
+        self._queues: "OrderedDict[str, deque]" = OrderedDict()
+        self._credits: dict[str, int] = {}
+        self._held_keys: set = set()
+        self._outstanding: dict[tuple, float] = {}
+        self._wakeup: asyncio.Event | None = None
+        self.waits = DurationMonitor()
+        self._guild_waits: dict[str, list] = {}
+        self._answers: deque = deque()
+
+    def held(self) -> int:
+        return len(self._held_keys)
+
+    def guilds_waiting(self) -> int:
+        return len(self._queues)
+
+    def outstanding(self) -> int:
+        now = self.clock()
+        for key, expires_at in list(self._outstanding.items()):
+            if expires_at <= now:
+                del self._outstanding[key]
+        return len(self._outstanding)
+
+    def has_room(self) -> bool:
+        return self.window <= 0 or self.outstanding() < self.window
+
+    def oldest_wait(self) -> float:
+        """Seconds the longest-held request has waited, 0 if none is held."""
+        if not self._queues:
+            return 0.0
+        # Each guild's queue is in arrival order, so its head is its oldest.
+        oldest = min(requests[0].queued_at for requests in self._queues.values())
+        return max(0.0, self.clock() - oldest)
+
+    def hold(self, request: HeldRequest) -> bool:
+        """Queue a request behind its guild. False if the same one already is."""
+        if request.key in self._held_keys:
+            return False
+        self._held_keys.add(request.key)
+        self._queues.setdefault(request.guild_id, deque()).append(request)
+        self.wake()
+        return True
+
+    def take(self) -> HeldRequest | None:
+        """The next request in weighted round-robin order."""
+        for guild_id, requests in self._queues.items():
+            request = requests.popleft()
+            credits = self._credits.get(guild_id, request.weight) - 1
+            if not requests:
+                del self._queues[guild_id]
+                self._credits.pop(guild_id, None)
+            elif credits <= 0:
+                self._queues.move_to_end(guild_id)
+                self._credits[guild_id] = requests[0].weight
+            else:
+                self._credits[guild_id] = credits
+            self._held_keys.discard(request.key)
+            return request
+        return None
+
+    def find(self, discord_id, guild_id) -> HeldRequest | None:
+        """The member's latest request still held for this guild, if any."""
+        for request in reversed(self._queues.get(str(guild_id), ())):
+            if request.key[0] == str(discord_id):
+                return request
+        return None
+
+    def withdraw(self, request: HeldRequest) -> None:
+        """Take a held request back out before it is published."""
+        requests = self._queues.get(request.guild_id)
+        if not requests or request not in requests:
+            return
+        requests.remove(request)
+        self._held_keys.discard(request.key)
+        if not requests:
+            del self._queues[request.guild_id]
+            self._credits.pop(request.guild_id, None)
+
+    def occupy(self, key: tuple, expires_in: float = math.inf) -> None:
+        """Hold a slot for `key` until it is answered or cannot be any more.
+
+        A request RabbitMQ discards at its expiration is never answered, so
+        its slot goes back then rather than after the full in-flight TTL.
+        """
+        if self.window > 0:
+            self._outstanding[key] = self.clock() + min(
+                INFLIGHT_REQUEST_TTL_SECONDS, expires_in
+            )
+
+    def release(self, key: tuple) -> None:
+        if self._outstanding.pop(key, None) is not None:
+            self._answers.append(self.clock())
+            self.wake()
+
+    def service_rate(self) -> float | None:
+        """Answers per second over the last QUEUE_ETA_WINDOW_SECONDS.
+
+        None until there are enough answers to say. Measured up to now, not
+        to the last answer, so a checker that has stopped answering shows a
+        falling rate rather than the one it had before it stopped.
+        """
+        now = self.clock()
+        while self._answers and self._answers[0] <= now - QUEUE_ETA_WINDOW_SECONDS:
+            self._answers.popleft()
+        if len(self._answers) < QUEUE_ETA_MIN_ANSWERS:
+            return None
+        return len(self._answers) / max(now - self._answers[0], 1.0)
+
+    def estimate_wait(self) -> tuple[int, float] | None:
+        """(position, seconds) for a request held just now, or None.
+
+        The position counts every request ahead, whatever its guild. Guilds
+        take turns, so a member of a quiet guild is usually served sooner
+        than this; the estimate errs long, which is the side to err on when
+        the point is to stop people pressing again.
+        """
+        if not self.held():
+            return None
+        rate = self.service_rate()
+        if rate is None:
+            return None
+        position = self.held() + self.outstanding()
+        return position, position / rate
+
+    def record_wait(self, guild_id: str, waited: float) -> None:
+        self.waits.observe(waited)
+        stats = self._guild_waits.setdefault(guild_id, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += waited
+        stats[2] = max(stats[2], waited)
+
+    def take_guild_waits(self, top: int = 3) -> str:
+        """The guilds that waited longest since the last call, worst first.
+
+        "guild=avg/max ms" for each, which is what shows a starved guild: its
+        worst wait climbing while everyone else's stays flat.
+        """
+        period, self._guild_waits = self._guild_waits, {}
+        worst = sorted(period.items(), key=lambda item: item[1][2], reverse=True)[:top]
+        return ",".join(
+            f"{guild_id}={total / count * 1000:.0f}/{peak * 1000:.0f}"
+            for guild_id, (count, total, peak) in worst
+        ) or "-"
+
+    def wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def clear(self) -> None:
+        self._queues.clear()
+        self._credits.clear()
+        self._held_keys.clear()
+        self._outstanding.clear()
+        self._guild_waits.clear()
+        self._answers.clear()
+
+    async def wait_for_work(self, timeout: float) -> None:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+
+request_scheduler = RequestScheduler(REQUEST_PUBLISH_WINDOW)
+runtime_stats.gauge("request_queue_held", request_scheduler.held)
+runtime_stats.gauge("request_queue_guilds", request_scheduler.guilds_waiting)
+runtime_stats.gauge("request_window_outstanding", request_scheduler.outstanding)
+register_duration_stats("request_wait", request_scheduler.waits)
+runtime_stats.gauge("request_wait_worst_guilds", request_scheduler.take_guild_waits)
+runtime_stats.gauge(
+    "request_queue_oldest_s", lambda: round(request_scheduler.oldest_wait(), 1)
+)
+runtime_stats.gauge(
+    "checker_answers_per_min",
+    lambda: round((request_scheduler.service_rate() or 0.0) * 60, 1),
+)
+
+
+# Members told how long their request will take, until the answer arrives or
+# the estimate runs out: (discord_id, guild_id) -> monotonic deadline. Pressing
+# again in the meantime gets the estimate back instead of another request.
+_queue_estimates: dict[tuple[str, str], float] = {}
+
+
+def queue_estimate_remaining(discord_id, guild_id) -> int:
+    """Seconds left on the member's outstanding estimate, or 0 if none."""
+    key = (str(discord_id), str(guild_id))
+    deadline = _queue_estimates.get(key)
+    if deadline is None:
+        return 0
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        del _queue_estimates[key]
+        return 0
+    return int(remaining) + 1
+
+
+def clear_queue_estimate(discord_id, guild_id) -> None:
+    _queue_estimates.pop((str(discord_id), str(guild_id)), None)
+
+
+def _wait_minutes(seconds: float) -> int:
+    return max(1, math.ceil(seconds / 60))
+
+
+def queued_reply(message_key: str, interaction: discord.Interaction, discord_id, guild_id) -> str:
+    """The receipt for a published request, with a wait estimate when it is
+    held long enough to be worth one. Giving an estimate starts it.
+
+    A request the estimate says will be reached only after its deadline is
+    taken back out and the press answered "busy" instead: it would be dropped
+    unanswered, and the member told to wait for a DM that never comes.
+    """
+    reply = get_message(message_key, interaction)
+    held = request_scheduler.find(discord_id, guild_id)
+    estimate = request_scheduler.estimate_wait()
+    if held is None or estimate is None:
+        return reply
+    position, seconds = estimate
+    now = time.monotonic()
+    if now + seconds > held.deadline:
+        request_scheduler.withdraw(held)
+        release_inflight_request(held.key)
+        runtime_stats.incr("checker_requests_shed")
+        return get_message("queue_busy", interaction)
+    if seconds < QUEUE_ETA_MIN_SECONDS:
+        return reply
+    # Never past the request's own deadline, where it is dropped unanswered.
+    _queue_estimates[(str(discord_id), str(guild_id))] = min(now + seconds, held.deadline)
+    # Opportunistic cleanup, as with the cooldown map.
+    if len(_queue_estimates) > 10_000:
+        for stale, deadline in list(_queue_estimates.items()):
+            if deadline <= now:
+                _queue_estimates.pop(stale, None)
+    runtime_stats.incr("queue_estimates_given")
+    return reply + "\n\n" + get_message(
+        "queue_estimate", interaction, position=position, minutes=_wait_minutes(seconds)
+    )
+
+
+def request_queue_saturated() -> bool:
+    """Whether the backlog is past REQUEST_QUEUE_MAX_DEPTH or _MAX_AGE_SECONDS."""
+    if REQUEST_QUEUE_MAX_DEPTH and request_scheduler.held() >= REQUEST_QUEUE_MAX_DEPTH:
+        return True
+    return bool(
+        REQUEST_QUEUE_MAX_AGE_SECONDS
+        and request_scheduler.oldest_wait() >= REQUEST_QUEUE_MAX_AGE_SECONDS
+    )
+
+
+async def refuse_when_saturated(interaction: discord.Interaction, flags: PremiumFlags) -> bool:
+    """Turn a free guild's press away while the backlog is saturated. True if it was.
+
+    Asks whether the guild pays, not flags.allows(): with the tier off every
+    guild is allowed everything, and the backlog would never be bounded.
+    """
+    if (PREMIUM_ENFORCED and flags.premium) or not request_queue_saturated():
+        return False
+    runtime_stats.incr("checker_requests_shed")
+    await interaction.response.send_message(
+        get_message("queue_busy", interaction), ephemeral=True
+    )
+    return True
+
+
+async def refuse_while_queued(interaction: discord.Interaction, discord_id, guild_id) -> bool:
+    """Answer a press made while an estimate is outstanding. True if it was."""
+    remaining = queue_estimate_remaining(discord_id, guild_id)
+    if not remaining:
+        return False
+    runtime_stats.incr("queue_presses_refused")
+    await interaction.response.send_message(
+        get_message("queue_estimate_pending", interaction, minutes=_wait_minutes(remaining)),
+        ephemeral=True,
+    )
+    return True
+
+
+def _drop_expired_request(key: tuple) -> None:
+    """Forget a request that reached its deadline unpublished.
+
+    Nothing would come of it, so an identical press must get through, and the
+    member must not be told to keep waiting for it.
+    """
+    runtime_stats.incr("checker_requests_expired_held")
+    release_inflight_request(key)
+    clear_queue_estimate(key[0], key[1])
+
+
+async def drain_request_queue() -> int:
+    """Publish held requests while the window has room. Returns how many."""
+    published = 0
+    while request_scheduler.has_room():
+        request = request_scheduler.take()
+        if request is None:
+            break
+        if time.monotonic() >= request.deadline:
+            _drop_expired_request(request.key)
+            continue
+        # The hold may have outlasted the duplicate-request marker; renew it
+        # so the answer is still the one an identical press waits for.
+        _inflight_requests[request.key] = time.monotonic() + INFLIGHT_REQUEST_TTL_SECONDS
+        request_scheduler.record_wait(request.guild_id, time.monotonic() - request.queued_at)
+        if await _publish_request(
+            request.key, request.body, request.properties, request.deadline
+        ):
+            published += 1
+    return published
+
+
+async def request_scheduler_task():
+    """Feed held requests to the checker as answers free the window."""
+    while True:
+        # The timeout covers slots freed by expiry rather than by an answer.
+        await request_scheduler.wait_for_work(timeout=1.0)
+        try:
+            await drain_request_queue()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Could not publish held verification requests")
+
+
 async def publish_to_vrc_checker(
     discord_id: str,
     vrc_user_id: str,
@@ -5471,70 +7391,119 @@ async def publish_to_vrc_checker(
     code: str | None,
     update_nickname: bool = False,
     priority: int = DEFAULT_REQUEST_PRIORITY,
-):
-    def _publish():
-        message = {
-            "discordID": discord_id,
-            "vrcUserID": vrc_user_id,
-            "guildID":   guild_id,
-            "verificationCode": code
-        }
-        if update_nickname:
-            message["updateNickname"] = True
+    expires_at: datetime | None = None,
+) -> bool:
+    """Queue a lookup for the checker. False if an identical one is still out.
+
+    A coalesced request is not an error for the caller: the answer the user
+    is waiting for is already on its way.
 
-        properties = pika.BasicProperties(
-            content_type="application/json",
-            delivery_mode=2,  # persistent
-            priority=priority,
+    `expires_at` is when the answer stops being useful -- the pending code's
+    expiry, for a Verify press. The request lives REQUEST_TTL_SECONDS at most.
+    """
+    inflight_key = inflight_request_key(discord_id, guild_id, code, update_nickname)
+    if not claim_inflight_request(inflight_key):
+        runtime_stats.incr("checker_requests_coalesced")
+        logger.info(
+            "Identical request for discord_id=%s guild_id=%s still outstanding; not queueing another",
+            discord_id,
+            guild_id,
         )
+        return False
+
+    enqueued_at = datetime.now(timezone.utc)
+    ttl = float(REQUEST_TTL_SECONDS)
+    if expires_at is not None:
+        ttl = min(ttl, (_utc(expires_at) - enqueued_at).total_seconds())
+    deadline = time.monotonic() + ttl
+
+    message = {
+        "discordID": discord_id,
+        "vrcUserID": vrc_user_id,
+        "guildID":   guild_id,
+        "verificationCode": code,
+        # The AMQP expiration does not survive a trip through the checker's
+        # retry queues, which clear it so it cannot race their delay; the
+        # stamp does, and the checker drops a request past it before making
+        # any VRChat call.
+        "enqueuedAt": enqueued_at.isoformat(),
+        "expiresAt": (enqueued_at + timedelta(seconds=ttl)).isoformat(),
+    }
+    if update_nickname:
+        message["updateNickname"] = True
+
+    properties = pika.BasicProperties(
+        content_type="application/json",
+        delivery_mode=2,  # persistent
+        priority=priority,
+    )
+    body = json.dumps(message)
+
+    # Straight out when the window has room and nobody is waiting ahead;
+    # otherwise behind this guild's earlier requests.
+    if request_scheduler.has_room() and not request_scheduler.held():
+        request_scheduler.record_wait(str(guild_id), 0.0)
+        return await _publish_request(inflight_key, body, properties, deadline)
+    weight = PREMIUM_REQUEST_WEIGHT if priority > DEFAULT_REQUEST_PRIORITY else 1
+    if not request_scheduler.hold(
+        HeldRequest(
+            inflight_key, str(guild_id), body, properties, weight, time.monotonic(), deadline
+        )
+    ):
+        runtime_stats.incr("checker_requests_coalesced")
+        return False
+    runtime_stats.incr("checker_requests_held")
+    return True
 
-        max_publish_tries = int(os.getenv("RABBITMQ_PUBLISH_TRIES", "3"))
-        last_exc: Exception | None = None
-        for attempt in range(1, max_publish_tries + 1):
-            conn = None
-            try:
-                conn = _rabbitmq_connect_with_retry(max_tries=1)
-                channel = conn.channel()
-                channel.queue_declare(
-                    queue=RABBITMQ_REQUEST_QUEUE,
-                    durable=True,
-                    arguments=request_queue_arguments(),
-                )
-                channel.basic_publish(
-                    exchange="",
-                    routing_key=RABBITMQ_REQUEST_QUEUE,
-                    body=json.dumps(message),
-                    properties=properties,
-                )
-                logger.info("📤 Sent to vrc_online_checker: %s", message)
-                return
-            except AMQPError as e:
-                # Retrying this one is pointless: the queue's arguments will not
-                # change on their own, so every attempt fails identically and
-                # the real cause never reaches the log.
-                if is_queue_argument_mismatch(e):
-                    log_queue_argument_mismatch(RABBITMQ_REQUEST_QUEUE)
-                    return
-                last_exc = e
-                logger.warning(
-                    "RabbitMQ publish failed (attempt %s/%s); retrying...",
-                    attempt,
-                    max_publish_tries,
-                    exc_info=True,
-                )
-                import time
 
-                time.sleep(min(10.0, 1.5 * attempt))
-            finally:
-                try:
-                    if conn and conn.is_open:
-                        conn.close()
-                except Exception:
-                    pass
-        logger.error("RabbitMQ publish failed after retries; dropping request", exc_info=last_exc)
+async def _publish_request(
+    inflight_key: tuple, body: str, properties, deadline: float = math.inf
+) -> bool:
+    """Publish one request, retrying transient failures. Takes a window slot.
 
-    loop = asyncio.get_running_loop()
-    await loop.run_in_executor(None, _publish)
+    The message expires in RabbitMQ at `deadline`; one already past it is
+    not published at all.
+    """
+    max_publish_tries = int(os.getenv("RABBITMQ_PUBLISH_TRIES", "3"))
+    last_exc: Exception | None = None
+    for attempt in range(1, max_publish_tries + 1):
+        expires_in = deadline - time.monotonic()
+        if expires_in <= 0:
+            _drop_expired_request(inflight_key)
+            return False
+        if expires_in != math.inf:
+            properties.expiration = str(max(1, int(expires_in * 1000)))
+        try:
+            await async_rabbit_publisher.publish(
+                RABBITMQ_REQUEST_QUEUE,
+                body,
+                properties,
+                arguments=request_queue_arguments(),
+            )
+            logger.info("📤 Sent to vrc_online_checker: %s", body)
+            runtime_stats.incr("checker_requests_published")
+            request_scheduler.occupy(inflight_key, expires_in)
+            return True
+        except (AMQPError, OSError) as e:
+            # Retrying this one is pointless: the queue's arguments will not
+            # change on their own, so every attempt fails identically and
+            # the real cause never reaches the log.
+            if is_queue_argument_mismatch(e):
+                log_queue_argument_mismatch(RABBITMQ_REQUEST_QUEUE)
+                release_inflight_request(inflight_key)
+                return False
+            last_exc = e
+            logger.warning(
+                "RabbitMQ publish failed (attempt %s/%s); retrying...",
+                attempt,
+                max_publish_tries,
+                exc_info=True,
+            )
+            await asyncio.sleep(publish_retry_delay(attempt))
+    logger.error("RabbitMQ publish failed after retries; dropping request", exc_info=last_exc)
+    # Nothing is outstanding, so a retry press must be allowed through.
+    release_inflight_request(inflight_key)
+    return False
 
 
 # -------------------------------------------------------------------
@@ -6128,6 +8097,114 @@ async def expire_group_invite_if_unanswered(guild_id, discord_id, job_id) -> Non
         )
 
 
+@dataclass
+class MemberEditOutcome:
+    """What apply_verified_member_state managed. None means "not asked for"."""
+
+    member: object
+    role_added: bool = False
+    unverified_removed: Optional[bool] = None
+    nick_set: Optional[bool] = None
+    rest_calls: int = 0
+
+
+runtime_stats.gauge(
+    "role_rest_calls_per_verification",
+    lambda: round(
+        runtime_stats.get("role_rest_calls") / max(1, runtime_stats.get("role_verifications")), 2
+    ),
+)
+
+
+async def apply_verified_member_state(guild, member, role, unverified_role, nick) -> MemberEditOutcome:
+    """Give `member` the verified role, drop the unverified one, set the nick.
+
+    The role add goes through its own endpoint -- add_roles is a single PUT
+    that touches nothing else -- and so does a nickname, with member.edit(nick=)
+    leaving the roles alone. Only when the unverified role has to go as well
+    is it one member PATCH carrying the whole role list, and the nickname with
+    it: the roles are rewritten anyway, the member never holds both roles or
+    neither, and with a nickname it is a call fewer. That PATCH replaces the
+    member's roles outright, so it is built from a freshly fetched member: a
+    list taken from the cached copy, up to REST_TTL_SECONDS old, would
+    silently undo any role another bot or an admin changed since. For a role
+    and a nickname alone the fetch would cost the call the PATCH saves, and
+    put the role list at risk for nothing.
+
+    If the PATCH is refused, each change is retried on its own. That costs
+    the old number of calls, but only on failure, and it is the only way to
+    know which part failed -- and so which DM the member gets.
+    """
+    outcome = MemberEditOutcome(member=member)
+    drop_unverified = unverified_role is not None and unverified_role in member.roles
+    if drop_unverified:
+        outcome.rest_calls += 1
+        fresh = await fetch_member_cached(guild, member.id, fresh=True)
+        if fresh is not None:
+            outcome.member = member = fresh
+            drop_unverified = unverified_role is not None and unverified_role in member.roles
+    if drop_unverified:
+        roles = [
+            r for r in member.roles
+            if r != unverified_role and not getattr(r, "is_default", lambda: False)()
+        ]
+        if role not in roles:
+            roles.append(role)
+        changes = {"roles": roles}
+        if nick:
+            changes["nick"] = nick
+        outcome.rest_calls += 1
+        try:
+            await member.edit(**changes)
+        except discord.HTTPException:
+            logger.info(
+                "Combined role/nickname edit for %s failed; applying each change "
+                "separately to find which.",
+                member,
+                exc_info=True,
+            )
+        else:
+            outcome.role_added = True
+            outcome.unverified_removed = True if drop_unverified else None
+            outcome.nick_set = True if nick else None
+            _count_role_calls(outcome)
+            return outcome
+
+    outcome.rest_calls += 1
+    try:
+        await member.add_roles(role)
+        outcome.role_added = True
+    except discord.Forbidden:
+        outcome.role_added = False
+
+    if drop_unverified:
+        outcome.rest_calls += 1
+        try:
+            await member.remove_roles(unverified_role)
+            outcome.unverified_removed = True
+        except discord.Forbidden:
+            outcome.unverified_removed = False
+
+    if nick:
+        outcome.rest_calls += 1
+        try:
+            await member.edit(nick=nick)
+            outcome.nick_set = True
+        # Forbidden subclasses HTTPException; catching the parent also covers
+        # a 400 from an unacceptable nickname. Letting that escape would skip
+        # the milestone bookkeeping that runs after assign_role returns.
+        except discord.HTTPException:
+            logger.warning(f"Could not set nickname for {member}.", exc_info=True)
+            outcome.nick_set = False
+    _count_role_calls(outcome)
+    return outcome
+
+
+def _count_role_calls(outcome: MemberEditOutcome) -> None:
+    runtime_stats.incr("role_verifications")
+    runtime_stats.incr("role_rest_calls", outcome.rest_calls)
+
+
 async def assign_role(
     discord_id: str,
     is_18_plus: bool,
@@ -6139,26 +8216,16 @@ async def assign_role(
     Assigns or skips the 18+ role in one guild.
     Automatically updates the nickname if the server setting is on.
     """
-    # Load server settings
-    with session_scope() as session:
-        server = session.query(Server).filter_by(server_id=guild_id).first()
-        role_id = server.role_id if server else None
-        # Optional unverified role to remove on success
-        unverified_role_id = getattr(server, "unverified_role_id", None) if server else None
-        auto_nick = server.auto_nickname_change if server else False
-        instr_locale = (server.instructions_locale if server and server.instructions_locale else None)
-        custom_success_msg = (
-            server.custom_verification_requested_message if server and server.custom_verification_requested_message else None
-        )
-        # Read in the session we already have open. Most guilds have no log
-        # channel, and finding that out here means they never reach the
-        # entitlement check below.
-        log_row = (
-            session.query(VerificationLogChannel)
-            .filter_by(server_id=panel_view_key(guild_id))
-            .first()
-        )
-        log_channel_id = log_row.channel_id if log_row else None
+    config = await guild_config(guild_id)
+    role_id = config.role_id
+    # Optional unverified role to remove on success
+    unverified_role_id = config.unverified_role_id
+    auto_nick = config.auto_nickname_change
+    instr_locale = config.instructions_locale
+    custom_success_msg = config.custom_verification_requested_message
+    # Most guilds have no log channel, and finding that out here means they
+    # never reach the entitlement check below.
+    log_channel_id = config.log_channel_id
 
     guild = bot.get_guild(int(guild_id))
     if not guild:
@@ -6202,9 +8269,18 @@ async def assign_role(
         # Reuses the flags already resolved above rather than asking again.
         loggable = log_channel_id if premium.allows(FEATURE_ACTIVITY_LOG) else None
 
-        # 1) Add verified role first
-        try:
-            await member.add_roles(role)
+        unverified_role = None
+        if unverified_role_id:
+            unverified_role = discord.utils.get(guild.roles, id=int(unverified_role_id))
+        safe_nick = discord_safe_nickname(display_name) if auto_nick else None
+
+        outcome = await apply_verified_member_state(
+            guild, member, role, unverified_role, safe_nick or None
+        )
+        member = outcome.member
+
+        # 1) Verified role
+        if outcome.role_added:
             logger.info(f"Assigned role {role.name} to {member}.")
             queue_verification_log(
                 guild_id, discord_id, LOG_OUTCOME_VERIFIED, loggable, instr_locale
@@ -6216,7 +8292,7 @@ async def assign_role(
                     logger.warning(f"⚠️ Cannot DM user {member.id} custom success message.")
             else:
                 await dm_localized(member, guild, "dm_role_success", instr_locale, role=role.name, server=guild.name)
-        except discord.Forbidden:
+        else:
             logger.warning(f"Missing permission to add {role.name} in {guild_id}.")
             # The failure mode an admin would otherwise never learn about: the
             # member is told privately, and the server sees nothing at all.
@@ -6225,35 +8301,32 @@ async def assign_role(
             )
             await dm_role_assignment_failure(member, role, guild, instr_locale)
 
-        # 2) Remove unverified role (if configured)
-        unverified_role = None
-        if unverified_role_id:
-            unverified_role = discord.utils.get(guild.roles, id=int(unverified_role_id))
-            if unverified_role and unverified_role in member.roles:
-                try:
-                    await member.remove_roles(unverified_role)
-                    logger.info(f"Removed unverified role {unverified_role.name} from {member}.")
-                except discord.Forbidden:
-                    logger.warning(f"Missing permission to remove {unverified_role.name} in {guild_id}.")
-                    await dm_localized(
-                        member,
-                        guild,
-                        "dm_unverified_failed_bot_position",
-                        instr_locale,
-                        role=unverified_role.name,
-                        server=guild.name
-                    )
-
+        # 2) Unverified role (if configured and held)
+        if outcome.unverified_removed is True:
+            logger.info(f"Removed unverified role {unverified_role.name} from {member}.")
+        elif outcome.unverified_removed is False:
+            logger.warning(f"Missing permission to remove {unverified_role.name} in {guild_id}.")
+            await dm_localized(
+                member,
+                guild,
+                "dm_unverified_failed_bot_position",
+                instr_locale,
+                role=unverified_role.name,
+                server=guild.name
+            )
 
+        if unverified_role is not None:
             # 3) Delayed re-check after 1s to catch race conditions with other bots
             async def _delayed_cleanup():
                 try:
                     await asyncio.sleep(1)
+                    runtime_stats.incr("role_rest_calls")
                     try:
                         fresh_member = await guild.fetch_member(int(discord_id))
                     except Exception:
                         fresh_member = None
-                    if fresh_member and unverified_role and unverified_role in fresh_member.roles:
+                    if fresh_member and unverified_role in fresh_member.roles:
+                        runtime_stats.incr("role_rest_calls")
                         try:
                             await fresh_member.remove_roles(unverified_role)
                             logger.info(f"(retry) Removed unverified role {unverified_role.name} from {fresh_member}.")
@@ -6262,22 +8335,14 @@ async def assign_role(
                 except Exception:
                     logger.warning("Delayed unverified role cleanup failed.", exc_info=True)
 
-            if unverified_role is not None:
-                asyncio.create_task(_delayed_cleanup())
+            asyncio.create_task(_delayed_cleanup())
 
-        # Auto-nickname change if enabled
-        safe_nick = discord_safe_nickname(display_name)
-        if auto_nick and safe_nick:
-            try:
-                await member.edit(nick=safe_nick)
-                logger.info(f"🔄 Updated nickname to {safe_nick} for {member}.")
-                await dm_localized(member, guild, "nickname_updated", instr_locale, display_name=safe_nick)
-            # Forbidden subclasses HTTPException; catching the parent also covers
-            # a 400 from an unacceptable nickname. Letting that escape would skip
-            # the milestone bookkeeping that runs after assign_role returns.
-            except discord.HTTPException:
-                logger.warning(f"Could not set nickname for {member}.", exc_info=True)
-                await dm_localized(member, guild, "nickname_update_failed", instr_locale)
+        # 4) Nickname, if the server syncs them
+        if outcome.nick_set is True:
+            logger.info(f"🔄 Updated nickname to {safe_nick} for {member}.")
+            await dm_localized(member, guild, "nickname_updated", instr_locale, display_name=safe_nick)
+        elif outcome.nick_set is False:
+            await dm_localized(member, guild, "nickname_update_failed", instr_locale)
 
         # Last, and in its own DM. Every path that verifies somebody arrives
         # here -- a fresh verification, a re-check, pressing Begin Verification
@@ -6320,6 +8385,40 @@ async def assign_role(
 # -------------------------------------------------------------------
 # Modal: Collect VRChat Username
 # -------------------------------------------------------------------
+def start_pending_verification(discord_id: str, guild_id: str, vrc_user_id: str) -> str | None:
+    """Issue a fresh code for this user and guild, replacing any pending one.
+
+    None if the VRChat id is already linked to a *different* Discord account.
+    """
+    with session_scope() as session:
+        existing_user = session.query(User).filter_by(vrc_user_id=vrc_user_id).first()
+        if existing_user and existing_user.discord_id != discord_id:
+            return None
+
+        # If we reach here, either:
+        #  - no one is using this vrc_user_id, or
+        #  - it's the same Discord user (which shouldn't happen for this modal path, but is safe)
+
+        verification_code = generate_verification_code()
+        expires_at = datetime.now(timezone.utc) + timedelta(minutes=10)
+
+        # Remove any old pending entry for this user/guild
+        session.query(PendingVerification).filter_by(
+            discord_id=discord_id,
+            guild_id=guild_id
+        ).delete()
+
+        pending = PendingVerification(
+            discord_id=discord_id,
+            guild_id=guild_id,
+            vrc_user_id=vrc_user_id,
+            verification_code=verification_code,
+            expires_at=expires_at
+        )
+        session.add(pending)
+        return verification_code
+
+
 class VRCUsernameModal(discord.ui.Modal, title="Enter Your VRChat Profile URL or UserID"):
     vrc_username = discord.ui.TextInput(
         label="VRChat Profile URL or UserID",
@@ -6342,39 +8441,16 @@ class VRCUsernameModal(discord.ui.Modal, title="Enter Your VRChat Profile URL or
         discord_id = str(interaction.user.id)
         guild_id = str(interaction.guild_id)
 
-        # Check if this VRChat ID is already linked to a *different* Discord account
-        with session_scope() as session:
-            existing_user = session.query(User).filter_by(vrc_user_id=vrc_user_id).first()
-            if existing_user and existing_user.discord_id != discord_id:
-                # This VRChat profile is already registered to another Discord account
-                # (you can localize this later if you want)
-                await interaction.response.send_message(
-                    get_message("vrc_id_already_linked", interaction),
-                    ephemeral=True
-                )
-                return
-
-            # If we reach here, either:
-            #  - no one is using this vrc_user_id, or
-            #  - it's the same Discord user (which shouldn't happen for this modal path, but is safe)
-
-            verification_code = generate_verification_code()
-            expires_at = datetime.now(timezone.utc) + timedelta(minutes=10)
-
-            # Remove any old pending entry for this user/guild
-            session.query(PendingVerification).filter_by(
-                discord_id=discord_id,
-                guild_id=guild_id
-            ).delete()
-
-            pending = PendingVerification(
-                discord_id=discord_id,
-                guild_id=guild_id,
-                vrc_user_id=vrc_user_id,
-                verification_code=verification_code,
-                expires_at=expires_at
+        verification_code = await run_db(
+            start_pending_verification, discord_id, guild_id, vrc_user_id
+        )
+        if verification_code is None:
+            # This VRChat profile is already registered to another Discord account
+            await interaction.response.send_message(
+                get_message("vrc_id_already_linked", interaction),
+                ephemeral=True
             )
-            session.add(pending)
+            return
 
         view = VRCVerificationButton(vrc_user_id, verification_code, guild_id)
         # Use localized instruction strings for the numbered steps
@@ -6393,6 +8469,19 @@ class VRCUsernameModal(discord.ui.Modal, title="Enter Your VRChat Profile URL or
 # -------------------------------------------------------------------
 # Button: triggers code-based check
 # -------------------------------------------------------------------
+def load_pending_code(discord_id: str, guild_id: str):
+    """(vrc_user_id, code, expires_at) of the user's live pending row, or None."""
+    with session_scope() as session:
+        pending = (
+            session.query(PendingVerification)
+            .filter_by(discord_id=discord_id, guild_id=guild_id)
+            .first()
+        )
+        if not pending or datetime.now(timezone.utc) > _utc(pending.expires_at):
+            return None
+        return pending.vrc_user_id, pending.verification_code, _utc(pending.expires_at)
+
+
 class VRCVerificationButton(discord.ui.View):
     def __init__(self, vrc_username: str, verification_code: str, guild_id: str):
         super().__init__(timeout=None)
@@ -6414,7 +8503,12 @@ class VRCVerificationButton(discord.ui.View):
         """
         discord_id = str(interaction.user.id)
 
+        if await refuse_while_queued(interaction, discord_id, self.guild_id):
+            return
+
         flags = resolve_premium_flags_from_interaction(interaction)
+        if await refuse_when_saturated(interaction, flags):
+            return
         # Own scope: a prior re-check/nickname request must never block Verify.
         remaining = check_verification_cooldown(
             discord_id,
@@ -6428,19 +8522,13 @@ class VRCVerificationButton(discord.ui.View):
             )
             return
 
-        with session_scope() as session:
-            pending = (
-                session.query(PendingVerification)
-                .filter_by(discord_id=discord_id, guild_id=self.guild_id)
-                .first()
+        pending = await run_db(load_pending_code, discord_id, self.guild_id)
+        if pending is None:
+            await interaction.response.send_message(
+                get_message("verify_button_expired", interaction), ephemeral=True
             )
-            if not pending or datetime.now(timezone.utc) > pending.expires_at:
-                await interaction.response.send_message(
-                    get_message("verify_button_expired", interaction), ephemeral=True
-                )
-                return
-            vrc_user_id = pending.vrc_user_id
-            verification_code = pending.verification_code
+            return
+        vrc_user_id, verification_code, expires_at = pending
 
         await interaction.response.defer(ephemeral=True)
 
@@ -6450,10 +8538,13 @@ class VRCVerificationButton(discord.ui.View):
             self.guild_id,
             verification_code,
             priority=flags.request_priority(),
+            # A code checked after it expires is refused anyway.
+            expires_at=expires_at,
         )
 
         await interaction.followup.send(
-            get_message("verification_requested", interaction), ephemeral=True
+            queued_reply("verification_requested", interaction, discord_id, self.guild_id),
+            ephemeral=True,
         )
 
 
@@ -6517,6 +8608,7 @@ async def vrcverify_setup(
             action = "updated"
 
         has_panel = bool(server.instructions_message_id)
+    server_config_cache.invalidate(guild_id)
 
     # A configured server with no panel is half-configured — members have no
     # button to click. Start the nudge clock so we can follow up if it stays
@@ -6774,6 +8866,8 @@ async def vrcverify_instructions(interaction: discord.Interaction):
             session.add(server)
         server.instructions_channel_id = channel_id
         server.instructions_message_id = str(message.id)
+    # Only a newly inserted row changes the config, but this is one dict pop.
+    server_config_cache.invalidate(guild_id)
 
     # Posted with the current custom_ids already, so no restart needs to touch it.
     record_panel_view_version(guild_id)
@@ -7002,17 +9096,8 @@ def publish_group_invite_job(job: dict, queue: Optional[str] = None) -> bool:
     )
     max_publish_tries = int(os.getenv("RABBITMQ_PUBLISH_TRIES", "3"))
     for attempt in range(1, max_publish_tries + 1):
-        conn = None
         try:
-            conn = _rabbitmq_connect_with_retry(max_tries=1)
-            channel = conn.channel()
-            channel.queue_declare(queue=queue, durable=True)
-            channel.basic_publish(
-                exchange="",
-                routing_key=queue,
-                body=json.dumps(job),
-                properties=properties,
-            )
+            rabbit_publisher.publish(queue, json.dumps(job), properties)
             logger.info(
                 "Sent %s job %s for guild %s to '%s'",
                 job.get("type"),
@@ -7033,7 +9118,7 @@ def publish_group_invite_job(job: dict, queue: Optional[str] = None) -> bool:
                 max_publish_tries,
                 exc_info=True,
             )
-            time.sleep(min(10.0, 1.5 * attempt))
+            time.sleep(publish_retry_delay(attempt))
         except Exception:
             logger.warning(
                 "Unexpected failure publishing group-setup job (attempt %s/%s)",
@@ -7041,13 +9126,7 @@ def publish_group_invite_job(job: dict, queue: Optional[str] = None) -> bool:
                 max_publish_tries,
                 exc_info=True,
             )
-            time.sleep(min(10.0, 1.5 * attempt))
-        finally:
-            try:
-                if conn and conn.is_open:
-                    conn.close()
-            except Exception:
-                pass
+            time.sleep(publish_retry_delay(attempt))
     logger.error("Group-setup job dropped after %s attempts", max_publish_tries)
     return False
 
@@ -7153,65 +9232,25 @@ async def consume_group_invite_results():
     guess which it was holding is a bug waiting for a payload that looks like
     both.
     """
-    loop = asyncio.get_running_loop()
 
-    def on_message(ch, method, properties, body):
+    def on_message(channel, method, properties, body):
         try:
             data = json.loads(body)
         except Exception:
             logger.exception(
                 "Invalid JSON on the group-invite results queue; dropping"
             )
-            ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+            channel.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
             return
-        asyncio.run_coroutine_threadsafe(handle_group_invite_result(data), loop)
-        ch.basic_ack(delivery_tag=method.delivery_tag)
-
-    def do_blocking_consume():
-        while True:
-            connection = None
-            try:
-                connection = _rabbitmq_connect_with_retry(max_tries=0)
-                channel = connection.channel()
-                channel.queue_declare(
-                    queue=RABBITMQ_GROUP_INVITE_RESULT_QUEUE, durable=True
-                )
-                channel.basic_qos(prefetch_count=10)
-                logger.info(
-                    "Listening for group-invite results on '%s'...",
-                    RABBITMQ_GROUP_INVITE_RESULT_QUEUE,
-                )
-                channel.basic_consume(
-                    queue=RABBITMQ_GROUP_INVITE_RESULT_QUEUE,
-                    on_message_callback=on_message,
-                    auto_ack=False,
-                )
-                channel.start_consuming()
-            except (
-                pika.exceptions.AMQPConnectionError,
-                pika.exceptions.StreamLostError,
-                OSError,
-            ):
-                logger.warning(
-                    "Group-invite results consumer disconnected; reconnecting "
-                    "soon...",
-                    exc_info=True,
-                )
-                time.sleep(3)
-            except Exception:
-                logger.exception(
-                    "Unexpected error in the group-invite results consumer; "
-                    "restarting"
-                )
-                time.sleep(3)
-            finally:
-                try:
-                    if connection and connection.is_open:
-                        connection.close()
-                except Exception:
-                    pass
-
-    await loop.run_in_executor(None, do_blocking_consume)
+        spawn_result_handler(handle_group_invite_result(data))
+        channel.basic_ack(delivery_tag=method.delivery_tag)
+
+    await consume_rabbitmq_queue(
+        RABBITMQ_GROUP_INVITE_RESULT_QUEUE,
+        on_message,
+        prefetch_count=10,
+        label="group-invite results",
+    )
 
 
 async def handle_group_invite_result(data: dict):
@@ -7276,9 +9315,9 @@ async def handle_member_invite_result(data: dict):
         await tell_member_about_invite(data.get("guildID"), row, row["state"])
     except Exception:
         # The verdict is already stored and the queue message already acked.
-        # An exception from here would travel into the concurrent.futures
-        # Future that run_coroutine_threadsafe returns and that the consumer
-        # discards -- which logs nothing at all. The member would be left
+        # An exception from here would end the handler's task, which nothing
+        # awaits -- asyncio reports that only when the task is collected, if
+        # at all. The member would be left
         # reading "asking VRChat..." for ever, on a row that is settled and so
         # is never offered again, with no trace anywhere of why.
         logger.exception(
@@ -7408,51 +9447,227 @@ async def tell_member_about_invite(guild_id, row: dict, state: str) -> None:
 # -------------------------------------------------------------------
 # RabbitMQ Consumer - handle verification results
 # -------------------------------------------------------------------
-async def consume_results_queue():
-    loop = asyncio.get_running_loop()
+# Handlers started by the result consumers. asyncio only holds a weak
+# reference to a running task, so without this set a handler could be garbage
+# collected half-way through assigning somebody's role.
+_result_handler_tasks: set = set()
+
+
+def spawn_result_handler(coro) -> asyncio.Task:
+    """Run one result handler on the loop, keeping it alive until it finishes."""
+    task = asyncio.get_running_loop().create_task(coro)
+    _result_handler_tasks.add(task)
+    task.add_done_callback(_result_handler_tasks.discard)
+    return task
+
+
+# Verification results handled at once, and how many the broker may hand the
+# bot ahead of that. Results are acked only when their handler has finished,
+# so the prefetch is the whole backlog the bot holds: after an outage the rest
+# stays in RabbitMQ instead of becoming thousands of handlers racing for the
+# database, the REST semaphore and the DM rate limit. The prefetch is also the
+# window fairness works within -- the broker hands results over in order, so
+# the dispatcher can only interleave guilds among the ones it has been given.
+RESULT_HANDLER_CONCURRENCY = _int_env("RESULT_HANDLER_CONCURRENCY", 8)
+RESULT_PREFETCH = max(RESULT_HANDLER_CONCURRENCY, _int_env("RESULT_PREFETCH", 50))
+# At most this many of one guild's results run at once, so a verification
+# drive shares the handlers with everyone else instead of holding all of them.
+RESULT_PER_GUILD_CONCURRENCY = _int_env("RESULT_PER_GUILD_CONCURRENCY", 2)
+
+
+class FairDispatcher:
+    """Runs submitted jobs a bounded number at a time, round robin by key.
+
+    Each key (a guild) has its own FIFO, and the next free slot goes to the
+    next key in rotation that has work and is under its own cap -- so a key
+    with a thousand jobs queued gets one turn per round, like a key with one.
+
+    `on_done` runs after the job, whether it finished or raised; the result
+    consumer acks there. A job whose `is_live()` has turned false by the time
+    its turn comes is skipped without running or `on_done`: its channel has
+    closed, and the broker will redeliver it to the consumer that replaces it.
+
+    Only touched from the event loop, so there is no lock.
+    """
+
+    def __init__(self, name: str, concurrency: int, per_key: int):
+        self.name = name
+        self.concurrency = max(1, concurrency)
+        self.per_key = max(1, per_key)
+        self._queues: "OrderedDict[object, deque]" = OrderedDict()
+        self._running: dict = {}
+        self.in_flight = 0
+        self.waits = DurationMonitor()
+        self.latency = DurationMonitor()
+
+    def queued(self) -> int:
+        return sum(len(jobs) for jobs in self._queues.values())
+
+    def submit(self, key, job, on_done=None, is_live=lambda: True) -> None:
+        """Queue `job()` (a coroutine function) under `key` and start what fits."""
+        self._queues.setdefault(key, deque()).append(
+            (job, on_done, is_live, time.monotonic())
+        )
+        self._pump()
+
+    def _next(self):
+        for key, jobs in self._queues.items():
+            if self._running.get(key, 0) < self.per_key:
+                item = jobs.popleft()
+                if jobs:
+                    self._queues.move_to_end(key)
+                else:
+                    del self._queues[key]
+                return key, item
+        return None
+
+    def _pump(self) -> None:
+        while self.in_flight < self.concurrency:
+            picked = self._next()
+            if picked is None:
+                return
+            key, (job, on_done, is_live, queued_at) = picked
+            if not is_live():
+                runtime_stats.incr(f"{self.name}_skipped_stale")
+                continue
+            self.waits.observe(time.monotonic() - queued_at)
+            self.in_flight += 1
+            self._running[key] = self._running.get(key, 0) + 1
+            spawn_result_handler(self._run(key, job, on_done))
+
+    async def _run(self, key, job, on_done) -> None:
+        started = time.monotonic()
+        try:
+            await job()
+        except Exception:
+            logger.exception("Unhandled error in a %s job", self.name)
+        finally:
+            self.latency.observe(time.monotonic() - started)
+            runtime_stats.incr(f"{self.name}_handled")
+            self.in_flight -= 1
+            if self._running.get(key, 0) <= 1:
+                self._running.pop(key, None)
+            else:
+                self._running[key] -= 1
+            if on_done is not None:
+                try:
+                    on_done()
+                except Exception:
+                    logger.warning("%s completion callback failed", self.name, exc_info=True)
+            self._pump()
+
+    def register_stats(self) -> None:
+        runtime_stats.gauge(f"{self.name}_queued", self.queued)
+        runtime_stats.gauge(f"{self.name}_in_flight", lambda: self.in_flight)
+        register_duration_stats(f"{self.name}_wait", self.waits)
+        register_duration_stats(f"{self.name}_handler", self.latency)
+
+
+result_dispatcher = FairDispatcher(
+    "results", RESULT_HANDLER_CONCURRENCY, RESULT_PER_GUILD_CONCURRENCY
+)
+result_dispatcher.register_stats()
 
-    def on_message(ch, method, properties, body):
+
+def _ack_when_done(channel, delivery_tag):
+    def ack():
+        # The channel can close while the handler runs. The broker then
+        # redelivers the result, and the handler is safe to repeat: the
+        # pending row it settled is gone, so the copy is logged and dropped.
+        if getattr(channel, "is_open", True):
+            channel.basic_ack(delivery_tag=delivery_tag)
+
+    return ack
+
+
+async def consume_results_queue():
+    def on_message(channel, method, properties, body):
         try:
             data = json.loads(body)
         except Exception:
             logger.exception("Invalid JSON in results queue; dropping message")
-            ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+            channel.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
             return
 
-        asyncio.run_coroutine_threadsafe(handle_verification_result(data), loop)
-        ch.basic_ack(delivery_tag=method.delivery_tag)
+        # Acked after the handler, never before: an unacked result is what
+        # keeps the next one in the broker rather than in this process.
+        # A failed handler is still acked, as it always was -- requeueing a
+        # result that raises would only raise again.
+        guild_key = (data or {}).get("guildID") if isinstance(data, dict) else None
+        result_dispatcher.submit(
+            str(guild_key or ""),
+            functools.partial(handle_verification_result, data),
+            on_done=_ack_when_done(channel, method.delivery_tag),
+            is_live=lambda: getattr(channel, "is_open", True),
+        )
+
+    await consume_rabbitmq_queue(
+        RABBITMQ_RESULT_QUEUE,
+        on_message,
+        prefetch_count=RESULT_PREFETCH,
+        label="verification results",
+    )
 
-    def do_blocking_consume():
-        import time
 
-        while True:
-            connection = None
-            try:
-                connection = _rabbitmq_connect_with_retry(max_tries=0)
-                channel = connection.channel()
-                channel.queue_declare(queue=RABBITMQ_RESULT_QUEUE, durable=True)
-                channel.basic_qos(prefetch_count=10)
-                logger.info("✅ Listening for verification results on '%s'...", RABBITMQ_RESULT_QUEUE)
-                channel.basic_consume(
-                    queue=RABBITMQ_RESULT_QUEUE,
-                    on_message_callback=on_message,
-                    auto_ack=False,
-                )
-                channel.start_consuming()
-            except (pika.exceptions.AMQPConnectionError, pika.exceptions.StreamLostError, OSError):
-                logger.warning("RabbitMQ consumer disconnected; reconnecting soon...", exc_info=True)
-                time.sleep(3)
-            except Exception:
-                logger.exception("Unexpected error in RabbitMQ consumer; restarting consumer loop")
-                time.sleep(3)
-            finally:
-                try:
-                    if connection and connection.is_open:
-                        connection.close()
-                except Exception:
-                    pass
+def record_recheck_result(discord_id, is_18_plus: bool, vrc_user_id) -> bool:
+    """Store a re-check's answer. False if we have no row for the user."""
+    with session_scope() as session:
+        user = session.query(User).filter_by(discord_id=discord_id).first()
+        if not user:
+            return False
+        user.verification_status = is_18_plus
+        # preserve vrc_user_id if provided
+        if vrc_user_id:
+            user.vrc_user_id = vrc_user_id
+        return True
+
 
-    await loop.run_in_executor(None, do_blocking_consume)
+PENDING_MISSING = "missing"
+PENDING_EXPIRED = "expired"
+PENDING_CODE_NOT_FOUND = "code_not_found"
+PENDING_SETTLED = "settled"
+
+
+def settle_pending_verification(
+    discord_id, guild_id, verification_code, code_found: bool, vrc_user_id, is_18_plus: bool
+) -> str:
+    """Apply a code check's answer to the pending row; one of the PENDING_* outcomes."""
+    now_utc = datetime.now(timezone.utc)
+    with session_scope() as session:
+        pending = (
+            session.query(PendingVerification)
+            .filter_by(
+                discord_id=discord_id,
+                guild_id=guild_id,
+                verification_code=verification_code
+            )
+            .first()
+        )
+        if not pending:
+            return PENDING_MISSING
+        if now_utc > pending.expires_at:
+            session.delete(pending)
+            return PENDING_EXPIRED
+        if not code_found:
+            # Don't delete the pending row here: the DM tells the user to
+            # "try again", which means clicking the same Verify button.
+            # That re-sends this same verification_code, so the pending
+            # row needs to still exist for the retry to find a match.
+            # It gets cleaned up by expiry (expired_pending_cleanup_task)
+            # or replaced when they resubmit /vrcverify.
+            return PENDING_CODE_NOT_FOUND
+
+        # Everything checks out — create/update user row
+        user = session.query(User).filter_by(discord_id=discord_id).first()
+        if not user:
+            user = User(discord_id=discord_id)
+            session.add(user)
+            # First successful verification creates the user; set initial last attempt
+            user.last_verification_attempt = datetime.now(timezone.utc)
+        user.vrc_user_id = vrc_user_id
+        user.verification_status = is_18_plus
+        session.delete(pending)
+        return PENDING_SETTLED
 
 
 async def handle_verification_result(data: dict):
@@ -7470,6 +9685,12 @@ async def handle_verification_result(data: dict):
         update_nick       = data.get("updateNickname", False)
         display_name      = data.get("display_name")
         lookup_ok         = data.get("lookup_ok", True)
+        # Answered, however it turns out: the next identical press is a new
+        # question and must reach the checker.
+        release_inflight_request(
+            inflight_request_key(discord_id, guild_id, verification_code, update_nick)
+        )
+        clear_queue_estimate(discord_id, guild_id)
         guild  = bot.get_guild(int(guild_id)) if guild_id else None
         member = await fetch_member_cached(guild, int(discord_id)) if guild and discord_id else None
 
@@ -7519,15 +9740,9 @@ async def handle_verification_result(data: dict):
 
         # — No-code re-check flow —
         if verification_code is None:
-            with session_scope() as session:
-                user = session.query(User).filter_by(discord_id=discord_id).first()
-                if not user:
-                    logger.warning(f"⚠️ No user row for {discord_id} in re-check.")
-                    return
-                user.verification_status = is_18_plus
-                # preserve vrc_user_id if provided
-                if data.get("vrcUserID"):
-                    user.vrc_user_id = data["vrcUserID"]
+            if not await run_db(record_recheck_result, discord_id, is_18_plus, data.get("vrcUserID")):
+                logger.warning(f"⚠️ No user row for {discord_id} in re-check.")
+                return
 
             # Now assign role + maybe nickname
             await assign_role(discord_id, is_18_plus, guild_id, display_name=display_name)
@@ -7536,55 +9751,35 @@ async def handle_verification_result(data: dict):
             return
 
         # — Code-based flow —
-        now_utc = datetime.now(timezone.utc)
-        with session_scope() as session:
-            pending = (
-                session.query(PendingVerification)
-                .filter_by(
-                    discord_id=discord_id,
-                    guild_id=guild_id,
-                    verification_code=verification_code
-                )
-                .first()
-            )
-            if not pending:
-                logger.warning(f"⚠️ No pending verification for {discord_id}/{verification_code}.")
-                return
-            if now_utc > pending.expires_at:
-                session.delete(pending)
-                logger.warning(f"⚠️ Verification code expired for {discord_id}.")
-                return
-            if not data.get("code_found", False):
-                # Don't delete the pending row here: the DM tells the user to
-                # "try again", which means clicking the same Verify button.
-                # That re-sends this same verification_code, so the pending
-                # row needs to still exist for the retry to find a match.
-                # It gets cleaned up by expiry (expired_pending_cleanup_task)
-                # or replaced when they resubmit /vrcverify.
-                guild  = bot.get_guild(int(guild_id))
-                member = await fetch_member_cached(guild, int(discord_id)) if guild else None
-                if member:
-                    try:
-                        await member.send(
-                            get_message(
-                                "code_not_found",
-                                SimpleNamespace(locale=(getattr(guild, "preferred_locale", None) or "en-US"))
-                            )
+        outcome = await run_db(
+            settle_pending_verification,
+            discord_id,
+            guild_id,
+            verification_code,
+            bool(data.get("code_found", False)),
+            data.get("vrcUserID"),
+            is_18_plus,
+        )
+        if outcome == PENDING_MISSING:
+            logger.warning(f"⚠️ No pending verification for {discord_id}/{verification_code}.")
+            return
+        if outcome == PENDING_EXPIRED:
+            logger.warning(f"⚠️ Verification code expired for {discord_id}.")
+            return
+        if outcome == PENDING_CODE_NOT_FOUND:
+            guild  = bot.get_guild(int(guild_id))
+            member = await fetch_member_cached(guild, int(discord_id)) if guild else None
+            if member:
+                try:
+                    await member.send(
+                        get_message(
+                            "code_not_found",
+                            SimpleNamespace(locale=(getattr(guild, "preferred_locale", None) or "en-US"))
                         )
-                    except discord.Forbidden:
-                        logger.warning("⚠️ Cannot DM user about missing code.")
-                return
-
-            # Everything checks out — create/update user row
-            user = session.query(User).filter_by(discord_id=discord_id).first()
-            if not user:
-                user = User(discord_id=discord_id)
-                session.add(user)
-                # First successful verification creates the user; set initial last attempt
-                user.last_verification_attempt = datetime.now(timezone.utc)
-            user.vrc_user_id = data["vrcUserID"]
-            user.verification_status = is_18_plus
-            session.delete(pending)
+                    )
+                except discord.Forbidden:
+                    logger.warning("⚠️ Cannot DM user about missing code.")
+            return
 
         # Assign role + maybe nickname
         await assign_role(discord_id, is_18_plus, guild_id, display_name=display_name)
@@ -7598,18 +9793,22 @@ async def handle_verification_result(data: dict):
 # -------------------------------------------------------------------
 # Background cleanup: remove expired pending verifications
 # -------------------------------------------------------------------
+def delete_expired_pending() -> int:
+    now_utc = datetime.now(timezone.utc)
+    with session_scope() as session:
+        # Use synchronize_session=False for performance as we don't keep these in memory
+        return (
+            session.query(PendingVerification)
+            .filter(PendingVerification.expires_at < now_utc)
+            .delete(synchronize_session=False)
+        )
+
+
 async def expired_pending_cleanup_task(interval_seconds: int = 60):
     """Periodically delete expired rows so they don't linger indefinitely."""
     while True:
         try:
-            now_utc = datetime.now(timezone.utc)
-            with session_scope() as session:
-                # Use synchronize_session=False for performance as we don't keep these in memory
-                deleted = (
-                    session.query(PendingVerification)
-                    .filter(PendingVerification.expires_at < now_utc)
-                    .delete(synchronize_session=False)
-                )
+            deleted = await run_db(delete_expired_pending)
             if deleted:
                 logger.info(f"Removed {deleted} expired pending verification(s)")
         except Exception:
@@ -8614,22 +10813,29 @@ async def dashboard_is_admin(guild_id, user_id) -> bool:
         if cached is not None:
             return bool(cached.allowed)
 
-        # The gateway cache first: it is free, and GUILD_MEMBER_UPDATE keeps it
-        # current. MemberCacheFlags is none() here so it usually misses, which
-        # is why the fetch below is the path that normally answers.
-        member = guild.get_member(member_id)
-        if member is None:
-            async with _rest_semaphore:
-                try:
-                    member = await guild.fetch_member(member_id)
-                except discord.NotFound:
-                    member = None
-
-        allowed = bool(member is not None and member.guild_permissions.administrator)
-        # Only the verdict is cached, not the member. A stale Member object is
-        # a permission answer waiting to be recomputed wrongly somewhere else.
-        _admin_check_cache.set(key, SimpleNamespace(allowed=allowed))
-        return allowed
+        async def decide():
+            # The gateway cache first: it is free, and GUILD_MEMBER_UPDATE keeps
+            # it current. MemberCacheFlags is none() here so it usually misses,
+            # which is why the fetch below is the path that normally answers.
+            member = guild.get_member(member_id)
+            if member is None:
+                async with _rest_semaphore:
+                    runtime_stats.incr("admin_check_rest_calls")
+                    try:
+                        member = await guild.fetch_member(member_id)
+                    except discord.NotFound:
+                        member = None
+
+            allowed = bool(member is not None and member.guild_permissions.administrator)
+            # Only the verdict is cached, not the member. A stale Member object
+            # is a permission answer waiting to be recomputed wrongly somewhere
+            # else.
+            _admin_check_cache.set(key, SimpleNamespace(allowed=allowed))
+            return allowed
+
+        # A dashboard page fans out into several API calls at once; they all
+        # miss together and should share one lookup.
+        return await _single_flight(_admin_checks_inflight, key, decide, "admin_check_coalesced")
     except Exception:
         # Fail closed. An unanswerable authority question is a "no".
         logger.warning(
@@ -9282,6 +11488,8 @@ async def _post_dashboard_panel(guild_id, actor_id, channel_id):
                 exc_info=True,
             )
         return None
+    # The row may have been inserted just now; see /vrcverify_instructions.
+    server_config_cache.invalidate(guild_id)
 
     record_panel_view_version(guild_id)
     complete_guild_onboarding(guild_id)
@@ -9852,6 +12060,7 @@ async def write_dashboard_settings(guild_id, actor_id, changes: dict):
                     if current != new:
                         changed.append((name, current, new))
                         setattr(srv, name, new)
+            server_config_cache.invalidate(guild_id)
 
         if changed:
             with session_scope() as session:
@@ -10328,6 +12537,8 @@ def start_background_task(name: str, coro, run_once: bool = False):
 async def on_ready():
     logger.info(f"Bot is ready. Logged in as {bot.user} (ID: {bot.user.id})")
     start_background_task("results_consumer", consume_results_queue())
+    # Publishes requests held behind the per-guild queues as the window frees.
+    start_background_task("request_scheduler", request_scheduler_task())
     # The invite worker's answers. Started unconditionally: the queue is
     # declared by whichever end connects first, so a deployment without the
     # worker simply has nothing arrive, and one added later needs no restart
@@ -10350,6 +12561,21 @@ async def on_ready():
         "verification_log_flush", verification_log_flush_task()
     )
 
+    # Writes buffered verification counts (daily rollup, milestone total).
+    start_background_task(
+        "verification_counter_flush", verification_counter_flush_task()
+    )
+
+    # The periodic "Runtime stats" log line.
+    start_background_task("runtime_stats_log", runtime_stats_log_task())
+    start_background_task("event_loop_lag_monitor", event_loop_lag_monitor())
+
+    # Fills the premium cache for every guild from one entitlement walk, and
+    # keeps it filled, so verifications rarely ask Discord about a guild.
+    start_background_task("premium_prefetch", premium_prefetch_task())
+    # The card half of the same gate, refreshed from one query.
+    start_background_task("stripe_status_refresh", stripe_status_refresh_task())
+
     # Draws the grandfather line on the first boot after the tier goes live,
     # then never again. Must happen before the campaign watcher, which uses
     # the line to pick its audience.
@@ -10505,32 +12731,30 @@ async def on_entitlement_delete(entitlement: discord.Entitlement):
     _note_entitlement_change(entitlement, "deleted")
 
 
+def should_auto_verify_on_join(guild_id: str, discord_id: str) -> bool:
+    """Is this joiner already verified, in a server that auto-verifies?"""
+    config = load_guild_config(guild_id)
+    if not config.role_id or not config.auto_verify_new_members:
+        return False
+    with session_scope() as session:
+        user = session.query(User).filter_by(discord_id=discord_id).first()
+        if not user:
+            return False
+        # Record a verification attempt timestamp on join for any existing user
+        user.last_verification_attempt = datetime.now(timezone.utc)
+        return bool(user.verification_status)
+
+
 @bot.event
 async def on_member_join(member: discord.Member):
     """Auto-verify users who are already verified in our database when they join a server."""
     try:
         guild_id = str(member.guild.id)
         discord_id = str(member.id)
+        # A 404 remembered from before they (re)joined is wrong as of now.
+        _member_absent_cache.drop((member.guild.id, member.id))
 
-        with session_scope() as session:
-            server = session.query(Server).filter_by(server_id=guild_id).first()
-            if not server or not server.role_id:
-                return
-
-            # Respect setting: treat None or missing column as enabled by default
-            raw_av = getattr(server, "auto_verify_new_members", None)
-            enabled = True if raw_av is None else bool(raw_av)
-            if not enabled:
-                return
-
-            user = session.query(User).filter_by(discord_id=discord_id).first()
-            if not user:
-                return
-            # Record a verification attempt timestamp on join for any existing user
-            user.last_verification_attempt = datetime.now(timezone.utc)
-            already_verified = bool(user.verification_status)
-
-        if already_verified:
+        if await run_db(should_auto_verify_on_join, guild_id, discord_id):
             await assign_role(discord_id, True, guild_id)
             logger.info(f"Auto-verified user {discord_id} in guild {guild_id} on join.")
     except Exception:
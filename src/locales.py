@@ -105,6 +105,10 @@ localizations: dict[str, dict[str, str]] = {
         "group_invite_not_a_member": "This invite was for **{server}**, and you're no longer a member there. Join the server and verify again if you'd still like an invite.",
         "group_invite_not_verified": "You're not currently verified as 18+ in **{server}**, so the invite couldn't be sent. Verify again to get a new invite offer.",
         "group_invite_account_changed": "This offer was for a different VRChat account than the one you have linked now. Verify again to get a new invite offer for your current account.",
+        # Shown instead of, or with, the request receipt when the checker is backed up.
+        "queue_estimate": "⏳ It's busy right now: you're about #{position} in line, so expect your DM in roughly {minutes} min. No need to press again.",
+        "queue_estimate_pending": "⏳ Your verification request is still in line — expect your DM in roughly {minutes} min. Pressing again won't make it any faster.",
+        "queue_busy": "⏳ VRCVerify is very busy right now and can't take new verification requests. Please try again in a few minutes.",
     },
 
     "es-ES": {
@@ -204,6 +208,10 @@ localizations: dict[str, dict[str, str]] = {
         "group_invite_not_a_member": "Esta invitación era para **{server}**, y ya no eres miembro de ese servidor. Únete al servidor y verifícate de nuevo si aún quieres una invitación.",
         "group_invite_not_verified": "Actualmente no estás verificado como 18+ en **{server}**, así que no se pudo enviar la invitación. Verifícate de nuevo para recibir una nueva invitación.",
         "group_invite_account_changed": "Esta invitación era para una cuenta de VRChat distinta a la que tienes vinculada ahora. Verifícate de nuevo para recibir una nueva invitación para tu cuenta actual.",
+        # Shown instead of, or with, the request receipt when the checker is backed up.
+        "queue_estimate": "⏳ Hay mucha demanda ahora mismo: eres aproximadamente el n.º {position} en la cola, así que espera tu DM en unos {minutes} min. No hace falta volver a pulsar.",
+        "queue_estimate_pending": "⏳ Tu solicitud de verificación sigue en la cola: espera tu DM en unos {minutes} min. Volver a pulsar no la hará más rápida.",
+        "queue_busy": "⏳ VRCVerify está muy ocupado ahora mismo y no puede aceptar nuevas solicitudes de verificación. Vuelve a intentarlo en unos minutos.",
     },
 
     "zh-CN": {
@@ -303,6 +311,10 @@ localizations: dict[str, dict[str, str]] = {
         "group_invite_not_a_member": "这份邀请来自 **{server}**，而你已不再是该服务器的成员。如果仍想获得邀请，请重新加入该服务器并再次进行验证。",
         "group_invite_not_verified": "你目前在 **{server}** 中未被验证为 18+，因此无法发送邀请。请重新验证以获得新的邀请。",
         "group_invite_account_changed": "此邀请是为另一个 VRChat 账号发出的，与你当前绑定的账号不同。请重新验证，以便为你当前的账号获得新的邀请。",
+        # Shown instead of, or with, the request receipt when the checker is backed up.
+        "queue_estimate": "⏳ 当前较繁忙：您大约排在第 {position} 位，预计约 {minutes} 分钟后收到私信。无需再次点击。",
+        "queue_estimate_pending": "⏳ 您的验证请求仍在排队中，预计约 {minutes} 分钟后收到私信。再次点击不会加快速度。",
+        "queue_busy": "⏳ VRCVerify 当前非常繁忙，暂时无法接受新的验证请求。请几分钟后再试。",
     },
 
     "ja": {
@@ -402,6 +414,10 @@ localizations: dict[str, dict[str, str]] = {
         "group_invite_not_a_member": "この招待は **{server}** のものですが、あなたはもうそのサーバーのメンバーではありません。まだ招待が必要な場合は、サーバーに参加して再度認証してください。",
         "group_invite_not_verified": "現在 **{server}** で18歳以上として認証されていないため、招待を送信できませんでした。もう一度認証すると、新しい招待が届きます。",
         "group_invite_account_changed": "この招待は、現在リンクされているものとは別の VRChat アカウント宛てに送られたものです。現在のアカウントで新しい招待を受け取るには、もう一度認証してください。",
+        # Shown instead of, or with, the request receipt when the checker is backed up.
+        "queue_estimate": "⏳ 現在混み合っています。あなたは約{position}番目で、DMが届くまで約{minutes}分です。もう一度押す必要はありません。",
+        "queue_estimate_pending": "⏳ 検証リクエストはまだ順番待ちです。DMが届くまで約{minutes}分です。もう一度押しても早くはなりません。",
+        "queue_busy": "⏳ VRCVerify は現在非常に混み合っているため、新しい検証リクエストを受け付けられません。数分後にもう一度お試しください。",
     },
 
     "de": {
@@ -501,6 +517,10 @@ localizations: dict[str, dict[str, str]] = {
         "group_invite_not_a_member": "Diese Einladung galt für **{server}**, und du bist dort kein Mitglied mehr. Tritt dem Server wieder bei und verifiziere dich erneut, wenn du noch eine Einladung möchtest.",
         "group_invite_not_verified": "Du bist derzeit auf **{server}** nicht als 18+ verifiziert, daher konnte die Einladung nicht gesendet werden. Verifiziere dich erneut, um eine neue Einladung zu erhalten.",
         "group_invite_account_changed": "Diese Einladung galt für ein anderes VRChat-Konto als das, das du jetzt verknüpft hast. Verifiziere dich erneut, um eine neue Einladung für dein aktuelles Konto zu erhalten.",
+        # Shown instead of, or with, the request receipt when the checker is backed up.
+        "queue_estimate": "⏳ Gerade ist viel los: Du bist etwa an Position {position} in der Warteschlange, deine DM kommt in ungefähr {minutes} Min. Du musst nicht erneut klicken.",
+        "queue_estimate_pending": "⏳ Deine Verifizierungsanfrage ist noch in der Warteschlange – deine DM kommt in ungefähr {minutes} Min. Erneutes Klicken macht es nicht schneller.",
+        "queue_busy": "⏳ VRCVerify ist gerade stark ausgelastet und kann keine neuen Verifizierungsanfragen annehmen. Bitte versuche es in ein paar Minuten erneut.",
     },
 
     "nl": {
@@ -600,6 +620,10 @@ localizations: dict[str, dict[str, str]] = {
         "group_invite_not_a_member": "Deze uitnodiging was voor **{server}**, en je bent daar geen lid meer. Word weer lid van de server en verifieer je opnieuw als je nog een uitnodiging wilt.",
         "group_invite_not_verified": "Je bent op dit moment niet als 18+ geverifieerd in **{server}**, dus de uitnodiging kon niet worden verstuurd. Verifieer je opnieuw om een nieuwe uitnodiging te krijgen.",
         "group_invite_account_changed": "Deze uitnodiging was voor een ander VRChat-account dan het account dat je nu gekoppeld hebt. Verifieer je opnieuw om een nieuwe uitnodiging voor je huidige account te krijgen.",
+        # Shown instead of, or with, the request receipt when the checker is backed up.
+        "queue_estimate": "⏳ Het is nu druk: je staat ongeveer op plek {position} in de wachtrij, dus verwacht je DM over ongeveer {minutes} min. Je hoeft niet opnieuw te klikken.",
+        "queue_estimate_pending": "⏳ Je verificatieverzoek staat nog in de wachtrij — verwacht je DM over ongeveer {minutes} min. Opnieuw klikken maakt het niet sneller.",
+        "queue_busy": "⏳ VRCVerify is op dit moment erg druk en kan geen nieuwe verificatieverzoeken aannemen. Probeer het over een paar minuten opnieuw.",
     },
 
     "hi-IN": {
@@ -699,6 +723,10 @@ localizations: dict[str, dict[str, str]] = {
         "group_invite_not_a_member": "यह आमंत्रण **{server}** के लिए था, और अब आप उस सर्वर के सदस्य नहीं हैं। यदि आप अब भी आमंत्रण चाहते हैं, तो सर्वर में शामिल होकर दोबारा सत्यापन करें।",
         "group_invite_not_verified": "आप इस समय **{server}** में 18+ के रूप में सत्यापित नहीं हैं, इसलिए आमंत्रण नहीं भेजा जा सका। नया आमंत्रण पाने के लिए दोबारा सत्यापन करें।",
         "group_invite_account_changed": "यह आमंत्रण एक अलग VRChat खाते के लिए था, जो अभी आपके जुड़े हुए खाते से भिन्न है। अपने वर्तमान खाते के लिए नया आमंत्रण पाने हेतु दोबारा सत्यापन करें।",
+        # Shown instead of, or with, the request receipt when the checker is backed up.
+        "queue_estimate": "⏳ अभी काफ़ी भीड़ है: कतार में आप लगभग {position}वें स्थान पर हैं, इसलिए लगभग {minutes} मिनट में आपको DM मिल जाएगा। दोबारा दबाने की ज़रूरत नहीं है।",
+        "queue_estimate_pending": "⏳ आपका सत्यापन अनुरोध अभी भी कतार में है — लगभग {minutes} मिनट में आपको DM मिल जाएगा। दोबारा दबाने से यह तेज़ नहीं होगा।",
+        "queue_busy": "⏳ VRCVerify अभी बहुत व्यस्त है और नए सत्यापन अनुरोध स्वीकार नहीं कर सकता। कृपया कुछ मिनट बाद फिर से प्रयास करें।",
     },
 
     "ar": {
@@ -798,6 +826,10 @@ localizations: dict[str, dict[str, str]] = {
         "group_invite_not_a_member": "كانت هذه الدعوة لخادم **{server}**، ولم تعد عضوًا فيه. انضم إلى الخادم وتحقق مرة أخرى إذا كنت ما زلت ترغب في الحصول على دعوة.",
         "group_invite_not_verified": "أنت غير مُتحقَّق حاليًا كبالغ 18+ في **{server}**، لذا تعذّر إرسال الدعوة. تحقّق مرة أخرى للحصول على دعوة جديدة.",
         "group_invite_account_changed": "كانت هذه الدعوة لحساب VRChat مختلف عن الحساب المرتبط بك الآن. تحقّق مرة أخرى للحصول على دعوة جديدة لحسابك الحالي.",
+        # Shown instead of, or with, the request receipt when the checker is backed up.
+        "queue_estimate": "⏳ هناك ضغط كبير الآن: ترتيبك في قائمة الانتظار حوالي {position}، لذا توقّع رسالتك الخاصة خلال {minutes} دقيقة تقريبًا. لا حاجة للضغط مرة أخرى.",
+        "queue_estimate_pending": "⏳ طلب التحقق الخاص بك لا يزال في قائمة الانتظار — توقّع رسالتك الخاصة خلال {minutes} دقيقة تقريبًا. الضغط مرة أخرى لن يسرّعه.",
+        "queue_busy": "⏳ VRCVerify مشغول جدًا الآن ولا يمكنه قبول طلبات تحقق جديدة. يرجى المحاولة مرة أخرى بعد بضع دقائق.",
     },
 
     "bn": {
@@ -897,6 +929,10 @@ localizations: dict[str, dict[str, str]] = {
         "group_invite_not_a_member": "এই আমন্ত্রণটি **{server}**-এর জন্য ছিল, এবং আপনি আর সেই সার্ভারের সদস্য নন। আপনি যদি এখনও আমন্ত্রণ চান, তাহলে সার্ভারে যোগ দিয়ে আবার যাচাই করুন।",
         "group_invite_not_verified": "আপনি বর্তমানে **{server}**-এ 18+ হিসেবে যাচাইকৃত নন, তাই আমন্ত্রণ পাঠানো যায়নি। নতুন আমন্ত্রণ পেতে আবার যাচাই করুন।",
         "group_invite_account_changed": "এই আমন্ত্রণটি এমন একটি VRChat অ্যাকাউন্টের জন্য ছিল যা এখন আপনার সংযুক্ত অ্যাকাউন্ট থেকে ভিন্ন। আপনার বর্তমান অ্যাকাউন্টের জন্য নতুন আমন্ত্রণ পেতে আবার যাচাই করুন।",
+        # Shown instead of, or with, the request receipt when the checker is backed up.
+        "queue_estimate": "⏳ এখন অনেক ভিড়: সারিতে আপনি প্রায় {position} নম্বরে আছেন, তাই প্রায় {minutes} মিনিটের মধ্যে আপনার DM আসবে। আবার চাপার দরকার নেই।",
+        "queue_estimate_pending": "⏳ আপনার যাচাইকরণের অনুরোধ এখনও সারিতে আছে — প্রায় {minutes} মিনিটের মধ্যে আপনার DM আসবে। আবার চাপলে এটি দ্রুত হবে না।",
+        "queue_busy": "⏳ VRCVerify এখন খুব ব্যস্ত এবং নতুন যাচাইকরণের অনুরোধ নিতে পারছে না। অনুগ্রহ করে কয়েক মিনিট পরে আবার চেষ্টা করুন।",
     },
 
     "pt-BR": {
@@ -996,6 +1032,10 @@ localizations: dict[str, dict[str, str]] = {
         "group_invite_not_a_member": "Este convite era para **{server}**, e você não é mais membro desse servidor. Entre no servidor e verifique-se de novo se ainda quiser um convite.",
         "group_invite_not_verified": "Você não está verificado como 18+ em **{server}** no momento, então o convite não pôde ser enviado. Verifique-se de novo para receber um novo convite.",
         "group_invite_account_changed": "Este convite era para uma conta do VRChat diferente da que você tem vinculada agora. Verifique-se de novo para receber um novo convite para sua conta atual.",
+        # Shown instead of, or with, the request receipt when the checker is backed up.
+        "queue_estimate": "⏳ Está movimentado agora: você é aproximadamente o nº {position} na fila, então espere sua DM em cerca de {minutes} min. Não precisa clicar de novo.",
+        "queue_estimate_pending": "⏳ Sua solicitação de verificação ainda está na fila — espere sua DM em cerca de {minutes} min. Clicar de novo não vai acelerar.",
+        "queue_busy": "⏳ O VRCVerify está muito ocupado agora e não pode aceitar novas solicitações de verificação. Tente novamente em alguns minutos.",
     },
 
     "ru": {
@@ -1095,6 +1135,10 @@ localizations: dict[str, dict[str, str]] = {
         "group_invite_not_a_member": "Это приглашение было для сервера **{server}**, а вы больше не состоите в нём. Вернитесь на сервер и пройдите проверку заново, если приглашение всё ещё нужно.",
         "group_invite_not_verified": "Сейчас вы не подтверждены как 18+ на сервере **{server}**, поэтому приглашение не отправлено. Пройдите проверку заново, чтобы получить новое приглашение.",
         "group_invite_account_changed": "Это приглашение предназначалось для другого аккаунта VRChat, не для того, который привязан сейчас. Пройдите проверку заново, чтобы получить новое приглашение для текущего аккаунта.",
+        # Shown instead of, or with, the request receipt when the checker is backed up.
+        "queue_estimate": "⏳ Сейчас большая нагрузка: вы примерно {position}-й в очереди, так что ждите личное сообщение примерно через {minutes} мин. Нажимать снова не нужно.",
+        "queue_estimate_pending": "⏳ Ваш запрос на проверку всё ещё в очереди — ждите личное сообщение примерно через {minutes} мин. Повторное нажатие не ускорит его.",
+        "queue_busy": "⏳ VRCVerify сейчас сильно перегружен и не может принять новые запросы на проверку. Попробуйте снова через несколько минут.",
     },
 
     "pa-IN": {
@@ -1194,5 +1238,9 @@ localizations: dict[str, dict[str, str]] = {
         "group_invite_not_a_member": "ਇਹ ਸੱਦਾ **{server}** ਲਈ ਸੀ, ਅਤੇ ਤੁਸੀਂ ਹੁਣ ਉਸ ਸਰਵਰ ਦੇ ਮੈਂਬਰ ਨਹੀਂ ਹੋ। ਜੇ ਤੁਸੀਂ ਹਾਲੇ ਵੀ ਸੱਦਾ ਚਾਹੁੰਦੇ ਹੋ, ਤਾਂ ਸਰਵਰ ਵਿੱਚ ਸ਼ਾਮਲ ਹੋ ਕੇ ਦੁਬਾਰਾ ਪ੍ਰਮਾਣੀਕਰਨ ਕਰੋ।",
         "group_invite_not_verified": "ਤੁਸੀਂ ਇਸ ਵੇਲੇ **{server}** ਵਿੱਚ 18+ ਵਜੋਂ ਤਸਦੀਕ ਨਹੀਂ ਹੋ, ਇਸ ਲਈ ਸੱਦਾ ਨਹੀਂ ਭੇਜਿਆ ਜਾ ਸਕਿਆ। ਨਵਾਂ ਸੱਦਾ ਲੈਣ ਲਈ ਦੁਬਾਰਾ ਤਸਦੀਕ ਕਰੋ।",
         "group_invite_account_changed": "ਇਹ ਸੱਦਾ ਇੱਕ ਵੱਖਰੇ VRChat ਖਾਤੇ ਲਈ ਸੀ, ਜੋ ਹੁਣ ਤੁਹਾਡੇ ਜੁੜੇ ਖਾਤੇ ਤੋਂ ਵੱਖਰਾ ਹੈ। ਆਪਣੇ ਮੌਜੂਦਾ ਖਾਤੇ ਲਈ ਨਵਾਂ ਸੱਦਾ ਲੈਣ ਲਈ ਦੁਬਾਰਾ ਤਸਦੀਕ ਕਰੋ।",
+        # Shown instead of, or with, the request receipt when the checker is backed up.
+        "queue_estimate": "⏳ ਇਸ ਵੇਲੇ ਬਹੁਤ ਭੀੜ ਹੈ: ਕਤਾਰ ਵਿੱਚ ਤੁਸੀਂ ਲਗਭਗ {position} ਨੰਬਰ 'ਤੇ ਹੋ, ਇਸ ਲਈ ਲਗਭਗ {minutes} ਮਿੰਟ ਵਿੱਚ ਤੁਹਾਨੂੰ DM ਮਿਲ ਜਾਵੇਗਾ। ਦੁਬਾਰਾ ਦਬਾਉਣ ਦੀ ਲੋੜ ਨਹੀਂ।",
+        "queue_estimate_pending": "⏳ ਤੁਹਾਡੀ ਪੁਸ਼ਟੀ ਦੀ ਬੇਨਤੀ ਅਜੇ ਵੀ ਕਤਾਰ ਵਿੱਚ ਹੈ — ਲਗਭਗ {minutes} ਮਿੰਟ ਵਿੱਚ ਤੁਹਾਨੂੰ DM ਮਿਲ ਜਾਵੇਗਾ। ਦੁਬਾਰਾ ਦਬਾਉਣ ਨਾਲ ਇਹ ਤੇਜ਼ ਨਹੀਂ ਹੋਵੇਗਾ।",
+        "queue_busy": "⏳ VRCVerify ਇਸ ਵੇਲੇ ਬਹੁਤ ਰੁੱਝਿਆ ਹੋਇਆ ਹੈ ਅਤੇ ਪੁਸ਼ਟੀ ਦੀਆਂ ਨਵੀਆਂ ਬੇਨਤੀਆਂ ਨਹੀਂ ਲੈ ਸਕਦਾ। ਕਿਰਪਾ ਕਰਕੇ ਕੁਝ ਮਿੰਟਾਂ ਬਾਅਦ ਦੁਬਾਰਾ ਕੋਸ਼ਿਸ਼ ਕਰੋ।",
     }
 }
@@ -0,0 +1,91 @@
+"""Publish job results on the consumer's own RabbitMQ connection.
+
+Both workers -- the age checker and the group inviter -- used to answer every
+job by opening a brand-new connection, declaring the result queue, publishing
+one message and disconnecting, while the connection they had consumed the job
+on sat open the whole time. That is a TCP and AMQP handshake per job, paid to
+deliver a few hundred bytes.
+
+`ResultPublisher` puts a second channel on the consumer connection instead,
+in confirm mode, so a result costs one publish frame and the broker's ack of
+it. Confirms are what make reusing the connection safe to rely on: the job is
+acked only after the broker has said it holds the result, exactly as the old
+code only acked after a publish on a connection it had just proved was up.
+
+pika's BlockingConnection belongs to the thread that consumes from it. A
+publish from that thread happens inline; from any other thread -- the
+checker's lookup workers -- it is handed over with add_callback_threadsafe and
+the caller waits for the confirm. If the connection dies first, the caller
+gets an AMQPError, the same as a failed publish always raised.
+
+Stdlib and pika only, so both worker images can import it.
+"""
+
+import concurrent.futures
+import threading
+
+from pika.exceptions import AMQPError
+
+# How long a worker waits for the consumer thread to publish its result and
+# the broker to confirm it. Far longer than a healthy confirm takes; it only
+# exists so a worker cannot wait for ever on a connection that has died.
+DEFAULT_CONFIRM_TIMEOUT_SECONDS = 30.0
+
+
+class ResultPublisher:
+    """Confirmed publishes on a channel of an already-open connection."""
+
+    def __init__(self, connection, confirm_timeout: float = DEFAULT_CONFIRM_TIMEOUT_SECONDS):
+        self._connection = connection
+        self._confirm_timeout = confirm_timeout
+        # The thread that created this is the consumer thread: listen loops
+        # build one right after connecting.
+        self._owner = threading.get_ident()
+        self._channel = None
+        self._declared: set[str] = set()
+        self.publishes = 0
+
+    def publish(self, queue: str, body, properties, arguments: dict | None = None) -> None:
+        """Publish and wait for the broker's confirm. Raises AMQPError if not.
+
+        `arguments` are the queue's declaration arguments, for queues that
+        have them -- the checker's retry queues carry a TTL and dead-letter
+        target. The declare happens once per channel.
+        """
+        if threading.get_ident() == self._owner:
+            self._publish_here(queue, body, properties, arguments)
+            return
+
+        done: concurrent.futures.Future = concurrent.futures.Future()
+
+        def publish_on_consumer_thread():
+            try:
+                self._publish_here(queue, body, properties, arguments)
+            except BaseException as error:
+                done.set_exception(error)
+            else:
+                done.set_result(None)
+
+        try:
+            self._connection.add_callback_threadsafe(publish_on_consumer_thread)
+        except Exception as error:
+            raise AMQPError(f"consumer connection unavailable: {error}") from error
+        try:
+            done.result(timeout=self._confirm_timeout)
+        except concurrent.futures.TimeoutError as error:
+            raise AMQPError("result publish was not confirmed in time") from error
+
+    def _publish_here(self, queue, body, properties, arguments=None) -> None:
+        if self._channel is None or not self._channel.is_open:
+            self._channel = self._connection.channel()
+            self._channel.confirm_delivery()
+            self._declared.clear()
+        if queue not in self._declared:
+            self._channel.queue_declare(queue=queue, durable=True, arguments=arguments)
+            self._declared.add(queue)
+        # In confirm mode this returns only once the broker has acked the
+        # message, and raises NackError if it refused it.
+        self._channel.basic_publish(
+            exchange="", routing_key=queue, body=body, properties=properties
+        )
+        self.publishes += 1
@@ -36,6 +36,7 @@ from dotenv import load_dotenv
 from pika.exceptions import AMQPError
 
 from log_safety import install_log_scrubbing
+from result_publisher import ResultPublisher
 from vrchatapi.api.groups_api import GroupsApi
 from vrchatapi.exceptions import ApiException, UnauthorizedException
 from vrchatapi.models.create_group_invite_request import CreateGroupInviteRequest
@@ -963,6 +964,28 @@ HANDLERS = {
 }
 
 
+# Set by listen_for_jobs while its connection is up: results ride a confirmed
+# channel on the connection the job arrived on. None outside the consume loop,
+# where publish_result opens a connection of its own as it always did.
+result_publisher: ResultPublisher | None = None
+
+
+def _publish_on_fresh_connection(body: str, properties) -> None:
+    connection = _rabbitmq_connect_with_retry(max_tries=1)
+    try:
+        channel = connection.channel()
+        channel.queue_declare(queue=RESULT_QUEUE_NAME, durable=True)
+        channel.basic_publish(
+            exchange="", routing_key=RESULT_QUEUE_NAME, body=body, properties=properties
+        )
+    finally:
+        try:
+            if connection.is_open:
+                connection.close()
+        except Exception:
+            pass
+
+
 def publish_result(result: dict):
     """Publish one job outcome back for the bot to persist."""
     body = json.dumps(result)
@@ -971,14 +994,12 @@ def publish_result(result: dict):
     max_publish_tries = int(os.getenv("RABBITMQ_PUBLISH_TRIES", "3"))
     last_exc = None
     for attempt in range(1, max_publish_tries + 1):
-        connection = None
         try:
-            connection = _rabbitmq_connect_with_retry(max_tries=1)
-            channel = connection.channel()
-            channel.queue_declare(queue=RESULT_QUEUE_NAME, durable=True)
-            channel.basic_publish(
-                exchange="", routing_key=RESULT_QUEUE_NAME, body=body, properties=properties
-            )
+            publisher = result_publisher
+            if publisher is not None:
+                publisher.publish(RESULT_QUEUE_NAME, body, properties)
+            else:
+                _publish_on_fresh_connection(body, properties)
             # Summarised, not dumped. error_message carries VRChat's own prose,
             # and VRChat names the user in it -- "User usr_... is already a
             # member of this group". Logging the whole payload put a usr_ id
@@ -1003,12 +1024,6 @@ def publish_result(result: dict):
                 attempt, max_publish_tries, exc_info=True,
             )
             time.sleep(min(10.0, 1.5 * attempt))
-        finally:
-            try:
-                if connection and connection.is_open:
-                    connection.close()
-            except Exception:
-                pass
     # Raised, not swallowed. Returning here ACKed the job with no result ever
     # delivered: the join had already happened and whoever asked waited
     # forever. Raising lets process_job requeue it, and re-running a
@@ -1124,10 +1139,12 @@ def process_job(ch, method, properties, body):
 
 def listen_for_jobs():
     """Blocking consume loop, reconnecting on broker failures."""
+    global result_publisher
     while True:
         connection = None
         try:
             connection = _rabbitmq_connect_with_retry(max_tries=0)
+            result_publisher = ResultPublisher(connection)
             channel = connection.channel()
             channel.queue_declare(queue=REQUEST_QUEUE_NAME, durable=True)
             channel.basic_qos(prefetch_count=1)
@@ -1141,6 +1158,7 @@ def listen_for_jobs():
             logging.exception("Unexpected error in RabbitMQ consume loop; restarting")
             time.sleep(3)
         finally:
+            result_publisher = None
             try:
                 if connection and connection.is_open:
                     connection.close()
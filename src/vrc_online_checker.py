@@ -1,12 +1,19 @@
 import time
 import os
 import json
+import functools
 import pika
+import urllib3
 import logging
+import threading
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from concurrent.futures import Future, ThreadPoolExecutor
 from dotenv import load_dotenv
 from pika.exceptions import AMQPError
 
 from log_safety import install_log_scrubbing
+from result_publisher import ResultPublisher
 
 # VRChat API imports
 import vrchatapi
@@ -15,10 +22,12 @@ from vrchatapi.exceptions import UnauthorizedException, ApiException
 
 from vrc_session import (
     TRANSIENT_HTTP_STATUSES,
+    CircuitBreaker,
+    TokenBucket,
     VRChatAccount,
     VRChatSession,
-    backoff_delay,
     check_session_store_writable,
+    circuit_open_error,
     classify_api_error,
     default_session_error,
     request_timeout,
@@ -143,10 +152,52 @@ def _rabbitmq_connect_with_retry(max_tries: int = 0) -> pika.BlockingConnection:
 # -------------------------------------------------------------------
 # VRChat status page / outage helpers
 # -------------------------------------------------------------------
-# Floor of 1: this counts total attempts, not extra retries. At 0 the retry
-# loops would fall through without ever calling VRChat, reporting every user
-# as "code not found" with lookup_ok=True -- a silent, misdiagnosable failure.
+# Floor of 1: this counts total attempts, not extra retries. At 0 a request
+# would be reported as failed without VRChat ever being asked.
 VRCHAT_LOOKUP_RETRIES = max(1, int(os.getenv("VRCHAT_LOOKUP_RETRIES", "3")))
+
+
+def _retry_delays_from_env() -> tuple[float, ...]:
+    raw = os.getenv("VRCHAT_RETRY_DELAYS_SECONDS", "2,5,15")
+    delays = []
+    for part in raw.split(","):
+        try:
+            value = float(part)
+        except ValueError:
+            continue
+        if value > 0:
+            delays.append(value)
+    return tuple(delays) or (2.0,)
+
+
+# How long a request waits before its next attempt after a transient VRChat
+# failure: the first delay after the first failure, and so on, the last one
+# repeating. Each delay is its own retry queue (see retry_queue_name), so a
+# new value is a new queue rather than a 406 on the old one.
+VRCHAT_RETRY_DELAYS_SECONDS = _retry_delays_from_env()
+
+# How many verification requests are looked up at once. With one at a time, a
+# single slow /profile call -- up to the read timeout, times the retries --
+# held up every guild's queue behind it. It is also the prefetch count, so the
+# broker never hands this process more than it is working on.
+VRCHAT_LOOKUP_CONCURRENCY = max(1, int(os.getenv("VRCHAT_LOOKUP_CONCURRENCY", "4")))
+
+# ...and how hard all of them together may hit VRChat. Concurrency must not
+# multiply the call rate: the budget belongs to the account. Every call to
+# VRChat from a lookup spends one token, retries included. 0 disables the
+# limit.
+VRCHAT_RATE_PER_SECOND = float(os.getenv("VRCHAT_RATE_PER_SECOND", "2"))
+VRCHAT_RATE_BURST = float(os.getenv("VRCHAT_RATE_BURST", str(VRCHAT_LOOKUP_CONCURRENCY)))
+vrchat_rate_limiter = TokenBucket(VRCHAT_RATE_PER_SECOND, VRCHAT_RATE_BURST)
+
+# When VRChat is down, every queued request used to spend the full timeouts
+# finding that out for itself. After this many transient failures in a row
+# the breaker opens and lookups are answered straight away with the outage
+# message; after the cooldown one probe decides whether to resume. 0 disables.
+VRCHAT_BREAKER_THRESHOLD = int(os.getenv("VRCHAT_BREAKER_THRESHOLD", "5"))
+VRCHAT_BREAKER_COOLDOWN_SECONDS = float(os.getenv("VRCHAT_BREAKER_COOLDOWN_SECONDS", "30"))
+vrchat_breaker = CircuitBreaker(VRCHAT_BREAKER_THRESHOLD, VRCHAT_BREAKER_COOLDOWN_SECONDS)
+
 def _result_payload(discord_id, vrc_user_id, guild_id, verification_code, **extra):
     payload = {
         "discordID": discord_id,
@@ -179,43 +230,144 @@ def invalidate_vrchat_session(error_meta: dict | None = None):
     vrchat_session.invalidate(error_meta)
 
 
-def _get_vrchat_user_with_retry(users_api_instance, vrc_user_id: str):
-    last_exc = None
-    timeout = request_timeout()
-    attempts = max(1, VRCHAT_LOOKUP_RETRIES)  # never skip the call entirely
-    for attempt in range(1, attempts + 1):
-        try:
-            return users_api_instance.get_user(vrc_user_id, _request_timeout=timeout)
-        except ApiException as e:
-            last_exc = e
-            status = getattr(e, "status", None)
-            if status not in TRANSIENT_HTTP_STATUSES:
-                raise
-            if attempt >= attempts:
-                raise
-            delay = backoff_delay(attempt)
-            logging.warning(
-                "Transient VRChat get_user failure for %s (status=%s). Retrying in %.2fs (attempt %s/%s)",
-                vrc_user_id,
-                status,
-                delay,
-                attempt,
-                attempts,
-            )
-            time.sleep(delay)
-        except Exception as e:
-            last_exc = e
-            if attempt >= attempts:
-                raise
-            delay = backoff_delay(attempt)
-            logging.warning(
-                "Transient VRChat get_user failure for %s. Retrying in %.2fs (attempt %s/%s)",
-                vrc_user_id, delay, attempt, attempts, exc_info=True
-            )
-            time.sleep(delay)
-    # Returning None here would silently become bio="" / age="unknown", i.e.
-    # a false "code not found" with lookup_ok=True. Fail loudly instead.
-    raise last_exc or RuntimeError("VRChat get_user retry loop exited without a result")
+def _get_vrchat_user(users_api_instance, vrc_user_id: str):
+    """One GET /users/{id}. Failures propagate; see RetryLater for retries."""
+    vrchat_rate_limiter.acquire()
+    return users_api_instance.get_user(vrc_user_id, _request_timeout=request_timeout())
+
+
+# -------------------------------------------------------------------
+# Delayed retries
+#
+# A transient VRChat failure (429, 5xx, a timeout) used to be retried in
+# place, with time.sleep between attempts on the thread doing the lookup.
+# During a 429 storm every lookup thread was asleep at once and the whole
+# pipeline stood still for the length of the backoff, including for users
+# whose lookups would have gone through.
+#
+# Now the request goes back to RabbitMQ instead. It is published to a retry
+# queue that has a message TTL and dead-letters into the request queue, so it
+# reappears after the delay with its attempt counter bumped, and the thread
+# moves straight on to the next request. Backoff becomes time in a queue,
+# not time a worker spends blocked.
+#
+# There is no per-message jitter: every message in a retry queue waits the
+# same TTL. Requests that failed at different moments still come back at
+# different moments, and the shared rate limiter spreads whatever does
+# arrive together.
+# -------------------------------------------------------------------
+RETRY_ATTEMPT_HEADER = "x-vrcverify-attempt"
+
+
+class RetryLater(Exception):
+    """A transient lookup failure that should be retried after `delay` seconds."""
+
+    def __init__(self, delay: float, cause: Exception):
+        super().__init__(f"retry in {delay:g}s after {type(cause).__name__}")
+        self.delay = delay
+        self.cause = cause
+
+
+# What a lookup raises when the request never got an answer: vrchatapi talks
+# through urllib3, and below that are the socket errors. Nothing else counts --
+# a KeyError or TypeError from reading the answer is a bug here, and a bug
+# fails the same way on every retry and says nothing about VRChat's health.
+TRANSPORT_ERRORS = (
+    urllib3.exceptions.TimeoutError,
+    urllib3.exceptions.MaxRetryError,
+    urllib3.exceptions.ProtocolError,
+    urllib3.exceptions.NewConnectionError,
+    TimeoutError,
+    ConnectionError,
+    OSError,
+)
+
+
+def is_transient_lookup_error(error: Exception) -> bool:
+    """Would the same lookup plausibly succeed if asked again shortly?
+
+    ApiExceptions carry VRChat's answer, and only the statuses in
+    TRANSIENT_HTTP_STATUSES are worth asking again. Otherwise only a failure
+    to get an answer at all -- a timeout, a refused or reset connection -- is.
+    Everything else fails at once, and tells the breaker VRChat is fine.
+    """
+    if isinstance(error, ApiException):
+        return getattr(error, "status", None) in TRANSIENT_HTTP_STATUSES
+    return isinstance(error, TRANSPORT_ERRORS)
+
+
+def retry_delay(attempt: int) -> float:
+    """Delay after failed attempt number `attempt` (1-based)."""
+    index = min(max(attempt, 1), len(VRCHAT_RETRY_DELAYS_SECONDS)) - 1
+    return VRCHAT_RETRY_DELAYS_SECONDS[index]
+
+
+def retry_queue_name(delay: float) -> str:
+    return f"{RABBITMQ_QUEUE_NAME}.retry.{int(delay * 1000)}ms"
+
+
+def retry_queue_arguments(delay: float) -> dict:
+    """A queue that holds each message for `delay`, then hands it back.
+
+    Dead-lettering through the default exchange with the request queue as
+    routing key drops an expired message back onto the request queue, with
+    its properties -- priority and attempt header included -- intact.
+    """
+    return {
+        "x-message-ttl": int(delay * 1000),
+        "x-dead-letter-exchange": "",
+        "x-dead-letter-routing-key": RABBITMQ_QUEUE_NAME,
+    }
+
+
+def request_attempt(properties) -> int:
+    """Which attempt this delivery is, from its header. 1 if it has none."""
+    headers = getattr(properties, "headers", None) or {}
+    try:
+        return max(1, int(headers.get(RETRY_ATTEMPT_HEADER, 1)))
+    except (TypeError, ValueError):
+        return 1
+
+
+# Requests are stamped by the bot with when they were queued and when their
+# answer stops being any use (enqueuedAt / expiresAt, ISO 8601): the pending
+# code's expiry for a Verify press, the bot's REQUEST_TTL_SECONDS otherwise.
+# After an outage the queue is full of requests whose answers the bot would
+# only discard as "Verification code expired", so a request past its stamp is
+# acked and dropped before any VRChat call. The stamp is in the body because
+# a retry clears the message's AMQP expiration (see schedule_retry).
+#
+# The grace covers the two hosts' clocks disagreeing. Requests without a stamp
+# come from a bot that predates it, and are always looked up.
+REQUEST_EXPIRY_GRACE_SECONDS = float(os.getenv("REQUEST_EXPIRY_GRACE_SECONDS", "5"))
+
+_expired_lock = threading.Lock()
+expired_requests_dropped = 0
+
+
+def _request_stamp(value) -> datetime | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        stamp = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return stamp if stamp.tzinfo else stamp.replace(tzinfo=timezone.utc)
+
+
+def request_expired(data: dict, now: datetime | None = None) -> bool:
+    """Whether the request's expiresAt (plus the grace) has passed."""
+    expires_at = _request_stamp(data.get("expiresAt"))
+    if expires_at is None:
+        return False
+    now = now or datetime.now(timezone.utc)
+    return (now - expires_at).total_seconds() > REQUEST_EXPIRY_GRACE_SECONDS
+
+
+def _count_expired_request() -> None:
+    global expired_requests_dropped
+    with _expired_lock:
+        expired_requests_dropped += 1
 
 
 # -------------------------------------------------------------------
@@ -237,9 +389,205 @@ VRCHAT_USE_PROFILE_ENDPOINT = os.getenv(
     "VRCHAT_USE_PROFILE_ENDPOINT", "true"
 ).strip().lower() not in {"0", "false", "no", "off"}
 
+# If the endpoint does break, trying it first makes every verification pay a
+# failed call before the real lookup. So its recent record is kept: when
+# fewer than PROFILE_MIN_SUCCESS_RATE of the last PROFILE_HEALTH_WINDOW calls
+# worked, lookups go straight to /users, and one call in every
+# PROFILE_REPROBE_SECONDS tries /profile again to see whether it is back.
+PROFILE_HEALTH_WINDOW = max(1, int(os.getenv("PROFILE_HEALTH_WINDOW", "20")))
+PROFILE_HEALTH_MIN_SAMPLES = max(1, int(os.getenv("PROFILE_HEALTH_MIN_SAMPLES", "10")))
+PROFILE_MIN_SUCCESS_RATE = float(os.getenv("PROFILE_MIN_SUCCESS_RATE", "0.5"))
+PROFILE_REPROBE_SECONDS = float(os.getenv("PROFILE_REPROBE_SECONDS", "300"))
+
+
+class EndpointHealth:
+    """Success rate of one endpoint over its last `window` calls.
+
+    `should_try()` says whether to call the endpoint at all; every call it
+    allows is reported back with `record()`. Once the rate drops below
+    `min_success_rate` (with at least `min_samples` calls to judge by) the
+    endpoint is bypassed, and from then on one caller per `probe_interval`
+    is let through as a probe. A good probe restores the endpoint with a
+    clean record; a bad one waits out another interval.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window: int,
+        min_samples: int,
+        min_success_rate: float,
+        probe_interval: float,
+        clock=time.monotonic,
+    ):
+        self.name = name
+        self.min_samples = min(min_samples, window)
+        self.min_success_rate = min_success_rate
+        self.probe_interval = probe_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._bypassed = False
+        self._probing = False
+        self._next_probe_at = 0.0
+        self.bypassed_calls = 0
+        self.times_bypassed = 0
+
+    @property
+    def bypassed(self) -> bool:
+        with self._lock:
+            return self._bypassed
+
+    def should_try(self) -> bool:
+        with self._lock:
+            if not self._bypassed:
+                return True
+            if not self._probing and self._clock() >= self._next_probe_at:
+                self._probing = True
+                logging.info("Re-probing %s after routing around it", self.name)
+                return True
+            self.bypassed_calls += 1
+            return False
+
+    def record(self, ok: bool | None) -> None:
+        """Report a call `should_try()` allowed. None means it proved nothing."""
+        with self._lock:
+            if self._bypassed:
+                if not self._probing:
+                    return  # a call from before the bypass, finishing late
+                self._probing = False
+                if ok is None:
+                    return  # the next caller probes instead
+                if ok:
+                    self._bypassed = False
+                    self._outcomes.clear()
+                    logging.warning("%s is answering again; routing lookups back to it", self.name)
+                else:
+                    self._next_probe_at = self._clock() + self.probe_interval
+                return
+            if ok is None:
+                return
+            self._outcomes.append(ok)
+            rate = self._success_rate()
+            if len(self._outcomes) >= self.min_samples and rate < self.min_success_rate:
+                self._bypassed = True
+                self._next_probe_at = self._clock() + self.probe_interval
+                self.times_bypassed += 1
+                logging.warning(
+                    "%s succeeded on only %.0f%% of the last %s calls; bypassing it, "
+                    "re-probing every %.0fs",
+                    self.name,
+                    rate * 100,
+                    len(self._outcomes),
+                    self.probe_interval,
+                )
+
+    def _success_rate(self) -> float:
+        if not self._outcomes:
+            return 1.0
+        return sum(self._outcomes) / len(self._outcomes)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "route": "bypassed" if self._bypassed else "preferred",
+                "success_rate": round(self._success_rate(), 3),
+                "samples": len(self._outcomes),
+                "bypassed_calls": self.bypassed_calls,
+                "times_bypassed": self.times_bypassed,
+            }
+
+
+profile_health = EndpointHealth(
+    "/profile",
+    PROFILE_HEALTH_WINDOW,
+    PROFILE_HEALTH_MIN_SAMPLES,
+    PROFILE_MIN_SUCCESS_RATE,
+    PROFILE_REPROBE_SECONDS,
+)
+
+
+# -------------------------------------------------------------------
+# Snapshot cache
+#
+# Users press Verify and the no-code re-check over and over, and every press
+# was a fresh VRChat call for the same user -- against the budget that runs
+# out first. A re-check can take an answer a few seconds old, so those are
+# cached briefly, and concurrent re-checks for one user share a single call.
+# Code checks bypass both: the user has just edited their bio and the answer
+# has to reflect that.
+# -------------------------------------------------------------------
+PROFILE_CACHE_TTL_SECONDS = float(os.getenv("PROFILE_CACHE_TTL_SECONDS", "5"))
+PROFILE_CACHE_MAX_ENTRIES = int(os.getenv("PROFILE_CACHE_MAX_ENTRIES", "1000"))
+
+
+class ProfileSnapshotCache:
+    """Bounded LRU of recent snapshots, plus single-flight for misses.
+
+    `get_or_fetch(key, fetch)` returns a fresh cached value if there is one.
+    Otherwise the first caller for a key runs `fetch()` and anyone asking for
+    the same key meanwhile waits for that call instead of making their own,
+    receiving its value or its exception. Only values are cached, never
+    failures. A TTL of 0 keeps the single-flight and turns off the cache.
+    """
+
+    def __init__(self, max_entries: int, ttl: float, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, tuple]] = OrderedDict()
+        self._inflight: dict[str, Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+
+    def get_or_fetch(self, key, fetch):
+        if not isinstance(key, str):
+            return fetch()  # ids arrive over RabbitMQ; only cache sane ones
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = Future()
+                self._inflight[key] = flight
+                self.misses += 1
+            else:
+                self.shared += 1
+        if not leader:
+            return flight.result()
+
+        try:
+            value = fetch()
+        except BaseException as error:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.set_exception(error)
+            raise
+        with self._lock:
+            if self.ttl > 0 and self.max_entries > 0:
+                self._entries[key] = (self._clock() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            self._inflight.pop(key, None)
+        flight.set_result(value)
+        return value
+
+
+profile_snapshots = ProfileSnapshotCache(PROFILE_CACHE_MAX_ENTRIES, PROFILE_CACHE_TTL_SECONDS)
+
 
 def _fetch_vrchat_profile(client, vrc_user_id: str) -> dict:
     """GET /profile/{userId} and return the decoded JSON body."""
+    vrchat_rate_limiter.acquire()
     raw = client.call_api(
         "/profile/{userId}", "GET",
         {"userId": vrc_user_id},
@@ -262,49 +610,40 @@ def _fetch_vrchat_profile(client, vrc_user_id: str) -> dict:
     return payload
 
 
-def _get_vrchat_profile_with_retry(client, vrc_user_id: str) -> dict:
-    """Fetch /profile/{id}, retrying only transient upstream failures.
-
-    Anything else raises immediately so the caller can fall back to
-    /users/{id} without first stacking retry delays on a permanent error.
-    """
-    attempts = max(1, VRCHAT_LOOKUP_RETRIES)  # never skip the call entirely
-    for attempt in range(1, attempts + 1):
-        try:
-            return _fetch_vrchat_profile(client, vrc_user_id)
-        except ApiException as e:
-            status = getattr(e, "status", None)
-            if status not in TRANSIENT_HTTP_STATUSES or attempt >= attempts:
-                raise
-            delay = backoff_delay(attempt)
-            logging.warning(
-                "Transient VRChat /profile failure for %s (status=%s). Retrying in %.2fs (attempt %s/%s)",
-                vrc_user_id,
-                status,
-                delay,
-                attempt,
-                attempts,
-            )
-            time.sleep(delay)
-    # Only reachable if the loop body never ran, which max(1, ...) prevents.
-    raise RuntimeError("VRChat /profile retry loop exited without a result")
-
-
 def fetch_profile_snapshot(client, vrc_user_id: str) -> tuple[str, str, str | None, str]:
     """Return (bio, age_status, display_name, source) for a VRChat user.
 
     Reads /profile/{id} first since it is the only endpoint currently
     reflecting recent bio edits, falling back to /users/{id} when the newer
-    endpoint fails or omits a field we need. UnauthorizedException is never
-    swallowed: it means the session is dead and the caller must handle it.
+    endpoint fails or omits a field we need. Nothing is retried here: a
+    transient failure of either endpoint propagates and the caller decides
+    whether the request goes to a retry queue. Falling back on one would
+    answer from /users' stale bio -- a member whose code is in their bio
+    failing verification because VRChat hiccuped. UnauthorizedException is
+    never swallowed: it means the session is dead and the caller must
+    handle it.
     """
-    if VRCHAT_USE_PROFILE_ENDPOINT:
+    if VRCHAT_USE_PROFILE_ENDPOINT and profile_health.should_try():
         profile = None
         try:
-            profile = _get_vrchat_profile_with_retry(client, vrc_user_id)
+            profile = _fetch_vrchat_profile(client, vrc_user_id)
         except UnauthorizedException:
+            # Our session, not the endpoint: says nothing about /profile.
+            profile_health.record(None)
             raise
-        except Exception:
+        except Exception as e:
+            if is_transient_lookup_error(e):
+                # VRChat as a whole, not /profile: says nothing about the
+                # endpoint, and /users would only answer with a stale bio.
+                profile_health.record(None)
+                raise
+            # Only an answer /profile itself got wrong counts against it: a
+            # refusal (4xx/5xx that is not transient) or a body that is not
+            # the JSON object we parse (ValueError, which covers bad JSON).
+            # Anything else is ours to fix and must not route around the
+            # endpoint; /users is still the safer read for this request.
+            endpoint_failed = isinstance(e, (ApiException, ValueError))
+            profile_health.record(False if endpoint_failed else None)
             logging.warning(
                 "VRChat /profile lookup failed for %s; falling back to /users",
                 vrc_user_id,
@@ -321,12 +660,14 @@ def fetch_profile_snapshot(client, vrc_user_id: str) -> tuple[str, str, str | No
             # nack(requeue=True) upstream -- an infinite redelivery loop that
             # wedges the whole queue. Falling back is always cheaper.
             if isinstance(bio, str) and isinstance(age_status, str):
+                profile_health.record(True)
                 return (
                     bio,
                     age_status,
                     display_name if isinstance(display_name, str) else None,
                     "profile",
                 )
+            profile_health.record(False)
             logging.warning(
                 "VRChat /profile for %s has unusable fields "
                 "(bio=%s, ageVerificationStatus=%s); falling back to /users",
@@ -335,7 +676,7 @@ def fetch_profile_snapshot(client, vrc_user_id: str) -> tuple[str, str, str | No
                 type(age_status).__name__,
             )
 
-    vrc_user = _get_vrchat_user_with_retry(users_api.UsersApi(client), vrc_user_id)
+    vrc_user = _get_vrchat_user(users_api.UsersApi(client), vrc_user_id)
     return (
         getattr(vrc_user, "bio", "") or "",
         getattr(vrc_user, "age_verification_status", "unknown"),
@@ -364,8 +705,81 @@ def bio_contains_code(bio: str | None, verification_code: str) -> bool:
     return False
 
 
+class ThreadsafeChannel:
+    """The consumer channel, as seen from a lookup worker thread.
+
+    pika's BlockingConnection belongs to the thread that consumes from it, and
+    an ack sent from anywhere else can corrupt the connection. Workers hold
+    this instead: every ack and nack is handed to the consumer thread with
+    add_callback_threadsafe, which runs it between deliveries.
+
+    If the connection has gone by the time a worker finishes, the ack goes
+    nowhere -- and that is fine, because the broker redelivers every message
+    that was never acked on a connection that closed.
+    """
+
+    def __init__(self, connection, channel):
+        self._connection = connection
+        self._channel = channel
+
+    def _on_consumer_thread(self, callback) -> None:
+        try:
+            self._connection.add_callback_threadsafe(callback)
+        except Exception:
+            logging.warning(
+                "RabbitMQ connection closed before a lookup finished; the broker "
+                "will redeliver it.",
+                exc_info=True,
+            )
+
+    def basic_ack(self, delivery_tag):
+        self._on_consumer_thread(functools.partial(self._channel.basic_ack, delivery_tag=delivery_tag))
+
+    def basic_nack(self, delivery_tag, requeue=True):
+        self._on_consumer_thread(
+            functools.partial(self._channel.basic_nack, delivery_tag=delivery_tag, requeue=requeue)
+        )
+
+
+_lookup_pool: ThreadPoolExecutor | None = None
+
+
+def lookup_pool() -> ThreadPoolExecutor:
+    """The worker threads lookups run on. One pool for the life of the process.
+
+    Not recreated on reconnect: a worker still finishing a lookup for the old
+    connection simply has its ack dropped (see ThreadsafeChannel), and the
+    prefetch count on the new connection is what bounds new work.
+    """
+    global _lookup_pool
+    if _lookup_pool is None:
+        _lookup_pool = ThreadPoolExecutor(
+            max_workers=VRCHAT_LOOKUP_CONCURRENCY, thread_name_prefix="vrchat-lookup"
+        )
+    return _lookup_pool
+
+
+def dispatch_verification_request(connection, ch, method, properties, body):
+    """RabbitMQ callback: hand one request to a lookup worker and return at once.
+
+    The consumer thread only ever receives messages and runs acks; the VRChat
+    calls happen on the pool, so one slow lookup no longer holds up the rest.
+    """
+    lookup_pool().submit(
+        process_verification_request,
+        ThreadsafeChannel(connection, ch),
+        method,
+        properties,
+        body,
+    )
+
+
 def process_verification_request(ch, method, properties, body):
-    """RabbitMQ callback: verify, publish result, then ACK/NACK."""
+    """Verify one request, publish the result, then ACK/NACK.
+
+    Runs on a lookup worker; `ch` is a ThreadsafeChannel there. Called
+    directly with the real channel it behaves the same, one request at a time.
+    """
     try:
         data = json.loads(body)
     except Exception:
@@ -378,18 +792,40 @@ def process_verification_request(ch, method, properties, body):
     guild_id = data.get("guildID")
     verification_code = data.get("verificationCode")
     update_nickname = data.get("updateNickname", False)
+    attempt = request_attempt(properties)
+
+    if request_expired(data):
+        _count_expired_request()
+        logging.info(
+            "Dropping expired request for discord_id=%s guild_id=%s (queued %s, expired %s)",
+            discord_id,
+            guild_id,
+            data.get("enqueuedAt"),
+            data.get("expiresAt"),
+        )
+        ch.basic_ack(delivery_tag=method.delivery_tag)
+        return
 
-    logging.info("Received verification request: %s", data)
+    logging.info("Received verification request (attempt %s): %s", attempt, data)
 
     try:
         # If verification_code is None => "re-check"
         # If not None => "new code" approach
-        result = verify_and_build_result(
-            discord_id=discord_id,
-            vrc_user_id=vrc_user_id,
-            guild_id=guild_id,
-            verification_code=verification_code,
-        )
+        try:
+            result = verify_and_build_result(
+                discord_id=discord_id,
+                vrc_user_id=vrc_user_id,
+                guild_id=guild_id,
+                verification_code=verification_code,
+                attempt=attempt,
+            )
+        except RetryLater as retry:
+            # Acked only once the retry copy is safely with the broker; if
+            # that publish fails, the AMQPError branch below requeues the
+            # original instead.
+            schedule_retry(body, properties, attempt, retry.delay)
+            ch.basic_ack(delivery_tag=method.delivery_tag)
+            return
 
         if update_nickname:
             result["updateNickname"] = True
@@ -402,8 +838,8 @@ def process_verification_request(ch, method, properties, body):
         ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
     except Exception:
         # Requeue at most once. An unconditional requeue turns any unhandled
-        # bug into an unbounded redelivery loop, and with prefetch_count=1
-        # that single message stalls verification for every server. Retrying
+        # bug into an unbounded redelivery loop, and that message would occupy
+        # a lookup worker for every server for ever. Retrying
         # once covers transient faults; a second identical failure means the
         # message itself is poison, so drop it rather than wedge the queue.
         # (A dead-letter queue would be the better home for these.)
@@ -415,7 +851,57 @@ def process_verification_request(ch, method, properties, body):
         ch.basic_nack(delivery_tag=method.delivery_tag, requeue=not already_retried)
 
 
-def verify_and_build_result(discord_id, vrc_user_id, guild_id, verification_code):
+def _record_lookup_failure(error: Exception) -> None:
+    """Tell the breaker how VRChat failed. A 404 still means it is up."""
+    if is_transient_lookup_error(error):
+        vrchat_breaker.record_failure()
+    else:
+        vrchat_breaker.record_success()
+
+
+class VRChatCircuitOpen(Exception):
+    """The breaker is open: this lookup was not attempted."""
+
+
+def _guarded_profile_snapshot(client, vrc_user_id: str):
+    """fetch_profile_snapshot behind the circuit breaker.
+
+    One breaker covers the whole lookup, /profile and its /users fallback
+    together: what it protects is the time spent finding out VRChat is down.
+    """
+    if not vrchat_breaker.allow():
+        raise VRChatCircuitOpen()
+    try:
+        snapshot = fetch_profile_snapshot(client, vrc_user_id)
+    except UnauthorizedException:
+        # VRChat answered; it is our session that is broken, not the API.
+        vrchat_breaker.record_success()
+        raise
+    except Exception as e:
+        _record_lookup_failure(e)
+        raise
+    vrchat_breaker.record_success()
+    return snapshot
+
+
+def _defer_if_transient(error: Exception, vrc_user_id, attempt: int) -> None:
+    """Raise RetryLater if this failure deserves another attempt later."""
+    if attempt >= VRCHAT_LOOKUP_RETRIES or not is_transient_lookup_error(error):
+        return
+    delay = retry_delay(attempt)
+    logging.warning(
+        "Transient VRChat lookup failure for %s (status=%s). Retrying in %gs via the "
+        "retry queue (attempt %s/%s)",
+        vrc_user_id,
+        getattr(error, "status", None),
+        delay,
+        attempt,
+        VRCHAT_LOOKUP_RETRIES,
+    )
+    raise RetryLater(delay, error) from error
+
+
+def verify_and_build_result(discord_id, vrc_user_id, guild_id, verification_code, attempt=1):
     """
     Queries VRChat to determine if the user is 18+ and/or if the verification code is present in their bio.
     Returns a dictionary with:
@@ -423,6 +909,9 @@ def verify_and_build_result(discord_id, vrc_user_id, guild_id, verification_code
       - "code_found" (bool)
       - "verificationCode"
       - outage / lookup metadata when VRChat is unhealthy
+
+    Raises RetryLater instead of returning a failure when VRChat's failure
+    was transient and `attempt` has not used up VRCHAT_LOOKUP_RETRIES.
     """
     client, session_error = get_vrchat_session()
     if not client:
@@ -437,7 +926,25 @@ def verify_and_build_result(discord_id, vrc_user_id, guild_id, verification_code
         )
 
     try:
-        bio, age_status, display_name, source = fetch_profile_snapshot(client, vrc_user_id)
+        if verification_code is None:
+            # A re-check only needs a recent answer, so it may share one.
+            snapshot = profile_snapshots.get_or_fetch(
+                vrc_user_id, lambda: _guarded_profile_snapshot(client, vrc_user_id)
+            )
+        else:
+            # A code check must see the bio as it is now: the user has just
+            # pasted the code in. Always its own call.
+            snapshot = _guarded_profile_snapshot(client, vrc_user_id)
+        bio, age_status, display_name, source = snapshot
+    except VRChatCircuitOpen:
+        logging.warning("VRChat circuit open; failing lookup for %s without calling VRChat", vrc_user_id)
+        return _result_payload(
+            discord_id,
+            vrc_user_id,
+            guild_id,
+            verification_code,
+            **circuit_open_error(),
+        )
     except UnauthorizedException as e:
         logging.warning("VRChat session unauthorized; deferring relogin to background worker")
         meta = classify_api_error(e)
@@ -450,6 +957,7 @@ def verify_and_build_result(discord_id, vrc_user_id, guild_id, verification_code
             **meta,
         )
     except ApiException as e:
+        _defer_if_transient(e, vrc_user_id, attempt)
         logging.error("Failed to fetch VRChat user %s. Error: %s", vrc_user_id, e)
         if getattr(e, "status", None) in {401, 403}:
             invalidate_vrchat_session(classify_api_error(e))
@@ -461,6 +969,7 @@ def verify_and_build_result(discord_id, vrc_user_id, guild_id, verification_code
             **classify_api_error(e),
         )
     except Exception as e:
+        _defer_if_transient(e, vrc_user_id, attempt)
         logging.error("Unexpected failure while fetching VRChat user %s. Error: %s", vrc_user_id, e)
         return _result_payload(
             discord_id,
@@ -505,6 +1014,74 @@ def verify_and_build_result(discord_id, vrc_user_id, guild_id, verification_code
     )
 
 
+# Set by listen_for_verifications for as long as its connection is up, so
+# results go out on the connection the requests came in on. None outside the
+# consume loop, where a publish falls back to a connection of its own.
+result_publisher: ResultPublisher | None = None
+
+
+def _publish_on_fresh_connection(queue: str, body: str, properties, arguments=None) -> None:
+    connection = _rabbitmq_connect_with_retry(max_tries=1)
+    try:
+        channel = connection.channel()
+        channel.queue_declare(queue=queue, durable=True, arguments=arguments)
+        channel.basic_publish(exchange="", routing_key=queue, body=body, properties=properties)
+    finally:
+        try:
+            if connection.is_open:
+                connection.close()
+        except Exception:
+            pass
+
+
+# Every AMQP basic property, so a republished request keeps all of them.
+_MESSAGE_PROPERTIES = (
+    "content_type",
+    "content_encoding",
+    "headers",
+    "delivery_mode",
+    "priority",
+    "correlation_id",
+    "reply_to",
+    "expiration",
+    "message_id",
+    "timestamp",
+    "type",
+    "user_id",
+    "app_id",
+    "cluster_id",
+)
+
+
+def schedule_retry(body, properties, attempt: int, delay: float) -> None:
+    """Park a request in the retry queue for `delay`, as attempt `attempt + 1`.
+
+    Raises AMQPError if the broker did not take it.
+    """
+    # The request as the bot sent it -- priority, ids, timestamp and all --
+    # with only what the retry changes overridden.
+    retry_properties = pika.BasicProperties(
+        **{field: getattr(properties, field, None) for field in _MESSAGE_PROPERTIES}
+    )
+    retry_properties.content_type = retry_properties.content_type or "application/json"
+    headers = dict(retry_properties.headers or {})
+    headers[RETRY_ATTEMPT_HEADER] = attempt + 1
+    retry_properties.headers = headers
+    retry_properties.delivery_mode = 2
+    # Cleared on purpose. The retry queue's x-message-ttl is the delay; a
+    # per-message expiration shorter than it would hand the request back
+    # early, and RabbitMQ strips it on dead-lettering anyway. The deadline
+    # that matters travels in the body as expiresAt.
+    retry_properties.expiration = None
+    queue = retry_queue_name(delay)
+    arguments = retry_queue_arguments(delay)
+    publisher = result_publisher
+    if publisher is not None:
+        publisher.publish(queue, body, retry_properties, arguments)
+    else:
+        _publish_on_fresh_connection(queue, body, retry_properties, arguments)
+
+
 def send_verification_result(result: dict):
     """Publish the verification result to the bot's queue."""
     message_str = json.dumps(result)
@@ -516,17 +1093,12 @@ def send_verification_result(result: dict):
     max_publish_tries = int(os.getenv("RABBITMQ_PUBLISH_TRIES", "3"))
     last_exc: Exception | None = None
     for attempt in range(1, max_publish_tries + 1):
-        connection = None
         try:
-            connection = _rabbitmq_connect_with_retry(max_tries=1)
-            channel = connection.channel()
-            channel.queue_declare(queue=RESULT_QUEUE_NAME, durable=True)
-            channel.basic_publish(
-                exchange="",
-                routing_key=RESULT_QUEUE_NAME,
-                body=message_str,
-                properties=properties,
-            )
+            publisher = result_publisher
+            if publisher is not None:
+                publisher.publish(RESULT_QUEUE_NAME, message_str, properties)
+            else:
+                _publish_on_fresh_connection(RESULT_QUEUE_NAME, message_str, properties)
             logging.info("Sent verification result to '%s': %s", RESULT_QUEUE_NAME, message_str)
             return
         except AMQPError as e:
@@ -538,37 +1110,38 @@ def send_verification_result(result: dict):
                 exc_info=True,
             )
             time.sleep(min(10.0, 1.5 * attempt))
-        finally:
-            try:
-                if connection and connection.is_open:
-                    connection.close()
-            except Exception:
-                pass
 
     logging.error("RabbitMQ result publish failed after retries; giving up", exc_info=last_exc)
 
 
 def listen_for_verifications():
     """Blocking function that listens for new requests from the bot."""
+    global result_publisher
     if not vrchat_session.client:
         logging.warning("VRChat login was not successful. We might fail all requests.")
     while True:
         connection = None
         try:
             connection = _rabbitmq_connect_with_retry(max_tries=0)
+            result_publisher = ResultPublisher(connection)
             channel = connection.channel()
             channel.queue_declare(
                 queue=RABBITMQ_QUEUE_NAME,
                 durable=True,
                 arguments=request_queue_arguments(),
             )
-            channel.basic_qos(prefetch_count=1)
+            channel.basic_qos(prefetch_count=VRCHAT_LOOKUP_CONCURRENCY)
             channel.basic_consume(
                 queue=RABBITMQ_QUEUE_NAME,
-                on_message_callback=process_verification_request,
+                on_message_callback=functools.partial(dispatch_verification_request, connection),
                 auto_ack=False,
             )
-            logging.info("Listening for verification requests on '%s'...", RABBITMQ_QUEUE_NAME)
+            logging.info(
+                "Listening for verification requests on '%s' (%s at a time, %s VRChat calls/s)...",
+                RABBITMQ_QUEUE_NAME,
+                VRCHAT_LOOKUP_CONCURRENCY,
+                VRCHAT_RATE_PER_SECOND if VRCHAT_RATE_PER_SECOND > 0 else "unlimited",
+            )
             channel.start_consuming()
         except pika.exceptions.ChannelClosedByBroker as error:
             if not is_queue_argument_mismatch(error):
@@ -595,6 +1168,7 @@ def listen_for_verifications():
             logging.exception("Unexpected error in RabbitMQ consume loop; restarting")
             time.sleep(3)
         finally:
+            result_publisher = None
             try:
                 if connection and connection.is_open:
                     connection.close()
@@ -602,6 +1176,57 @@ def listen_for_verifications():
                 pass
 
 
+# -------------------------------------------------------------------
+# Stats
+#
+# The checker exports no metrics endpoint; a periodic log line is how its
+# routing and breaker state are watched. Transitions are also logged as they
+# happen, at WARNING.
+# -------------------------------------------------------------------
+CHECKER_STATS_INTERVAL_SECONDS = float(os.getenv("CHECKER_STATS_INTERVAL_SECONDS", "300"))
+
+
+def lookup_stats() -> dict:
+    profile = profile_health.snapshot()
+    return {
+        "profile_route": profile["route"] if VRCHAT_USE_PROFILE_ENDPOINT else "disabled",
+        "profile_success_rate": profile["success_rate"],
+        "profile_samples": profile["samples"],
+        "profile_bypassed_calls": profile["bypassed_calls"],
+        "breaker_state": vrchat_breaker.state,
+        "breaker_opened": vrchat_breaker.opened,
+        "breaker_short_circuited": vrchat_breaker.short_circuited,
+        "snapshot_cache_hits": profile_snapshots.hits,
+        "snapshot_cache_misses": profile_snapshots.misses,
+        "snapshot_shared_calls": profile_snapshots.shared,
+        "expired_requests_dropped": expired_requests_dropped,
+    }
+
+
+def log_lookup_stats() -> None:
+    logging.info(
+        "Lookup stats: %s",
+        " ".join(f"{key}={value}" for key, value in lookup_stats().items()),
+    )
+
+
+def start_stats_thread() -> threading.Thread | None:
+    if CHECKER_STATS_INTERVAL_SECONDS <= 0:
+        return None
+
+    def loop():
+        while True:
+            time.sleep(CHECKER_STATS_INTERVAL_SECONDS)
+            try:
+                log_lookup_stats()
+            except Exception:
+                logging.exception("Could not log lookup stats")
+
+    thread = threading.Thread(target=loop, name="checker-stats", daemon=True)
+    thread.start()
+    return thread
+
+
 # -------------------------------------------------------------------
 # Main
 # -------------------------------------------------------------------
@@ -614,5 +1239,6 @@ if __name__ == "__main__":
         logging.error("Initial VRChat login failed. Continuing to serve queue with outage-aware responses.")
 
     vrchat_session.start_relogin_thread()
+    start_stats_thread()
 
     listen_for_verifications()
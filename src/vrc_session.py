@@ -77,6 +77,133 @@ def backoff_delay(attempt: int) -> float:
     return min(8.0, VRCHAT_LOOKUP_BACKOFF_BASE * attempt) + random.uniform(0.0, 0.35)
 
 
+class TokenBucket:
+    """A calls-per-second budget shared by every thread that talks to VRChat.
+
+    Concurrency and rate are separate knobs on purpose. Running lookups in
+    parallel is about not letting one slow call hold up everybody else; it
+    must not also multiply how hard we hit VRChat, because the budget belongs
+    to the account, not to any one worker. Each call spends a token, tokens
+    come back at `rate` per second, and up to `burst` can be saved up so a
+    quiet spell is followed by a short burst rather than a trickle.
+
+    A `rate` of 0 or less means unlimited, which is what the test suite runs
+    with.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0, clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.burst = max(1.0, float(burst))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a call may be made. Returns how long it waited."""
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                wait = (1.0 - self._tokens) / self.rate
+            # Slept outside the lock, so a waiter does not stop the others
+            # from reading the clock; whoever wakes first takes the token.
+            self._sleep(wait)
+            waited += wait
+
+
+class CircuitBreaker:
+    """Stops calling VRChat for a while once it has failed K times running.
+
+    During an outage every lookup otherwise pays the full connect and read
+    timeouts before reporting the failure, one after another, so a backlog
+    that built up in minutes takes hours to drain -- while still hammering an
+    API that is already struggling.
+
+    Closed is normal operation. `threshold` consecutive transient failures
+    open it, and while open `allow()` says no, so callers answer at once
+    instead of calling. Once `cooldown` has passed, exactly one caller is let
+    through as a probe (half-open): its success closes the breaker, its
+    failure opens it for another cooldown. Everyone else keeps being turned
+    away until the probe reports back.
+
+    Every `allow()` that returns True must be followed by one
+    `record_success()` or `record_failure()`, or a half-open breaker waits on
+    its probe for ever. A threshold of 0 or less disables the breaker.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, threshold: int, cooldown: float, clock=time.monotonic, label: str = "VRChat"):
+        self.threshold = int(threshold)
+        self.cooldown = float(cooldown)
+        self.label = label
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self.opened = 0
+        self.short_circuited = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow(self) -> bool:
+        """May this caller talk to VRChat now?"""
+        if self.threshold <= 0:
+            return True
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.cooldown:
+                self._state = self.HALF_OPEN
+                logging.info("%s circuit half-open; sending one probe", self.label)
+                return True
+            self.short_circuited += 1
+            return False
+
+    def record_success(self) -> None:
+        """VRChat answered -- with data, or with a definite non-transient error."""
+        with self._lock:
+            if self._state != self.CLOSED:
+                logging.warning("%s circuit closed; lookups resume", self.label)
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """A transient failure: 429, 5xx, a timeout, a dropped connection."""
+        if self.threshold <= 0:
+            return
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._failures >= self.threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self.opened += 1
+                logging.warning(
+                    "%s circuit open after %s consecutive transient failures; "
+                    "failing lookups fast for %.0fs",
+                    self.label,
+                    self._failures,
+                    self.cooldown,
+                )
+
+
 # -------------------------------------------------------------------
 # Account identity
 # -------------------------------------------------------------------
@@ -127,6 +254,9 @@ _status_cache: dict[str, object] = {
     "expires_at": 0.0,
     "value": None,
 }
+# Held by whichever thread is fetching. Everyone else answers from the cache
+# (or with nothing) rather than queue up behind an 8 s timeout.
+_status_fetch_lock = threading.Lock()
 
 NO_OUTAGE_META = {
     "vrchat_outage": False,
@@ -137,10 +267,20 @@ NO_OUTAGE_META = {
 
 
 def fetch_status_summary(force_refresh: bool = False) -> dict | None:
+    """status.vrchat.com's summary, at most one fetch per cache period.
+
+    A failed fetch is cached for the same period as a good one, keeping the
+    last good answer if there is one. It is asked for exactly when VRChat is
+    failing -- every lookup the circuit breaker refuses builds its error from
+    here -- and the status page tends to be slow or down at the same moment,
+    so without that every refused lookup would wait out its own timeout.
+    """
     now = time.monotonic()
     cached = _status_cache.get("value")
     expires_at = float(_status_cache.get("expires_at") or 0.0)
-    if cached is not None and not force_refresh and expires_at > now:
+    if not force_refresh and expires_at > now:
+        return cached  # type: ignore[return-value]
+    if not _status_fetch_lock.acquire(blocking=False):
         return cached  # type: ignore[return-value]
 
     try:
@@ -158,9 +298,10 @@ def fetch_status_summary(force_refresh: bool = False) -> dict | None:
         return data
     except Exception:
         logging.warning("Failed to fetch VRChat status summary", exc_info=True)
-        if cached is not None:
-            return cached  # type: ignore[return-value]
-        return None
+        _status_cache["expires_at"] = now + VRCHAT_STATUS_CACHE_SECONDS
+        return cached  # type: ignore[return-value]
+    finally:
+        _status_fetch_lock.release()
 
 
 def extract_relevant_status() -> dict:
@@ -268,6 +409,24 @@ def default_session_error(message: str = "VRChat session not active") -> dict:
     }
 
 
+def circuit_open_error() -> dict:
+    """Result metadata for a lookup the circuit breaker refused to make.
+
+    Reported as an upstream error so the bot shows its outage message, and
+    enriched from the status page like any other suspected outage.
+    """
+    status_meta = extract_relevant_status()
+    return {
+        "lookup_ok": False,
+        "error_type": "vrchat_upstream_error",
+        "error_message": "VRChat lookups paused after repeated failures",
+        "vrchat_outage": True,
+        "vrchat_outage_confirmed": bool(status_meta.get("vrchat_outage_confirmed")),
+        "vrchat_status_message": status_meta.get("vrchat_status_message"),
+        "vrchat_status_indicator": status_meta.get("vrchat_status_indicator"),
+    }
+
+
 def auth_error(message: str) -> dict:
     return {
         "lookup_ok": False,
@@ -10,6 +10,8 @@ override variables that are already set).
 import os
 import sys
 
+import pytest
+
 TEST_ENV = {
     "DATABASE_URL": "sqlite:///:memory:",
     "DISCORD_BOT_TOKEN": "test-token",
@@ -91,4 +93,34 @@ os.environ["GROUP_INVITE_TIMEOUT_SECONDS"] = ""
 os.environ["GROUP_INVITE_COOLDOWN_SECONDS"] = ""
 os.environ["INVITE_MIN_SPACING_SECONDS"] = ""
 
+# Sixth. The checker's VRChat rate budget is real time: at the shipped rate the
+# tests that make a few dozen lookups would sleep between them, and a developer
+# who tuned it in .env would change how long the suite takes for reasons no
+# diff explains. 0 means unlimited. Tests of the limiter build their own
+# TokenBucket with a fake clock.
+os.environ["VRCHAT_RATE_PER_SECOND"] = "0"
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+@pytest.fixture(autouse=True)
+def fresh_bot_caches():
+    """Start every test with bot.py's lookup caches, counter buffer and request
+    window empty.
+
+    Tests set up servers rows by writing them directly, not through the
+    writers that invalidate the config cache, and reuse the same guild and
+    member ids throughout, so an entry left by one test would answer for the
+    next one. Only touches the caches once some test has imported bot;
+    importing it here would pin the environment too early for tests that
+    adjust it first.
+    """
+    bot = sys.modules.get("bot")
+    if bot is not None:
+        bot.server_config_cache.clear()
+        bot._member_fetch_cache.clear()
+        bot._member_absent_cache.clear()
+        bot.verification_counters.clear()
+        bot.request_scheduler.clear()
+        bot._queue_estimates.clear()
+    yield
@@ -232,7 +232,7 @@ def harness(monkeypatch):
 
     guild = SimpleNamespace(id=int(GUILD_ID), name="Test Server", roles=[verified])
 
-    async def fake_fetch(g, user_id):
+    async def fake_fetch(g, user_id, fresh=False):
         return FakeMember()
 
     async def noop_dm(*args, **kwargs):
@@ -48,6 +48,7 @@ def stub_startup(monkeypatch):
     monkeypatch.setattr(discord.Client, "user", property(lambda self: SimpleNamespace(id=1)))
     for attr, name in [
         ("consume_results_queue", "results_consumer"),
+        ("request_scheduler_task", "request_scheduler"),
         # Every long-running coroutine on_ready starts has to be stubbed
         # here. An unstubbed one runs for real, and both consumers retry
         # their RabbitMQ connection forever by design -- so the omission
@@ -60,6 +61,11 @@ def stub_startup(monkeypatch):
         ("watch_update_trigger_file", "instructions_trigger_watcher"),
         ("watch_premium_cutover_trigger", "premium_cutover_watcher"),
         ("verification_log_flush_task", "verification_log_flush"),
+        ("verification_counter_flush_task", "verification_counter_flush"),
+        ("runtime_stats_log_task", "runtime_stats_log"),
+        ("event_loop_lag_monitor", "event_loop_lag_monitor"),
+        ("premium_prefetch_task", "premium_prefetch"),
+        ("stripe_status_refresh_task", "stripe_status_refresh"),
         ("sweep_entitlement_history", "entitlement_history_sweep"),
     ]:
         monkeypatch.setattr(bot, attr, make(name))
@@ -168,6 +174,7 @@ class TestStartBackgroundTask:
 class TestOnReadyReentry:
     EXPECTED = {
         "results_consumer",
+        "request_scheduler",
         "group_invite_results_consumer",
         "expired_pending_cleanup",
         "panel_nudge_sweep",
@@ -176,6 +183,11 @@ class TestOnReadyReentry:
         "instructions_trigger_watcher",
         "premium_cutover_watcher",
         "verification_log_flush",
+        "verification_counter_flush",
+        "runtime_stats_log",
+        "event_loop_lag_monitor",
+        "premium_prefetch",
+        "stripe_status_refresh",
         # run_once, like instruction_panel_refresh: it backfills the ever-paid
         # ledger from Discord's entitlement list and must not run again on
         # every gateway reconnect, which is the bug this whole class exists
@@ -1788,6 +1788,13 @@ class TestSettingsWriter:
             "panel_show_icon",
         }
 
+    def test_a_write_reaches_the_cached_config_at_once(self, subscribed):
+        """The verification path reads a cache; the save has to clear it."""
+        make_server()
+        assert bot.get_server_locale_code(GUILD_ID) == "en-US"
+        write({"instructions_locale": "de"})
+        assert bot.get_server_locale_code(GUILD_ID) == "de"
+
     def test_a_no_op_write_is_not_audited(self):
         """A form posting every field must not bury the one line that matters."""
         make_server(instructions_locale="en-US")
@@ -3143,9 +3150,9 @@ def member(administrator=True):
 @pytest.fixture(autouse=True)
 def clear_admin_cache():
     """Verdicts are cached, so they would otherwise leak between tests."""
-    bot._admin_check_cache._store.clear()
+    bot._admin_check_cache.clear()
     yield
-    bot._admin_check_cache._store.clear()
+    bot._admin_check_cache.clear()
 
 
 class TestAdminCheck:
@@ -3218,19 +3225,18 @@ class TestAdminCheck:
         current = member(administrator=True)
         fetches = []
         self.guild_with(monkeypatch, fetch_result=current, fetches=fetches)
+        now = [1000.0]
+        monkeypatch.setattr(bot._admin_check_cache, "clock", lambda: now[0])
 
         async def scenario():
             assert await bot.dashboard_is_admin(GUILD_ID, ADMIN_ID) is True
 
             current.guild_permissions.administrator = False
 
-            # Age the cached verdict past its TTL rather than deleting it, so
-            # this exercises _TTLCache's expiry branch — the thing that
+            # Move the clock past the TTL rather than deleting the entry, so
+            # this exercises the cache's expiry branch — the thing that
             # actually bounds how long a demoted admin keeps access.
-            store = bot._admin_check_cache._store
-            stale = asyncio.get_event_loop().time() - 1
-            for key, (_expires_at, value) in list(store.items()):
-                store[key] = (stale, value)
+            now[0] += bot._admin_check_cache.ttl + 1
 
             return await bot.dashboard_is_admin(GUILD_ID, ADMIN_ID)
 
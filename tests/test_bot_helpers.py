@@ -286,3 +286,78 @@ class TestVerificationCodeGeneration:
             assert len(body) == 6
             assert all(ch in string.ascii_uppercase + string.digits for ch in body)
             assert "O" not in body and "I" not in body
+
+
+# ---------------------------------------------------------------
+# LRU/TTL cache behind the member and admin lookups
+# ---------------------------------------------------------------
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUTTLCache:
+    def cache(self, maxsize=3, ttl=10, sweep_interval=60):
+        clock = FakeClock()
+        return bot.LRUTTLCache(maxsize, ttl, sweep_interval=sweep_interval, clock=clock), clock
+
+    def test_evicts_the_least_recently_used_not_the_oldest_insert(self):
+        cache, _ = self.cache(maxsize=2)
+        cache.set("hot", 1)
+        cache.set("cold", 2)
+        assert cache.get("hot") == 1  # "hot" is now the most recent
+        cache.set("new", 3)
+
+        assert cache.get("hot") == 1
+        assert cache.get("cold") is None
+        assert cache.evictions == 1
+
+    def test_entries_expire_even_when_read(self):
+        cache, clock = self.cache()
+        cache.set("k", "v")
+        clock.now = 9.9
+        assert cache.get("k") == "v"
+        clock.now = 10
+        assert cache.get("k") is None
+        assert cache.expirations == 1
+
+    def test_the_sweep_clears_entries_nobody_reads_again(self):
+        cache, clock = self.cache(maxsize=100, sweep_interval=30)
+        for key in range(5):
+            cache.set(key, key)
+        clock.now = 31
+        cache.set("fresh", 1)  # the first set past the interval sweeps
+
+        assert len(cache) == 1
+        assert cache.expirations == 5
+
+    def test_counters(self):
+        cache, _ = self.cache()
+        cache.set("k", "v")
+        cache.get("k")
+        cache.get("missing")
+        assert cache.stats() == {
+            "size": 1, "hits": 1, "misses": 1, "evictions": 0, "expirations": 0,
+        }
+
+    def test_a_cached_falsy_value_is_told_apart_by_default(self):
+        cache, _ = self.cache()
+        missing = object()
+        cache.set("k", None)
+        assert cache.get("k", missing) is None
+        assert cache.get("other", missing) is missing
+
+    def test_drop(self):
+        cache, _ = self.cache()
+        cache.set("k", "v")
+        cache.drop("k")
+        cache.drop("never-there")
+        assert cache.get("k") is None
+
+    def test_counters_are_in_the_runtime_stats_line(self):
+        snapshot = bot.runtime_stats.snapshot()
+        assert "member_cache_hits" in snapshot
+        assert "admin_cache_evictions" in snapshot
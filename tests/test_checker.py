@@ -11,9 +11,11 @@ VRChat account.
 """
 
 import json
+import time
 from types import SimpleNamespace
 
 import pytest
+import urllib3
 
 import vrc_online_checker as checker
 import vrc_session as vrcs
@@ -32,6 +34,7 @@ class FakeApiException(checker.ApiException):
         self.status = status
         self.reason = reason
         self.body = body
+        self.headers = None
 
 
 @pytest.fixture(autouse=True)
@@ -40,6 +43,16 @@ def no_status_page(monkeypatch):
     monkeypatch.setattr(vrcs, "fetch_status_summary", lambda force_refresh=False: None)
 
 
+@pytest.fixture(autouse=True)
+def fresh_breaker(monkeypatch):
+    """Failures one test provokes must not open the breaker for the next."""
+    monkeypatch.setattr(checker, "vrchat_breaker", vrcs.CircuitBreaker(5, 30.0))
+    monkeypatch.setattr(
+        checker, "profile_health", checker.EndpointHealth("/profile", 20, 10, 0.5, 300.0)
+    )
+    monkeypatch.setattr(checker, "profile_snapshots", checker.ProfileSnapshotCache(1000, 5.0))
+
+
 # ---------------------------------------------------------------
 # Bio code matching
 # ---------------------------------------------------------------
@@ -272,13 +285,284 @@ class TestFetchProfileSnapshot:
         assert result["display_name"] == "Fresh"
 
 
+class TestEndpointHealth:
+    """A broken /profile must stop costing every lookup a failed call."""
+
+    def health(self, window=4, min_samples=4, min_rate=0.5, interval=60.0):
+        clock = [0.0]
+        health = checker.EndpointHealth(
+            "/profile", window, min_samples, min_rate, interval, clock=lambda: clock[0]
+        )
+        return health, clock
+
+    def test_bypassed_once_the_window_is_mostly_failures(self):
+        health, _ = self.health()
+        for ok in (True, False, False, False):
+            assert health.should_try()
+            health.record(ok)
+        assert health.bypassed
+        assert not health.should_try()
+        assert health.snapshot()["bypassed_calls"] == 1
+
+    def test_not_judged_on_too_few_calls(self):
+        health, _ = self.health(min_samples=4)
+        for _ in range(3):
+            health.record(False)
+        assert not health.bypassed
+
+    def test_old_failures_slide_out_of_the_window(self):
+        health, _ = self.health(window=4, min_samples=4)
+        for ok in (False, False, True, True, True, True):
+            health.record(ok)
+        assert not health.bypassed
+
+    def test_one_probe_per_interval_and_a_good_one_restores(self):
+        health, clock = self.health(interval=60)
+        for _ in range(4):
+            health.record(False)
+        clock[0] = 59
+        assert not health.should_try()
+        clock[0] = 60
+        assert health.should_try(), "the probe"
+        assert not health.should_try(), "only one probe at a time"
+        health.record(True)
+        assert not health.bypassed
+        assert health.snapshot()["samples"] == 0, "restored with a clean record"
+
+    def test_a_bad_probe_waits_another_interval(self):
+        health, clock = self.health(interval=60)
+        for _ in range(4):
+            health.record(False)
+        clock[0] = 60
+        assert health.should_try()
+        health.record(False)
+        clock[0] = 119
+        assert not health.should_try()
+        clock[0] = 120
+        assert health.should_try()
+
+    def test_an_inconclusive_probe_hands_over_to_the_next_caller(self):
+        health, clock = self.health(interval=60)
+        for _ in range(4):
+            health.record(False)
+        clock[0] = 60
+        assert health.should_try()
+        health.record(None)
+        assert health.should_try()
+        assert health.bypassed
+
+    def test_snapshot_uses_route_vocabulary(self):
+        health, _ = self.health()
+        assert health.snapshot()["route"] == "preferred"
+        for _ in range(4):
+            health.record(False)
+        assert health.snapshot()["route"] == "bypassed"
+
+    def test_lookups_skip_a_bypassed_profile_endpoint(self, monkeypatch):
+        health, _ = self.health()
+        for _ in range(4):
+            health.record(False)
+        monkeypatch.setattr(checker, "profile_health", health)
+        monkeypatch.setattr(
+            checker, "_fetch_vrchat_profile", lambda c, u: pytest.fail("called a bypassed /profile")
+        )
+        user = SimpleNamespace(age_verification_status="18+", bio="b", display_name="U")
+        monkeypatch.setattr(checker.users_api, "UsersApi", fake_users_api(user))
+
+        *_, source = checker.fetch_profile_snapshot(object(), "usr_1")
+        assert source == "users"
+
+    def test_profile_outcomes_are_recorded(self, monkeypatch):
+        recorded = []
+        monkeypatch.setattr(checker.profile_health, "record", recorded.append)
+        user = SimpleNamespace(age_verification_status="18+", bio="b", display_name="U")
+        monkeypatch.setattr(checker.users_api, "UsersApi", fake_users_api(user))
+
+        monkeypatch.setattr(checker, "_fetch_vrchat_profile", lambda c, u: {"bio": "b", "ageVerificationStatus": "18+"})
+        checker.fetch_profile_snapshot(object(), "usr_1")
+        monkeypatch.setattr(checker, "_fetch_vrchat_profile", lambda c, u: {"bio": 5})
+        checker.fetch_profile_snapshot(object(), "usr_1")
+        monkeypatch.setattr(checker, "_fetch_vrchat_profile", lambda c, u: 1 / 0)
+        checker.fetch_profile_snapshot(object(), "usr_1")
+
+        assert recorded == [True, False, None]
+
+    @pytest.mark.parametrize(
+        "error, outcome",
+        [
+            (FakeApiException(404), False),
+            (json.JSONDecodeError("Expecting value", "<html>", 0), False),
+            (ValueError("/profile returned list, expected an object"), False),
+            (FakeApiException(503), None),
+            (FakeApiException(429), None),
+            (TimeoutError(), None),
+            (KeyError("bio"), None),
+        ],
+    )
+    def test_only_endpoint_failures_count_against_profile(
+        self, monkeypatch, error, outcome
+    ):
+        """A VRChat-wide outage must not route lookups around /profile for minutes."""
+        recorded = []
+        monkeypatch.setattr(checker.profile_health, "record", recorded.append)
+        user = SimpleNamespace(age_verification_status="18+", bio="b", display_name="U")
+        monkeypatch.setattr(checker.users_api, "UsersApi", fake_users_api(user))
+
+        def failing(client, vrc_user_id):
+            raise error
+
+        monkeypatch.setattr(checker, "_fetch_vrchat_profile", failing)
+        try:
+            checker.fetch_profile_snapshot(object(), "usr_1")
+        except type(error):
+            pass
+        assert recorded == [outcome]
+
+    def test_stats_report_the_route(self, monkeypatch):
+        stats = checker.lookup_stats()
+        assert stats["profile_route"] == "preferred"
+        assert stats["breaker_state"] == "closed"
+
+
+class TestProfileSnapshotCache:
+    """Repeated re-checks for one user cost one VRChat call, not one each."""
+
+    def cache(self, max_entries=3, ttl=5.0):
+        clock = [0.0]
+        return checker.ProfileSnapshotCache(max_entries, ttl, clock=lambda: clock[0]), clock
+
+    def test_a_fresh_entry_is_served_without_fetching(self):
+        cache, clock = self.cache()
+        assert cache.get_or_fetch("usr_1", lambda: "first") == "first"
+        clock[0] = 4.9
+        assert cache.get_or_fetch("usr_1", lambda: pytest.fail("refetched")) == "first"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_an_expired_entry_is_refetched(self):
+        cache, clock = self.cache(ttl=5)
+        cache.get_or_fetch("usr_1", lambda: "old")
+        clock[0] = 5
+        assert cache.get_or_fetch("usr_1", lambda: "new") == "new"
+
+    def test_least_recently_used_is_evicted(self):
+        cache, _ = self.cache(max_entries=2)
+        cache.get_or_fetch("a", lambda: 1)
+        cache.get_or_fetch("b", lambda: 2)
+        cache.get_or_fetch("a", lambda: pytest.fail("a was fresh"))
+        cache.get_or_fetch("c", lambda: 3)
+        assert cache.get_or_fetch("a", lambda: "refetched") == 1
+        assert cache.get_or_fetch("b", lambda: "refetched") == "refetched"
+
+    def test_failures_are_not_cached(self):
+        cache, _ = self.cache()
+        with pytest.raises(RuntimeError):
+            cache.get_or_fetch("usr_1", lambda: (_ for _ in ()).throw(RuntimeError("x")))
+        assert cache.get_or_fetch("usr_1", lambda: "ok") == "ok"
+
+    def test_ttl_zero_caches_nothing(self):
+        cache, _ = self.cache(ttl=0)
+        cache.get_or_fetch("usr_1", lambda: "a")
+        assert cache.get_or_fetch("usr_1", lambda: "b") == "b"
+
+    def test_non_string_keys_bypass(self):
+        cache, _ = self.cache()
+        assert cache.get_or_fetch(["usr_1"], lambda: "x") == "x"
+        assert cache.misses == 0
+
+    def test_concurrent_misses_share_one_call(self):
+        import threading
+
+        cache, _ = self.cache(ttl=0)
+        release = threading.Event()
+        calls = []
+
+        def slow_fetch():
+            calls.append(1)
+            release.wait(5)
+            return "shared"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_fetch("usr_1", slow_fetch)))
+            for _ in range(3)
+        ]
+        threads[0].start()
+        while not calls:
+            time.sleep(0.001)
+        for t in threads[1:]:
+            t.start()
+        while cache.shared < 2:
+            time.sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join(5)
+        assert calls == [1]
+        assert results == ["shared"] * 3
+
+    def test_a_failed_shared_call_fails_every_waiter(self):
+        import threading
+
+        cache, _ = self.cache()
+        release = threading.Event()
+        started = threading.Event()
+
+        def failing_fetch():
+            started.set()
+            release.wait(5)
+            raise TimeoutError("slow VRChat")
+
+        errors = []
+
+        def ask():
+            try:
+                cache.get_or_fetch("usr_1", failing_fetch)
+            except TimeoutError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=ask)
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=ask)
+        follower.start()
+        while cache.shared < 1:
+            time.sleep(0.001)
+        release.set()
+        leader.join(5)
+        follower.join(5)
+        assert len(errors) == 2
+
+    def test_rechecks_use_the_cache_and_code_checks_do_not(self, monkeypatch):
+        calls = []
+
+        class CountingUsersApi:
+            def __init__(self, client):
+                pass
+
+            def get_user(self, vrc_user_id, _request_timeout=None):
+                calls.append(vrc_user_id)
+                return SimpleNamespace(
+                    age_verification_status="18+", bio="VRC-ABC123", display_name="U"
+                )
+
+        monkeypatch.setattr(checker, "get_vrchat_session", lambda: (object(), None))
+        monkeypatch.setattr(checker.users_api, "UsersApi", CountingUsersApi)
+
+        checker.verify_and_build_result("d1", "usr_1", "g1", None)
+        checker.verify_and_build_result("d1", "usr_1", "g1", None)
+        assert len(calls) == 1, "a re-check seconds later reused the answer"
+
+        result = checker.verify_and_build_result("d1", "usr_1", "g1", "VRC-ABC123")
+        assert len(calls) == 2, "a code check always asks VRChat"
+        assert result["code_found"] is True
+
+
 class TestRetryCountFloor:
     """VRCHAT_LOOKUP_RETRIES counts total attempts, not extra retries.
 
-    Regression: at 0 both retry loops fell through without ever calling
-    VRChat. The profile loop hit a bogus "unreachable" AssertionError and
-    get_user returned None, which became bio="" / age="unknown" -- every
-    user reported "code not found" with lookup_ok=True, i.e. a silent lie.
+    Regression: at 0 the old in-place retry loops fell through without ever
+    calling VRChat, and every user was reported "code not found" with
+    lookup_ok=True -- a silent lie. Attempts are counted across deliveries
+    now, and the floor still guarantees the first one happens.
     """
 
     def test_module_config_is_floored(self):
@@ -288,7 +572,6 @@ class TestRetryCountFloor:
         assert checker.VRCHAT_LOOKUP_RETRIES >= 1
 
     def test_get_user_never_returns_none(self, monkeypatch):
-        monkeypatch.setattr(checker, "VRCHAT_LOOKUP_RETRIES", 0)
         calls = []
 
         class Api:
@@ -298,21 +581,279 @@ class TestRetryCountFloor:
                     age_verification_status="18+", bio="b", display_name="U"
                 )
 
-        result = checker._get_vrchat_user_with_retry(Api(), "usr_1")
+        result = checker._get_vrchat_user(Api(), "usr_1")
         assert calls == ["usr_1"]  # the API was actually called
         assert result is not None
 
-    def test_profile_lookup_still_runs(self, monkeypatch):
-        monkeypatch.setattr(checker, "VRCHAT_LOOKUP_RETRIES", 0)
-        calls = []
+    def test_a_single_attempt_budget_reports_instead_of_deferring(self, monkeypatch):
+        monkeypatch.setattr(checker, "VRCHAT_LOOKUP_RETRIES", 1)
+        monkeypatch.setattr(checker, "get_vrchat_session", lambda: (object(), None))
+        monkeypatch.setattr(checker.users_api, "UsersApi", failing_users_api(FakeApiException(503)))
+        result = checker.verify_and_build_result("d1", "usr_1", "g1", None, attempt=1)
+        assert result["lookup_ok"] is False
+
+
+class TestCircuitBreakerWiring:
+    """The breaker spans /profile and /users and answers with outage meta."""
+
+    @pytest.fixture
+    def tripped(self, monkeypatch):
+        breaker = vrcs.CircuitBreaker(1, 30.0, clock=lambda: 0.0)
+        breaker.record_failure()
+        monkeypatch.setattr(checker, "vrchat_breaker", breaker)
+        return breaker
+
+    def test_open_breaker_answers_without_calling_vrchat(self, monkeypatch, tripped):
+        class Boom:
+            def __init__(self, client):
+                pytest.fail("called VRChat with the breaker open")
+
+        monkeypatch.setattr(checker, "get_vrchat_session", lambda: (object(), None))
+        monkeypatch.setattr(checker, "_fetch_vrchat_profile", lambda c, u: pytest.fail("called /profile"))
+        monkeypatch.setattr(checker.users_api, "UsersApi", Boom)
+
+        result = checker.verify_and_build_result("d1", "usr_1", "g1", "VRC-ABC123", attempt=1)
+
+        assert result["lookup_ok"] is False
+        assert result["vrchat_outage"] is True
+        assert result["error_type"] == "vrchat_upstream_error"
+        assert tripped.short_circuited == 1
+
+    def test_transient_failures_open_it(self, monkeypatch):
+        breaker = vrcs.CircuitBreaker(2, 30.0)
+        monkeypatch.setattr(checker, "vrchat_breaker", breaker)
+        monkeypatch.setattr(checker, "VRCHAT_LOOKUP_RETRIES", 1)
+        monkeypatch.setattr(checker, "get_vrchat_session", lambda: (object(), None))
+        monkeypatch.setattr(checker.users_api, "UsersApi", failing_users_api(FakeApiException(503)))
+
+        for _ in range(2):
+            checker.verify_and_build_result("d1", "usr_1", "g1", None)
+        assert breaker.state == breaker.OPEN
+
+    def test_a_not_found_counts_as_vrchat_being_up(self, monkeypatch):
+        breaker = vrcs.CircuitBreaker(2, 30.0)
+        monkeypatch.setattr(checker, "vrchat_breaker", breaker)
+        monkeypatch.setattr(checker, "get_vrchat_session", lambda: (object(), None))
+        breaker.record_failure()
+        monkeypatch.setattr(checker.users_api, "UsersApi", failing_users_api(FakeApiException(404)))
+        checker.verify_and_build_result("d1", "usr_1", "g1", None)
+        breaker.record_failure()
+        assert breaker.state == breaker.CLOSED
+
+    def test_a_bug_here_counts_as_vrchat_being_up(self, monkeypatch):
+        breaker = vrcs.CircuitBreaker(2, 30.0)
+        monkeypatch.setattr(checker, "vrchat_breaker", breaker)
+        monkeypatch.setattr(checker, "get_vrchat_session", lambda: (object(), None))
+        breaker.record_failure()
+        monkeypatch.setattr(checker.users_api, "UsersApi", failing_users_api(KeyError("bio")))
+        checker.verify_and_build_result("d1", "usr_1", "g1", None)
+        breaker.record_failure()
+        assert breaker.state == breaker.CLOSED
+
+    def test_a_successful_probe_resumes_lookups(self, monkeypatch):
+        clock = [0.0]
+        breaker = vrcs.CircuitBreaker(1, 30.0, clock=lambda: clock[0])
+        breaker.record_failure()
+        monkeypatch.setattr(checker, "vrchat_breaker", breaker)
+        monkeypatch.setattr(checker, "get_vrchat_session", lambda: (object(), None))
+        user = SimpleNamespace(age_verification_status="18+", bio="b", display_name="U")
+        monkeypatch.setattr(checker.users_api, "UsersApi", fake_users_api(user))
+
+        clock[0] = 30.0
+        result = checker.verify_and_build_result("d1", "usr_1", "g1", None)
+
+        assert result["lookup_ok"] is True
+        assert breaker.state == breaker.CLOSED
+
+
+def failing_users_api(error):
+    class FailingUsersApi:
+        def __init__(self, client):
+            pass
+
+        def get_user(self, vrc_user_id, _request_timeout=None):
+            raise error
+
+    return FailingUsersApi
 
-        def fake_fetch(client, uid):
-            calls.append(uid)
-            return {"bio": "b", "ageVerificationStatus": "18+"}
 
-        monkeypatch.setattr(checker, "_fetch_vrchat_profile", fake_fetch)
-        assert checker._get_vrchat_profile_with_retry(object(), "usr_1")
-        assert calls == ["usr_1"]
+class TestDelayedRetries:
+    """Transient VRChat failures go to a retry queue instead of a sleep.
+
+    Motivation: a 429 or 503 storm used to put every lookup thread to sleep
+    for the backoff, freezing verification for everyone at once.
+    """
+
+    @pytest.fixture(autouse=True)
+    def no_sleeping(self, monkeypatch):
+        monkeypatch.setattr(
+            checker.time, "sleep", lambda s: pytest.fail("a lookup slept on a worker")
+        )
+
+    @pytest.fixture
+    def failing_vrchat(self, monkeypatch):
+        def install(error):
+            monkeypatch.setattr(checker, "get_vrchat_session", lambda: (object(), None))
+            monkeypatch.setattr(checker.users_api, "UsersApi", failing_users_api(error))
+
+        return install
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            FakeApiException(429),
+            FakeApiException(503),
+            TimeoutError(),
+            ConnectionResetError(),
+            urllib3.exceptions.ReadTimeoutError(None, "/profile", "read timed out"),
+            urllib3.exceptions.MaxRetryError(None, "/profile"),
+        ],
+    )
+    def test_transient_failures_defer(self, failing_vrchat, monkeypatch, error):
+        monkeypatch.setattr(checker, "VRCHAT_LOOKUP_RETRIES", 3)
+        failing_vrchat(error)
+        with pytest.raises(checker.RetryLater) as raised:
+            checker.verify_and_build_result("d1", "usr_1", "g1", None, attempt=1)
+        assert raised.value.delay == checker.retry_delay(1)
+
+    def test_permanent_failures_report_at_once(self, failing_vrchat, monkeypatch):
+        monkeypatch.setattr(checker, "VRCHAT_LOOKUP_RETRIES", 3)
+        failing_vrchat(FakeApiException(404))
+        result = checker.verify_and_build_result("d1", "usr_1", "g1", None, attempt=1)
+        assert result["lookup_ok"] is False
+
+    @pytest.mark.parametrize("error", [KeyError("bio"), TypeError(), AttributeError()])
+    def test_a_bug_here_is_not_retried(self, failing_vrchat, monkeypatch, error):
+        """It would fail the same way every time; VRChat was never the problem."""
+        monkeypatch.setattr(checker, "VRCHAT_LOOKUP_RETRIES", 3)
+        failing_vrchat(error)
+        result = checker.verify_and_build_result("d1", "usr_1", "g1", None, attempt=1)
+        assert result["lookup_ok"] is False
+
+    def test_a_transient_profile_failure_defers_instead_of_reading_users(
+        self, monkeypatch
+    ):
+        """/users would answer with its stale bio and fail a member whose code is there."""
+        monkeypatch.setattr(checker, "VRCHAT_LOOKUP_RETRIES", 3)
+        monkeypatch.setattr(checker, "VRCHAT_USE_PROFILE_ENDPOINT", True)
+        monkeypatch.setattr(checker, "get_vrchat_session", lambda: (object(), None))
+
+        def unavailable(client, vrc_user_id):
+            raise FakeApiException(503)
+
+        monkeypatch.setattr(checker, "_fetch_vrchat_profile", unavailable)
+        monkeypatch.setattr(
+            checker.users_api,
+            "UsersApi",
+            lambda client: pytest.fail("fell back to /users on a transient error"),
+        )
+        with pytest.raises(checker.RetryLater):
+            checker.verify_and_build_result("d1", "usr_1", "g1", "VRC-ABC123", attempt=1)
+
+    def test_the_last_attempt_reports_the_failure(self, failing_vrchat, monkeypatch):
+        monkeypatch.setattr(checker, "VRCHAT_LOOKUP_RETRIES", 3)
+        failing_vrchat(FakeApiException(503))
+        result = checker.verify_and_build_result("d1", "usr_1", "g1", None, attempt=3)
+        assert result["lookup_ok"] is False
+
+    def test_delays_follow_the_ladder_and_repeat_the_last(self, monkeypatch):
+        monkeypatch.setattr(checker, "VRCHAT_RETRY_DELAYS_SECONDS", (2.0, 5.0))
+        assert [checker.retry_delay(n) for n in (1, 2, 3, 9)] == [2.0, 5.0, 5.0, 5.0]
+
+    def test_retry_queue_dead_letters_into_the_request_queue(self):
+        args = checker.retry_queue_arguments(5.0)
+        assert args == {
+            "x-message-ttl": 5000,
+            "x-dead-letter-exchange": "",
+            "x-dead-letter-routing-key": checker.RABBITMQ_QUEUE_NAME,
+        }
+        assert checker.retry_queue_name(5.0) != checker.retry_queue_name(2.0)
+
+    @pytest.mark.parametrize(
+        "headers,expected",
+        [(None, 1), ({}, 1), ({checker.RETRY_ATTEMPT_HEADER: 2}, 2), ({checker.RETRY_ATTEMPT_HEADER: "x"}, 1)],
+    )
+    def test_attempt_comes_from_the_header(self, headers, expected):
+        assert checker.request_attempt(SimpleNamespace(headers=headers)) == expected
+        assert checker.request_attempt(None) == 1
+
+    def test_a_deferred_request_is_republished_then_acked(self, failing_vrchat, monkeypatch):
+        monkeypatch.setattr(checker, "VRCHAT_LOOKUP_RETRIES", 3)
+        failing_vrchat(FakeApiException(429))
+        published = []
+        monkeypatch.setattr(
+            checker, "_publish_on_fresh_connection",
+            lambda queue, body, properties, arguments=None: published.append(
+                (queue, body, properties, arguments)
+            ),
+        )
+        monkeypatch.setattr(
+            checker, "send_verification_result", lambda r: pytest.fail("reported a retryable failure")
+        )
+        channel = RecordingChannel()
+        body = json.dumps({"discordID": "1", "vrcUserID": "usr_1", "guildID": "g"})
+        properties = SimpleNamespace(
+            headers={checker.RETRY_ATTEMPT_HEADER: 2}, priority=4, content_type="application/json"
+        )
+
+        checker.process_verification_request(
+            channel, SimpleNamespace(delivery_tag=5), properties, body
+        )
+
+        assert channel.acks == [5]
+        [(queue, sent_body, sent_properties, arguments)] = published
+        assert queue == checker.retry_queue_name(checker.retry_delay(2))
+        assert arguments == checker.retry_queue_arguments(checker.retry_delay(2))
+        assert sent_body == body
+        assert sent_properties.headers[checker.RETRY_ATTEMPT_HEADER] == 3
+        assert sent_properties.priority == 4, "a premium request must stay premium"
+
+    def test_the_retry_copy_keeps_every_property_but_expiration(self, monkeypatch):
+        published = []
+        monkeypatch.setattr(
+            checker, "_publish_on_fresh_connection",
+            lambda queue, body, properties, arguments=None: published.append(properties),
+        )
+        properties = checker.pika.BasicProperties(
+            content_type="application/json",
+            delivery_mode=2,
+            priority=5,
+            correlation_id="corr-1",
+            message_id="msg-1",
+            timestamp=1760000000,
+            app_id="vrcverify-bot",
+            expiration="600000",
+            headers={"x-other": "kept"},
+        )
+
+        checker.schedule_retry("{}", properties, attempt=1, delay=2.0)
+
+        [sent] = published
+        assert (sent.correlation_id, sent.message_id, sent.timestamp, sent.app_id) == (
+            "corr-1", "msg-1", 1760000000, "vrcverify-bot"
+        )
+        assert sent.priority == 5
+        assert sent.headers == {"x-other": "kept", checker.RETRY_ATTEMPT_HEADER: 2}
+        # The retry queue's TTL is the delay; a leftover expiration must not race it.
+        assert sent.expiration is None
+        assert properties.headers == {"x-other": "kept"}, "the original is untouched"
+
+    def test_a_failed_retry_publish_requeues_the_original(self, failing_vrchat, monkeypatch):
+        from pika.exceptions import AMQPError
+
+        monkeypatch.setattr(checker, "VRCHAT_LOOKUP_RETRIES", 3)
+        failing_vrchat(FakeApiException(429))
+
+        def broker_down(*a, **k):
+            raise AMQPError("broker down")
+
+        monkeypatch.setattr(checker, "_publish_on_fresh_connection", broker_down)
+        channel = RecordingChannel()
+        checker.process_verification_request(
+            channel, SimpleNamespace(delivery_tag=6), None, b'{"vrcUserID": "usr_1"}'
+        )
+        assert channel.acks == []
+        assert channel.nacks == [(6, True)]
 
 
 class TestVerifyAndBuildResult:
@@ -360,3 +901,160 @@ class TestVerifyAndBuildResult:
         result = checker.verify_and_build_result("d1", "usr_nonebio", "g1", "VRC-ABC123")
         assert result["is_18_plus"] is True
         assert result["code_found"] is False
+
+
+# ---------------------------------------------------------------
+# Concurrent lookups
+# ---------------------------------------------------------------
+class FakeConnection:
+    """Records what workers ask to run on the consumer thread."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def add_callback_threadsafe(self, callback):
+        self.callbacks.append(callback)
+
+    def run_pending(self):
+        while self.callbacks:
+            self.callbacks.pop(0)()
+
+
+class RecordingChannel:
+    def __init__(self):
+        self.acks = []
+        self.nacks = []
+
+    def basic_ack(self, delivery_tag):
+        self.acks.append(delivery_tag)
+
+    def basic_nack(self, delivery_tag, requeue=True):
+        self.nacks.append((delivery_tag, requeue))
+
+
+class TestThreadsafeChannel:
+    def test_acks_wait_for_the_consumer_thread(self):
+        conn, channel = FakeConnection(), RecordingChannel()
+        proxy = checker.ThreadsafeChannel(conn, channel)
+        proxy.basic_ack(delivery_tag=5)
+        proxy.basic_nack(delivery_tag=6, requeue=False)
+        # Nothing touches the channel from the worker itself.
+        assert channel.acks == [] and channel.nacks == []
+        conn.run_pending()
+        assert channel.acks == [5]
+        assert channel.nacks == [(6, False)]
+
+    def test_a_closed_connection_drops_the_ack_instead_of_raising(self):
+        class Closed:
+            def add_callback_threadsafe(self, callback):
+                raise checker.pika.exceptions.ConnectionWrongStateError("closed")
+
+        checker.ThreadsafeChannel(Closed(), RecordingChannel()).basic_ack(delivery_tag=1)
+
+
+class TestDispatch:
+    def test_requests_run_on_the_pool_and_ack_on_the_consumer_thread(self, monkeypatch):
+        import threading
+
+        consumer_thread = threading.get_ident()
+        worker_threads = []
+
+        def fake_verify(**kwargs):
+            worker_threads.append(threading.get_ident())
+            return checker._result_payload(
+                kwargs["discord_id"], kwargs["vrc_user_id"], kwargs["guild_id"], None
+            )
+
+        monkeypatch.setattr(checker, "verify_and_build_result", fake_verify)
+        monkeypatch.setattr(checker, "send_verification_result", lambda result: None)
+        conn, channel = FakeConnection(), RecordingChannel()
+        body = json.dumps({"discordID": "1", "vrcUserID": "usr_1", "guildID": "g"})
+
+        monkeypatch.setattr(checker, "_lookup_pool", None)
+        checker.dispatch_verification_request(
+            conn, channel, SimpleNamespace(delivery_tag=9), None, body
+        )
+        checker.lookup_pool().shutdown(wait=True)
+        monkeypatch.setattr(checker, "_lookup_pool", None)
+
+        assert worker_threads and worker_threads[0] != consumer_thread
+        assert channel.acks == []
+        conn.run_pending()
+        assert channel.acks == [9]
+
+    def test_lookups_overlap_up_to_the_concurrency(self, monkeypatch):
+        import threading
+
+        monkeypatch.setattr(checker, "VRCHAT_LOOKUP_CONCURRENCY", 3)
+        monkeypatch.setattr(checker, "_lookup_pool", None)
+        all_started = threading.Barrier(3, timeout=5)
+
+        def slow_verify(**kwargs):
+            # Only returns if three lookups are in flight at the same time.
+            all_started.wait()
+            return checker._result_payload(None, None, None, None)
+
+        monkeypatch.setattr(checker, "verify_and_build_result", slow_verify)
+        monkeypatch.setattr(checker, "send_verification_result", lambda result: None)
+        conn, channel = FakeConnection(), RecordingChannel()
+        for tag in range(3):
+            checker.dispatch_verification_request(
+                conn, channel, SimpleNamespace(delivery_tag=tag), None, b"{}"
+            )
+        checker.lookup_pool().shutdown(wait=True)
+        monkeypatch.setattr(checker, "_lookup_pool", None)
+        conn.run_pending()
+        assert sorted(channel.acks) == [0, 1, 2]
+
+
+
+class TestExpiredRequests:
+    """A request past the bot's expiresAt is dropped before any VRChat call."""
+
+    def body(self, **stamps):
+        return json.dumps(
+            {"discordID": "1", "vrcUserID": "usr_1", "guildID": "g", "verificationCode": "VRC-ABC123", **stamps}
+        )
+
+    def process(self, monkeypatch, body):
+        looked_up = []
+        monkeypatch.setattr(
+            checker, "verify_and_build_result", lambda **kw: looked_up.append(kw) or {}
+        )
+        monkeypatch.setattr(checker, "send_verification_result", lambda result: None)
+        channel = RecordingChannel()
+        checker.process_verification_request(channel, SimpleNamespace(delivery_tag=7), None, body)
+        return channel, looked_up
+
+    def test_an_expired_request_is_acked_and_counted_without_a_lookup(self, monkeypatch):
+        monkeypatch.setattr(checker, "expired_requests_dropped", 0)
+        channel, looked_up = self.process(
+            monkeypatch,
+            self.body(enqueuedAt="2020-01-01T09:50:00+00:00", expiresAt="2020-01-01T10:00:00+00:00"),
+        )
+        assert looked_up == []
+        assert channel.acks == [7] and channel.nacks == []
+        assert checker.lookup_stats()["expired_requests_dropped"] == 1
+
+    def test_a_live_request_is_looked_up(self, monkeypatch):
+        channel, looked_up = self.process(monkeypatch, self.body(expiresAt="2999-01-01T00:00:00+00:00"))
+        assert len(looked_up) == 1
+        assert channel.acks == [7]
+
+    def test_an_unstamped_request_is_looked_up(self, monkeypatch):
+        """Sent by a bot from before the stamps; nothing says it is stale."""
+        _, looked_up = self.process(monkeypatch, self.body())
+        assert len(looked_up) == 1
+
+    @pytest.mark.parametrize("stamp", ["yesterday", 12345, None])
+    def test_an_unreadable_stamp_is_not_expired(self, stamp):
+        assert checker.request_expired({"expiresAt": stamp}) is False
+
+    def test_the_grace_absorbs_clock_skew(self, monkeypatch):
+        monkeypatch.setattr(checker, "REQUEST_EXPIRY_GRACE_SECONDS", 5)
+        from datetime import datetime, timezone
+
+        now = datetime(2026, 10, 17, 10, 0, 4, tzinfo=timezone.utc)
+        data = {"expiresAt": "2026-10-17T10:00:00+00:00"}
+        assert checker.request_expired(data, now=now) is False
+        assert checker.request_expired(data, now=now.replace(second=6)) is True
@@ -0,0 +1,212 @@
+"""Database work runs on the DB threads, not the event loop.
+
+The interaction handlers and the result consumer used to open session_scope
+inline, so every query stalled the whole gateway connection for as long as the
+database took to answer. These pin down the replacement: run_db hands the
+work to the bounded DB pool and awaits it, the helpers it runs return plain
+values, and the loop-lag monitor notices when something blocks the loop
+anyway.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import bot
+
+GUILD_ID = "123456789"
+CODE = "VRC-OFFL01"
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class NaiveNowDatetime(datetime):
+    """SQLite hands back naive datetimes; compare against a naive now."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return datetime.now()
+
+
+@pytest.fixture(autouse=True)
+def clean_db(monkeypatch):
+    monkeypatch.setattr(bot, "datetime", NaiveNowDatetime)
+
+    def wipe():
+        with bot.session_scope() as session:
+            session.query(bot.PendingVerification).delete()
+            session.query(bot.User).delete()
+            session.query(bot.Server).delete()
+
+    wipe()
+    yield
+    wipe()
+
+
+def add_pending(expires_in_minutes=5):
+    with bot.session_scope() as session:
+        session.add(
+            bot.PendingVerification(
+                discord_id="555",
+                guild_id=GUILD_ID,
+                vrc_user_id="usr_x",
+                verification_code=CODE,
+                expires_at=datetime.now() + timedelta(minutes=expires_in_minutes),
+            )
+        )
+
+
+class TestRunDb:
+    def test_runs_off_the_loop_thread(self):
+        async def go():
+            return threading.get_ident(), await bot.run_db(threading.get_ident)
+
+        loop_thread, db_thread = run(go())
+        assert db_thread != loop_thread
+
+    def test_passes_arguments_and_returns_the_result(self):
+        assert run(bot.run_db(lambda a, b=0: a + b, 2, b=3)) == 5
+
+    def test_errors_reach_the_awaiting_handler(self):
+        def boom():
+            raise ValueError("db said no")
+
+        with pytest.raises(ValueError):
+            run(bot.run_db(boom))
+
+    def test_in_memory_sqlite_uses_one_shared_connection(self):
+        # Every DB thread must see the same in-memory database, or a row
+        # written by one handler would be invisible to the next.
+        assert bot.DB_THREADS == 1
+        with bot.session_scope() as session:
+            session.add(bot.User(discord_id="777", verification_status=True))
+
+        def read():
+            with bot.session_scope() as session:
+                return session.query(bot.User).filter_by(discord_id="777").count()
+
+        assert run(bot.run_db(read)) == 1
+
+
+class TestSettlePendingVerification:
+    def settle(self, code_found=True, is_18_plus=True):
+        return bot.settle_pending_verification(
+            "555", GUILD_ID, CODE, code_found, "usr_x", is_18_plus
+        )
+
+    def test_missing(self):
+        assert self.settle() == bot.PENDING_MISSING
+
+    def test_expired_is_deleted(self):
+        add_pending(expires_in_minutes=-1)
+        assert self.settle() == bot.PENDING_EXPIRED
+        with bot.session_scope() as session:
+            assert session.query(bot.PendingVerification).count() == 0
+
+    def test_code_not_found_keeps_the_pending_row_for_a_retry(self):
+        add_pending()
+        assert self.settle(code_found=False) == bot.PENDING_CODE_NOT_FOUND
+        with bot.session_scope() as session:
+            assert session.query(bot.PendingVerification).count() == 1
+
+    def test_settled_creates_the_user_and_drops_the_pending_row(self):
+        add_pending()
+        assert self.settle() == bot.PENDING_SETTLED
+        with bot.session_scope() as session:
+            user = session.query(bot.User).filter_by(discord_id="555").one()
+            assert (user.vrc_user_id, user.verification_status) == ("usr_x", True)
+            assert session.query(bot.PendingVerification).count() == 0
+
+
+class TestRecordRecheckResult:
+    def test_no_user_row(self):
+        assert bot.record_recheck_result("555", True, "usr_x") is False
+
+    def test_updates_status_and_keeps_the_old_id_when_none_is_sent(self):
+        with bot.session_scope() as session:
+            session.add(bot.User(discord_id="555", vrc_user_id="usr_old", verification_status=False))
+
+        assert bot.record_recheck_result("555", True, None) is True
+        with bot.session_scope() as session:
+            user = session.query(bot.User).filter_by(discord_id="555").one()
+            assert (user.vrc_user_id, user.verification_status) == ("usr_old", True)
+
+
+class TestLoopLag:
+    def test_take_worst_reports_the_period_peak_then_resets(self):
+        monitor = bot.LoopLagMonitor()
+        monitor.observe(0.2)
+        monitor.observe(0.01)
+
+        assert monitor.take_worst() == pytest.approx(0.2)
+        assert monitor.take_worst() == pytest.approx(0.01), "a new period starts at the latest sample"
+
+    def test_a_blocking_call_shows_up_as_lag(self, monkeypatch):
+        monitor = bot.LoopLagMonitor()
+        monkeypatch.setattr(bot, "loop_lag", monitor)
+
+        async def go():
+            task = asyncio.create_task(bot.event_loop_lag_monitor(0.01))
+            await asyncio.sleep(0)
+            time.sleep(0.15)  # what an inline query does to the loop
+            await asyncio.sleep(0.05)
+            task.cancel()
+
+        run(go())
+        assert monitor.take_worst() >= 0.1
+
+    def test_gauges_are_in_the_runtime_stats_line(self):
+        snapshot = bot.runtime_stats.snapshot()
+        assert "event_loop_lag_ms" in snapshot
+        assert "event_loop_lag_max_ms" in snapshot
+
+
+class TestConnectionPool:
+    def test_a_server_database_gets_the_configured_pool(self):
+        options = bot._engine_options("postgresql://bot@db/vrcverify")
+        assert options["poolclass"] is bot.TimedQueuePool
+        assert options["pool_size"] == bot.DB_POOL_SIZE
+        assert options["max_overflow"] == bot.DB_MAX_OVERFLOW
+        assert options["pool_pre_ping"] is True
+
+    def test_in_memory_sqlite_keeps_its_single_connection(self):
+        assert bot._engine_options("sqlite:///:memory:")["poolclass"] is bot.StaticPool
+
+    @pytest.fixture
+    def tiny_pool(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(bot, "runtime_stats", bot.RuntimeStats())
+        monkeypatch.setattr(bot, "pool_waits", bot.DurationMonitor())
+        engine = bot.create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=bot.TimedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+        )
+        bot._register_pool_stats(engine.pool)
+        yield engine
+        engine.dispose()
+
+    def test_occupancy_is_in_the_runtime_stats_line(self, tiny_pool):
+        with tiny_pool.connect():
+            snapshot = bot.runtime_stats.snapshot()
+        assert snapshot["db_pool_size"] == 1
+        assert snapshot["db_pool_checked_out"] == 1
+        assert snapshot["db_pool_overflow"] == 0
+
+    def test_an_exhausted_pool_shows_up_as_wait_and_timeouts(self, tiny_pool):
+        from sqlalchemy.exc import TimeoutError as PoolTimeout
+
+        with tiny_pool.connect():
+            with pytest.raises(PoolTimeout):
+                tiny_pool.connect()
+
+        assert bot.runtime_stats.get("db_pool_checkout_timeouts") == 1
+        snapshot = bot.runtime_stats.snapshot()
+        assert snapshot["db_pool_wait_max_ms"] >= 50
+        assert bot.runtime_stats.snapshot()["db_pool_wait_max_ms"] == 0, "a new period starts"
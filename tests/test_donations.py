@@ -12,6 +12,7 @@ Covers:
 """
 
 import asyncio
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from types import SimpleNamespace
@@ -191,6 +192,11 @@ class TestSetupConfirmationHint:
 # ---------------------------------------------------------------
 # record_guild_verification: counting + one-time milestone DM
 # ---------------------------------------------------------------
+def flush():
+    """Write the counter buffer, as the flush task would."""
+    run(bot.flush_verification_counters())
+
+
 class TestRecordGuildVerification:
     def test_counts_each_verification_below_threshold(
         self, clean_servers, dm_spy, owner_member, monkeypatch
@@ -200,6 +206,7 @@ class TestRecordGuildVerification:
         guild = fake_guild()
         run(bot.record_guild_verification(GUILD_ID, guild))
         run(bot.record_guild_verification(GUILD_ID, guild))
+        flush()
         count, sent = get_counts()
         assert count == 2
         assert sent is False
@@ -213,6 +220,7 @@ class TestRecordGuildVerification:
         guild = fake_guild()
         for _ in range(5):
             run(bot.record_guild_verification(GUILD_ID, guild))
+        flush()
 
         count, sent = get_counts()
         assert count == 5
@@ -233,6 +241,7 @@ class TestRecordGuildVerification:
         monkeypatch.setattr(bot, "MILESTONE_VERIFICATION_COUNT", 1)
         make_server(instructions_locale="de")
         run(bot.record_guild_verification(GUILD_ID, fake_guild()))
+        flush()
         assert dm_spy[0].locale == "de"
 
     def test_falls_back_to_guild_owner_when_admin_left(
@@ -247,6 +256,7 @@ class TestRecordGuildVerification:
         make_server()
         guild_owner = SimpleNamespace(id=999, name="guild-owner")
         run(bot.record_guild_verification(GUILD_ID, fake_guild(owner=guild_owner)))
+        flush()
         assert len(dm_spy) == 1
         assert dm_spy[0].member is guild_owner
 
@@ -261,6 +271,7 @@ class TestRecordGuildVerification:
         monkeypatch.setattr(bot, "fetch_member_cached", nobody)
         make_server()
         run(bot.record_guild_verification(GUILD_ID, fake_guild(owner=None)))
+        flush()
         _, sent = get_counts()
         assert sent is True
         assert dm_spy == []
@@ -271,6 +282,7 @@ class TestRecordGuildVerification:
         monkeypatch.setattr(bot, "MILESTONE_VERIFICATION_COUNT", 1)
         make_server()
         run(bot.record_guild_verification(GUILD_ID, None))
+        flush()
         count, sent = get_counts()
         assert count == 1
         assert sent is True  # milestone consumed; never re-fires later
@@ -282,17 +294,20 @@ class TestRecordGuildVerification:
         monkeypatch.setattr(bot, "MILESTONE_VERIFICATION_COUNT", 3)
         make_server(verification_count=10, milestone_dm_sent=True)
         run(bot.record_guild_verification(GUILD_ID, fake_guild()))
+        flush()
         count, _ = get_counts()
         assert count == 11
         assert dm_spy == []
 
     def test_unknown_guild_row_is_noop(self, clean_servers, dm_spy, owner_member):
         run(bot.record_guild_verification(GUILD_ID, fake_guild()))
+        flush()
         assert dm_spy == []
 
     def test_empty_guild_id_is_noop(self, clean_servers, dm_spy, owner_member):
         run(bot.record_guild_verification("", fake_guild()))
         run(bot.record_guild_verification(None, fake_guild()))
+        flush()
         assert dm_spy == []
 
     def test_missing_columns_skips_counting(
@@ -302,6 +317,7 @@ class TestRecordGuildVerification:
         monkeypatch.setattr(bot, "server_has_column", lambda name: False)
         make_server()
         run(bot.record_guild_verification(GUILD_ID, fake_guild()))
+        flush()
         count, sent = get_counts()
         assert count == 0
         assert sent is False
@@ -318,9 +334,124 @@ class TestRecordGuildVerification:
 
         monkeypatch.setattr(bot, "session_scope", broken_scope)
         run(bot.record_guild_verification(GUILD_ID, fake_guild()))  # must not raise
+        flush()  # must not raise
         assert dm_spy == []
 
 
+class TestTheCounterBuffer:
+    """Counts are written in one flush per interval, and the milestone stays
+    exact however the verifications were batched."""
+
+    def test_nothing_is_written_until_the_flush(self, clean_servers, dm_spy, owner_member):
+        make_server()
+        run(bot.record_guild_verification(GUILD_ID, fake_guild()))
+        assert get_counts() == (0, False)
+        flush()
+        assert get_counts() == (1, False)
+
+    def test_a_batch_that_crosses_from_past_the_line_reports_where_it_crossed(
+        self, clean_servers, dm_spy, owner_member, monkeypatch
+    ):
+        """A guild already past the threshold with the flag unset DMs at its
+        first verification, exactly as one-at-a-time counting would have."""
+        monkeypatch.setattr(bot, "MILESTONE_VERIFICATION_COUNT", 3)
+        make_server(verification_count=7)
+        for _ in range(4):
+            run(bot.record_guild_verification(GUILD_ID, fake_guild()))
+        flush()
+        assert get_counts() == (11, True)
+        assert dm_spy[0].kwargs["count"] == 8
+
+    def test_the_milestone_fires_once_across_flushes(
+        self, clean_servers, dm_spy, owner_member, monkeypatch
+    ):
+        monkeypatch.setattr(bot, "MILESTONE_VERIFICATION_COUNT", 3)
+        make_server()
+        for _ in range(3):
+            run(bot.record_guild_verification(GUILD_ID, fake_guild()))
+            flush()
+        run(bot.record_guild_verification(GUILD_ID, fake_guild()))
+        flush()
+        assert get_counts() == (4, True)
+        assert [call.kwargs["count"] for call in dm_spy] == [3]
+
+    def test_a_failed_flush_keeps_the_counts_and_the_guild(
+        self, clean_servers, dm_spy, owner_member, monkeypatch
+    ):
+        monkeypatch.setattr(bot, "MILESTONE_VERIFICATION_COUNT", 2)
+        make_server()
+        real_write = bot.write_verification_totals
+
+        def broken(totals):
+            raise RuntimeError("db down")
+
+        run(bot.record_guild_verification(GUILD_ID, fake_guild()))
+        monkeypatch.setattr(bot, "write_verification_totals", broken)
+        flush()
+        monkeypatch.setattr(bot, "write_verification_totals", real_write)
+        run(bot.record_guild_verification(GUILD_ID, None))
+        flush()
+        assert get_counts() == (2, True)
+        assert len(dm_spy) == 1, "the guild from before the failure still gets its DM"
+
+    def test_only_a_flush_that_wrote_is_counted(
+        self, clean_servers, dm_spy, owner_member, monkeypatch
+    ):
+        make_server()
+        real_write = bot.write_verification_totals
+
+        def broken(totals):
+            raise RuntimeError("db down")
+
+        flushes = bot.runtime_stats.get("verification_count_flushes")
+        run(bot.record_guild_verification(GUILD_ID, fake_guild()))
+        monkeypatch.setattr(bot, "write_verification_totals", broken)
+        flush()
+        assert bot.runtime_stats.get("verification_count_flushes") == flushes
+        monkeypatch.setattr(bot, "write_verification_totals", real_write)
+        flush()
+        assert bot.runtime_stats.get("verification_count_flushes") == flushes + 1
+
+    def test_the_schema_is_inspected_off_the_event_loop(
+        self, clean_servers, dm_spy, owner_member, monkeypatch
+    ):
+        """Reflecting `servers` is a database round trip; the loop must not wait on it."""
+        make_server()
+        inspected_on = []
+        monkeypatch.setattr(
+            bot,
+            "server_has_column",
+            lambda name: inspected_on.append(threading.current_thread()) or True,
+        )
+        run(bot.record_guild_verification(GUILD_ID, fake_guild()))
+        flush()
+        assert inspected_on
+        assert threading.main_thread() not in inspected_on
+
+    def test_zero_interval_writes_through(self, clean_servers, dm_spy, owner_member, monkeypatch):
+        monkeypatch.setattr(bot, "VERIFICATION_COUNTER_FLUSH_SECONDS", 0)
+        make_server()
+        run(bot.record_guild_verification(GUILD_ID, fake_guild()))
+        assert get_counts() == (1, False)
+
+    def test_shutdown_flushes_what_is_buffered(self, clean_servers, monkeypatch):
+        make_server()
+        run(bot.record_guild_verification(GUILD_ID, None))
+
+        async def nothing():
+            pass
+
+        async def skip_super_close(self):
+            pass
+
+        monkeypatch.setattr(bot, "stop_bot_api", nothing)
+        monkeypatch.setattr(bot.discord.Client, "close", skip_super_close)
+        monkeypatch.setattr(bot.rabbit_publisher, "close", lambda: None)
+        monkeypatch.setattr(bot.async_rabbit_publisher, "close", lambda: None)
+        run(bot.bot.close())
+        assert get_counts() == (1, False)
+
+
 # ---------------------------------------------------------------
 # handle_verification_result triggers milestone counting
 # ---------------------------------------------------------------
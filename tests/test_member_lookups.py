@@ -0,0 +1,271 @@
+"""Concurrent member lookups share one REST call.
+
+A verification result, its nickname change and a group-invite offer can all
+ask for the same member within milliseconds, and a dashboard page asks the
+admin question four times at once. Each used to miss the cache on its own and
+spend its own guild.fetch_member. These pin down the coalescing and the short
+memory for members Discord says are not there.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+import bot
+
+GUILD_ID = 424242
+MEMBER_ID = 777
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def not_found():
+    return discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Member")
+
+
+class SlowGuild:
+    """fetch_member yields to the loop first, so concurrent callers overlap."""
+
+    def __init__(self, result=None, owner_id=1):
+        self.id = GUILD_ID
+        self.owner_id = owner_id
+        self.result = result
+        self.fetches = 0
+
+    def get_member(self, user_id):
+        return None
+
+    async def fetch_member(self, user_id):
+        self.fetches += 1
+        await asyncio.sleep(0.01)
+        if isinstance(self.result, Exception):
+            raise self.result
+        if self.result is None:
+            raise not_found()
+        return self.result
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    bot._admin_check_cache.clear()
+    bot._member_fetches_inflight.clear()
+    bot._admin_checks_inflight.clear()
+    yield
+    bot._admin_check_cache.clear()
+
+
+async def together(n, make_call):
+    return await asyncio.gather(*(make_call() for _ in range(n)))
+
+
+class TestFetchMemberCached:
+    def test_concurrent_misses_share_one_fetch(self):
+        member = SimpleNamespace(id=MEMBER_ID)
+        guild = SlowGuild(member)
+
+        results = run(together(3, lambda: bot.fetch_member_cached(guild, MEMBER_ID)))
+
+        assert results == [member] * 3
+        assert guild.fetches == 1
+        assert bot._member_fetches_inflight == {}
+
+    def test_a_fresh_lookup_joins_one_already_in_flight(self):
+        guild = SlowGuild(SimpleNamespace(id=MEMBER_ID))
+
+        async def scenario():
+            return await asyncio.gather(
+                bot.fetch_member_cached(guild, MEMBER_ID),
+                bot.fetch_member_cached(guild, MEMBER_ID, fresh=True),
+            )
+
+        run(scenario())
+        assert guild.fetches == 1
+
+    def test_an_absent_member_is_remembered_briefly(self):
+        guild = SlowGuild(None)
+
+        async def scenario():
+            first = await bot.fetch_member_cached(guild, MEMBER_ID)
+            second = await bot.fetch_member_cached(guild, MEMBER_ID)
+            return first, second
+
+        assert run(scenario()) == (None, None)
+        assert guild.fetches == 1
+
+    def test_a_fresh_lookup_ignores_the_remembered_absence(self):
+        guild = SlowGuild(None)
+
+        async def scenario():
+            await bot.fetch_member_cached(guild, MEMBER_ID)
+            guild.result = SimpleNamespace(id=MEMBER_ID)
+            return await bot.fetch_member_cached(guild, MEMBER_ID, fresh=True)
+
+        assert run(scenario()) is guild.result
+        assert guild.fetches == 2
+
+    def test_rejoining_clears_the_remembered_absence(self, monkeypatch):
+        bot._member_absent_cache.set((GUILD_ID, MEMBER_ID), True)
+        joined = SimpleNamespace(id=MEMBER_ID, guild=SimpleNamespace(id=GUILD_ID))
+
+        async def no_auto_verify(*args):
+            return False
+
+        monkeypatch.setattr(bot, "run_db", no_auto_verify)
+        run(bot.on_member_join(joined))
+
+        assert bot._member_absent_cache.get((GUILD_ID, MEMBER_ID)) is None
+
+    def test_an_error_reaches_every_waiter_and_is_not_cached(self):
+        guild = SlowGuild(discord.HTTPException(SimpleNamespace(status=500, reason="x"), "boom"))
+
+        async def scenario():
+            return await asyncio.gather(
+                *(bot.fetch_member_cached(guild, MEMBER_ID) for _ in range(2)),
+                return_exceptions=True,
+            )
+
+        results = run(scenario())
+        assert all(isinstance(r, discord.HTTPException) for r in results)
+        assert guild.fetches == 1
+        assert bot._member_absent_cache.get((GUILD_ID, MEMBER_ID)) is None
+
+    def test_one_caller_giving_up_does_not_cancel_the_others(self):
+        member = SimpleNamespace(id=MEMBER_ID)
+        guild = SlowGuild(member)
+
+        async def scenario():
+            quitter = asyncio.ensure_future(bot.fetch_member_cached(guild, MEMBER_ID))
+            stayer = asyncio.ensure_future(bot.fetch_member_cached(guild, MEMBER_ID))
+            await asyncio.sleep(0)
+            quitter.cancel()
+            return await stayer
+
+        assert run(scenario()) is member
+
+
+class TestDashboardIsAdmin:
+    def test_a_page_load_fan_out_shares_one_lookup(self, monkeypatch):
+        admin = SimpleNamespace(guild_permissions=SimpleNamespace(administrator=True))
+        guild = SlowGuild(admin)
+        monkeypatch.setattr(bot.bot, "get_guild", lambda _id: guild)
+
+        results = run(together(4, lambda: bot.dashboard_is_admin(GUILD_ID, MEMBER_ID)))
+
+        assert results == [True] * 4
+        assert guild.fetches == 1
+
+
+class Role(SimpleNamespace):
+    def is_default(self):
+        return self.name == "@everyone"
+
+
+EVERYONE = Role(id=0, name="@everyone")
+VERIFIED = Role(id=1, name="Verified")
+UNVERIFIED = Role(id=2, name="Unverified")
+OTHER = Role(id=3, name="Other")
+
+
+class EditableMember:
+    def __init__(self, roles, refuse=()):
+        self.id = MEMBER_ID
+        self.roles = list(roles)
+        self.refuse = set(refuse)  # "patch", "add", "remove", "nick"
+        self.calls = []
+
+    def _maybe_refuse(self, what):
+        if what in self.refuse:
+            raise discord.Forbidden(SimpleNamespace(status=403, reason="x"), {"code": 50013})
+
+    async def edit(self, nick=None, roles=None):
+        self.calls.append(("edit", nick, roles and [r.name for r in roles]))
+        self._maybe_refuse("patch" if roles is not None else "nick")
+        if roles is not None:
+            self.roles = list(roles)
+
+    async def add_roles(self, role):
+        self.calls.append(("add", role.name))
+        self._maybe_refuse("add")
+        self.roles.append(role)
+
+    async def remove_roles(self, role):
+        self.calls.append(("remove", role.name))
+        self._maybe_refuse("remove")
+        self.roles.remove(role)
+
+
+class TestApplyVerifiedMemberState:
+    @pytest.fixture
+    def fresh_fetches(self, monkeypatch):
+        """fetch_member_cached(fresh=True) hands back whatever is set here."""
+        state = SimpleNamespace(member=None, fetches=0)
+
+        async def fake_fetch(guild, user_id, fresh=False):
+            state.fetches += 1
+            return state.member
+
+        monkeypatch.setattr(bot, "fetch_member_cached", fake_fetch)
+        return state
+
+    def apply(self, member, unverified=UNVERIFIED, nick=None):
+        return run(bot.apply_verified_member_state(None, member, VERIFIED, unverified, nick))
+
+    def test_a_lone_role_add_is_one_call_and_no_fetch(self, fresh_fetches):
+        member = EditableMember([EVERYONE])
+        outcome = self.apply(member)
+
+        assert member.calls == [("add", "Verified")]
+        assert fresh_fetches.fetches == 0
+        assert (outcome.role_added, outcome.unverified_removed, outcome.nick_set) == (True, None, None)
+        assert outcome.rest_calls == 1
+
+    def test_several_changes_are_one_patch_on_a_fresh_member(self, fresh_fetches):
+        stale = EditableMember([EVERYONE, UNVERIFIED])
+        # Another bot gave them OTHER since we cached them; the PATCH must keep it.
+        fresh_fetches.member = fresh = EditableMember([EVERYONE, UNVERIFIED, OTHER])
+
+        outcome = self.apply(stale, nick="VRCName")
+
+        assert stale.calls == []
+        assert fresh.calls == [("edit", "VRCName", ["Other", "Verified"])]
+        assert (outcome.role_added, outcome.unverified_removed, outcome.nick_set) == (True, True, True)
+        assert outcome.rest_calls == 2
+        assert outcome.member is fresh
+
+    def test_a_role_and_a_nickname_stay_on_their_own_endpoints(self, fresh_fetches):
+        """A fetch and a PATCH would be the same two calls, with the whole
+        role list rewritten from a copy that may already be out of date."""
+        member = EditableMember([EVERYONE, OTHER])
+        outcome = self.apply(member, nick="VRCName")
+
+        assert member.calls == [("add", "Verified"), ("edit", "VRCName", None)]
+        assert fresh_fetches.fetches == 0
+        assert (outcome.role_added, outcome.unverified_removed, outcome.nick_set) == (True, None, True)
+        assert outcome.rest_calls == 2
+
+    def test_dropping_the_unverified_role_is_one_patch(self, fresh_fetches):
+        fresh_fetches.member = member = EditableMember([EVERYONE, UNVERIFIED])
+        outcome = self.apply(member)
+
+        assert member.calls == [("edit", None, ["Verified"])]
+        assert (outcome.role_added, outcome.unverified_removed, outcome.nick_set) == (True, True, None)
+
+    def test_a_refused_patch_is_diagnosed_step_by_step(self, fresh_fetches):
+        fresh_fetches.member = member = EditableMember(
+            [EVERYONE, UNVERIFIED], refuse={"patch", "remove"}
+        )
+
+        outcome = self.apply(member, nick="VRCName")
+
+        assert [c[0] for c in member.calls] == ["edit", "add", "remove", "edit"]
+        assert (outcome.role_added, outcome.unverified_removed, outcome.nick_set) == (True, False, True)
+
+    def test_calls_per_verification_is_reported(self, fresh_fetches):
+        before = bot.runtime_stats.get("role_rest_calls")
+        self.apply(EditableMember([EVERYONE]))
+        assert bot.runtime_stats.get("role_rest_calls") == before + 1
+        assert "role_rest_calls_per_verification" in bot.runtime_stats.snapshot()
@@ -59,7 +59,19 @@ def add_day(day, count, server_id=GUILD_ID):
         )
 
 
+def verified(guild_id=GUILD_ID):
+    """One completed verification, counted the way the result handler does."""
+    bot.asyncio.run(bot.record_guild_verification(guild_id, None))
+
+
+def flush():
+    """Write the counter buffer, as the flush task would."""
+    bot.asyncio.run(bot.flush_verification_counters())
+
+
 def counts_for(server_id=GUILD_ID):
+    """What the table says once everything buffered has been written."""
+    flush()
     with bot.session_scope() as session:
         return {
             row.day: row.count
@@ -89,25 +101,45 @@ def clean_db():
 # -------------------------------------------------------------------
 class TestTheRollupWrite:
     def test_the_first_verification_of_the_day_creates_the_row(self):
-        bot._record_verification_day(GUILD_ID)
+        verified(GUILD_ID)
         assert counts_for() == {today(): 1}
 
     def test_later_ones_increment_the_same_row(self):
         for _ in range(3):
-            bot._record_verification_day(GUILD_ID)
+            verified(GUILD_ID)
         assert counts_for() == {today(): 3}
 
+    def test_a_later_flush_adds_to_the_row_an_earlier_one_wrote(self):
+        """The upsert's conflict branch: the row exists, so it is added to."""
+        verified(GUILD_ID)
+        flush()
+        verified(GUILD_ID)
+        verified(GUILD_ID)
+        assert counts_for() == {today(): 3}
+
+    def test_many_verifications_are_one_write(self, monkeypatch):
+        writes = []
+        real_write = bot.write_verification_days
+        monkeypatch.setattr(
+            bot, "write_verification_days", lambda days: writes.append(days) or real_write(days)
+        )
+        for _ in range(20):
+            verified(GUILD_ID)
+        verified(OTHER_GUILD)
+        assert counts_for() == {today(): 20}
+        assert len(writes) == 1
+
     def test_guilds_are_counted_separately(self):
-        bot._record_verification_day(GUILD_ID)
-        bot._record_verification_day(OTHER_GUILD)
-        bot._record_verification_day(OTHER_GUILD)
+        verified(GUILD_ID)
+        verified(OTHER_GUILD)
+        verified(OTHER_GUILD)
         assert counts_for(GUILD_ID) == {today(): 1}
         assert counts_for(OTHER_GUILD) == {today(): 2}
 
     def test_an_existing_row_from_an_earlier_day_is_left_alone(self):
         yesterday = today() - timedelta(days=1)
         add_day(yesterday, 5)
-        bot._record_verification_day(GUILD_ID)
+        verified(GUILD_ID)
         assert counts_for() == {yesterday: 5, today(): 1}
 
     def test_a_database_failure_is_swallowed(self, monkeypatch):
@@ -122,10 +154,25 @@ class TestTheRollupWrite:
             raise RuntimeError("database is on fire")
 
         monkeypatch.setattr(bot, "session_scope", boom)
-        bot._record_verification_day(GUILD_ID)  # must not raise
+        verified(GUILD_ID)  # must not raise
+        flush()  # must not raise
+
+    def test_counts_a_failed_write_could_not_store_are_kept(self, monkeypatch):
+        """A database blip delays a number on a page; it does not lose it."""
+        real_scope = bot.session_scope
+
+        def boom():
+            raise RuntimeError("database is on fire")
+
+        verified(GUILD_ID)
+        monkeypatch.setattr(bot, "session_scope", boom)
+        flush()
+        monkeypatch.setattr(bot, "session_scope", real_scope)
+        verified(GUILD_ID)
+        assert counts_for() == {today(): 2}
 
     def test_no_guild_id_writes_nothing(self):
-        bot._record_verification_day("")
+        verified("")
         assert counts_for() == {}
 
 
@@ -63,13 +63,21 @@ class FakeEntitlement:
 
 
 def fake_entitlements_api(*items, error: Exception | None = None):
-    """Stand-in for Client.entitlements(): an async iterator, or a raiser."""
+    """Stand-in for Client.entitlements(): an async iterator, or a raiser.
+
+    Stops after `limit` like the real one, so a caller that asks for too few
+    cannot pass a test that a real walk would fail.
+    """
 
     def _entitlements(**kwargs):
+        limit = kwargs.get("limit")
+
         async def generate():
             if error is not None:
                 raise error
-            for item in items:
+            for n, item in enumerate(items):
+                if limit is not None and n >= limit:
+                    return
                 yield item
 
         return generate()
@@ -372,6 +380,94 @@ class TestGuildHasPremium:
         assert bot.premium_status_cache.get_fresh(GUILD_ID) is True
 
 
+OTHER_GUILD_ID = "111222333"
+
+
+class TestPremiumPrefetch:
+    """One entitlement walk answers premium for every guild at once."""
+
+    OTHER = OTHER_GUILD_ID
+
+    @pytest.fixture
+    def guilds(self, monkeypatch):
+        """The bot is in two guilds; only GUILD_ID's entitlement is in the fakes."""
+        in_guilds = [SimpleNamespace(id=int(GUILD_ID)), SimpleNamespace(id=int(OTHER_GUILD_ID))]
+        monkeypatch.setattr(type(bot.bot), "guilds", property(lambda client: in_guilds))
+
+    def test_fills_positive_and_negative_entries(self, enforced, monkeypatch, guilds):
+        api, calls = counting_entitlements_api(FakeEntitlement())
+        monkeypatch.setattr(bot.bot, "entitlements", api)
+
+        assert run(bot.prefetch_premium_status()) == 2
+        assert len(calls) == 1
+        assert calls[0]["exclude_ended"] and calls[0]["exclude_deleted"]
+
+        assert run(bot.guild_has_premium(GUILD_ID)) is True
+        assert run(bot.guild_has_premium(self.OTHER)) is False
+        assert len(calls) == 1, "both answers came from the cache"
+
+    def test_expired_and_refunded_entitlements_do_not_count(self, enforced, monkeypatch, guilds):
+        monkeypatch.setattr(
+            bot.bot,
+            "entitlements",
+            fake_entitlements_api(FakeEntitlement(expired=True), FakeEntitlement(deleted=True)),
+        )
+        run(bot.prefetch_premium_status())
+        assert bot.premium_status_cache.get_fresh(GUILD_ID) is False
+
+    def test_a_failed_walk_leaves_the_cache_alone(self, enforced, monkeypatch, guilds):
+        bot.premium_status_cache.set(GUILD_ID, True)
+        monkeypatch.setattr(
+            bot.bot, "entitlements", fake_entitlements_api(error=RuntimeError("discord down"))
+        )
+        assert run(bot.prefetch_premium_status()) is None
+        assert bot.premium_status_cache.get_fresh(GUILD_ID) is True
+        assert bot.premium_status_cache.get_fresh(self.OTHER) is None
+
+    def test_an_incomplete_walk_only_says_yes(self, enforced, monkeypatch, guilds):
+        monkeypatch.setattr(bot, "PREMIUM_PREFETCH_MAX", 1)
+        monkeypatch.setattr(
+            bot.bot,
+            "entitlements",
+            fake_entitlements_api(FakeEntitlement(), FakeEntitlement(guild_id=self.OTHER)),
+        )
+        run(bot.prefetch_premium_status())
+        assert bot.premium_status_cache.get_fresh(GUILD_ID) is True
+        # Past the cap: unknown, not "not paying".
+        assert bot.premium_status_cache.get_fresh(self.OTHER) is None
+
+    def test_an_entitlement_event_during_the_walk_wins(self, enforced, monkeypatch, guilds):
+        def walk_with_a_purchase_midway(**kwargs):
+            async def generate():
+                # The purchase lands while the walk is running; the walk's
+                # "not paying" for this guild is already out of date.
+                bot.premium_status_cache.invalidate(self.OTHER)
+                yield FakeEntitlement()
+
+            return generate()
+
+        monkeypatch.setattr(bot.bot, "entitlements", walk_with_a_purchase_midway)
+        run(bot.prefetch_premium_status())
+        assert bot.premium_status_cache.get_fresh(GUILD_ID) is True
+        assert bot.premium_status_cache.get_fresh(self.OTHER) is None
+
+    def test_a_recent_walk_is_reused_for_extra_guilds(self, enforced, monkeypatch, guilds):
+        api, calls = counting_entitlements_api(FakeEntitlement())
+        monkeypatch.setattr(bot.bot, "entitlements", api)
+        run(bot.prefetch_premium_status())
+
+        departed = "444555666"
+        run(bot.prefetch_premium_status([departed], max_age=60))
+        assert len(calls) == 1
+        assert bot.premium_status_cache.get_fresh(departed) is False
+
+    def test_inert_without_a_sku(self, monkeypatch):
+        api, calls = counting_entitlements_api(FakeEntitlement())
+        monkeypatch.setattr(bot.bot, "entitlements", api)
+        assert run(bot.prefetch_premium_status()) == 0
+        assert calls == []
+
+
 # ---------------------------------------------------------------
 # Grandfathering
 # ---------------------------------------------------------------
@@ -470,8 +566,15 @@ def assign_role_harness(monkeypatch):
         async def remove_roles(self, role):
             events.removed.append(role.name)
 
-        async def edit(self, nick=None):
-            events.nicks.append(nick)
+        async def edit(self, nick=None, roles=None):
+            # assign_role sends every change in one PATCH when there is more
+            # than one; record it as the separate changes it stands for.
+            if roles is not None:
+                events.added += [r.name for r in roles if r not in self.roles]
+                events.removed += [r.name for r in self.roles if r not in roles]
+                self.roles = list(roles)
+            if nick is not None:
+                events.nicks.append(nick)
 
         async def send(self, content):
             events.dms.append(content)
@@ -481,7 +584,7 @@ def assign_role_harness(monkeypatch):
         id=int(GUILD_ID), name="Test Server", roles=[verified, unverified]
     )
 
-    async def fake_fetch(g, user_id):
+    async def fake_fetch(g, user_id, fresh=False):
         return member
 
     async def fake_dm(m, g, key, instr_locale=None, **kwargs):
@@ -8,6 +8,7 @@ that, not the priority itself.
 """
 
 import asyncio
+import json
 from types import SimpleNamespace
 
 import pika
@@ -75,6 +76,15 @@ def clean_db():
     bot.premium_status_cache.clear()
 
 
+@pytest.fixture(autouse=True)
+def fresh_publisher(monkeypatch):
+    """Each test gets its own publishers, so no connection outlives its fakes."""
+    monkeypatch.setattr(bot, "rabbit_publisher", bot.RabbitPublisher())
+    monkeypatch.setattr(bot, "async_rabbit_publisher", bot.AsyncRabbitPublisher())
+    # And nothing outstanding: identical requests are otherwise coalesced.
+    monkeypatch.setattr(bot, "_inflight_requests", {})
+
+
 @pytest.fixture
 def enforced(monkeypatch):
     monkeypatch.setattr(bot, "PREMIUM_SKU_ID", SKU_ID)
@@ -140,19 +150,30 @@ class TestRequestPriority:
 # ---------------------------------------------------------------
 @pytest.fixture
 def publish_spy(monkeypatch):
-    """Capture what publish_to_vrc_checker hands to pika."""
-    calls = SimpleNamespace(declares=[], publishes=[])
+    """Capture what the publishers hand to pika.
+
+    publish_to_vrc_checker publishes on the event loop's connection, and group
+    jobs on the blocking one, so both openers are replaced; each records into
+    the same lists.
+    """
+    calls = SimpleNamespace(declares=[], publishes=[], connects=[], sync_connects=[])
+
+    def declare(queue, durable=False, arguments=None):
+        calls.declares.append(
+            {"queue": queue, "durable": durable, "arguments": arguments}
+        )
+
+    def publish(exchange, routing_key, body, properties):
+        calls.publishes.append(
+            {"routing_key": routing_key, "body": body, "properties": properties}
+        )
 
     class FakeChannel:
         def queue_declare(self, queue, durable=False, arguments=None):
-            calls.declares.append(
-                {"queue": queue, "durable": durable, "arguments": arguments}
-            )
+            declare(queue, durable, arguments)
 
         def basic_publish(self, exchange, routing_key, body, properties):
-            calls.publishes.append(
-                {"routing_key": routing_key, "body": body, "properties": properties}
-            )
+            publish(exchange, routing_key, body, properties)
 
     class FakeConn:
         is_open = True
@@ -160,10 +181,34 @@ def publish_spy(monkeypatch):
         def channel(self):
             return FakeChannel()
 
+        def process_data_events(self, time_limit=None):
+            pass
+
         def close(self):
             pass
 
-    monkeypatch.setattr(bot, "_rabbitmq_connect_with_retry", lambda **kw: FakeConn())
+    class FakeAsyncChannel:
+        is_open = True
+
+        async def queue_declare(self, queue, durable=False, arguments=None):
+            declare(queue, durable, arguments)
+
+        def basic_publish(self, exchange, routing_key, body, properties):
+            publish(exchange, routing_key, body, properties)
+
+        def close(self):
+            self.is_open = False
+
+    def connect(**kwargs):
+        calls.sync_connects.append(1)
+        return FakeConn()
+
+    async def open_async():
+        calls.connects.append(1)
+        return FakeAsyncChannel()
+
+    monkeypatch.setattr(bot, "_rabbitmq_connect_with_retry", connect)
+    monkeypatch.setattr(bot, "_open_async_rabbitmq", open_async)
     return calls
 
 
@@ -198,6 +243,306 @@ class TestPublish:
         assert publish_spy.publishes[0]["properties"].delivery_mode == 2
 
 
+class TestCoalescing:
+    """One outstanding lookup per (user, guild, code, nickname), not one per press."""
+
+    def test_an_identical_request_is_not_queued_again(self, publish_spy):
+        before = bot.runtime_stats.get("checker_requests_coalesced")
+
+        async def scenario():
+            first = await bot.publish_to_vrc_checker("1", "usr_x", GUILD_ID, None)
+            second = await bot.publish_to_vrc_checker("1", "usr_x", GUILD_ID, None)
+            return first, second
+
+        assert run(scenario()) == (True, False)
+        assert len(publish_spy.publishes) == 1
+        assert bot.runtime_stats.get("checker_requests_coalesced") == before + 1
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            dict(discord_id="2"),
+            dict(guild_id="111"),
+            dict(code="VRC-ABC123"),
+            dict(update_nickname=True),
+        ],
+    )
+    def test_requests_that_differ_are_both_queued(self, publish_spy, other):
+        args = dict(discord_id="1", vrc_user_id="usr_x", guild_id=GUILD_ID, code=None)
+
+        async def scenario():
+            await bot.publish_to_vrc_checker(**args)
+            await bot.publish_to_vrc_checker(**{**args, **other})
+
+        run(scenario())
+        assert len(publish_spy.publishes) == 2
+
+    def test_the_answer_clears_it(self, publish_spy, monkeypatch):
+        monkeypatch.setattr(bot.bot, "get_guild", lambda gid: None)
+
+        async def scenario():
+            await bot.publish_to_vrc_checker("1", "usr_x", GUILD_ID, None)
+            await bot.handle_verification_result(
+                {"discordID": "1", "guildID": GUILD_ID, "verificationCode": None, "lookup_ok": False}
+            )
+            return await bot.publish_to_vrc_checker("1", "usr_x", GUILD_ID, None)
+
+        assert run(scenario()) is True
+        assert len(publish_spy.publishes) == 2
+
+    def test_an_unanswered_request_expires(self, publish_spy, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr(bot.time, "monotonic", lambda: clock[0])
+
+        async def scenario():
+            await bot.publish_to_vrc_checker("1", "usr_x", GUILD_ID, None)
+            clock[0] += bot.INFLIGHT_REQUEST_TTL_SECONDS
+            return await bot.publish_to_vrc_checker("1", "usr_x", GUILD_ID, None)
+
+        assert run(scenario()) is True
+
+    def test_a_failed_publish_does_not_block_the_retry(self, monkeypatch):
+        async def broken():
+            raise pika.exceptions.AMQPConnectionError("down")
+
+        monkeypatch.setattr(bot, "_open_async_rabbitmq", broken)
+        monkeypatch.setattr(bot, "publish_retry_delay", lambda attempt: 0)
+        monkeypatch.setenv("RABBITMQ_PUBLISH_TRIES", "1")
+
+        assert run(bot.publish_to_vrc_checker("1", "usr_x", GUILD_ID, None)) is False
+        assert bot._inflight_requests == {}
+
+
+class TestFairRequestScheduling:
+    """Requests beyond the checker's window wait per guild, and guilds take
+    turns, so one server's verification drive cannot queue everyone else
+    behind it."""
+
+    @pytest.fixture
+    def window(self, monkeypatch, publish_spy):
+        def make(size, premium_weight=bot.PREMIUM_REQUEST_WEIGHT):
+            scheduler = bot.RequestScheduler(size)
+            monkeypatch.setattr(bot, "request_scheduler", scheduler)
+            monkeypatch.setattr(bot, "PREMIUM_REQUEST_WEIGHT", premium_weight)
+            return scheduler
+
+        return make
+
+    def published_guilds(self, publish_spy):
+        return [json.loads(p["body"])["guildID"] for p in publish_spy.publishes]
+
+    def answer(self, publish_spy, index):
+        sent = json.loads(publish_spy.publishes[index]["body"])
+        bot.release_inflight_request(
+            bot.inflight_request_key(sent["discordID"], sent["guildID"], None)
+        )
+
+    def test_requests_past_the_window_are_held_not_published(self, window, publish_spy):
+        window(1)
+
+        async def scenario():
+            first = await bot.publish_to_vrc_checker("1", "usr_a", "A", None)
+            second = await bot.publish_to_vrc_checker("2", "usr_b", "A", None)
+            return first, second
+
+        assert run(scenario()) == (True, True)
+        assert len(publish_spy.publishes) == 1
+        assert bot.request_scheduler.held() == 1
+
+    def test_an_answer_frees_the_slot_for_the_next(self, window, publish_spy):
+        window(1)
+
+        async def scenario():
+            await bot.publish_to_vrc_checker("1", "usr_a", "A", None)
+            await bot.publish_to_vrc_checker("2", "usr_b", "A", None)
+            assert await bot.drain_request_queue() == 0, "the window is still full"
+            self.answer(publish_spy, 0)
+            return await bot.drain_request_queue()
+
+        assert run(scenario()) == 1
+        assert len(publish_spy.publishes) == 2
+
+    def test_an_unanswered_slot_expires(self, window, publish_spy, monkeypatch):
+        clock = [1000.0]
+        scheduler = window(1)
+        scheduler.clock = lambda: clock[0]
+
+        async def scenario():
+            await bot.publish_to_vrc_checker("1", "usr_a", "A", None)
+            await bot.publish_to_vrc_checker("2", "usr_b", "A", None)
+            clock[0] += bot.INFLIGHT_REQUEST_TTL_SECONDS
+            return await bot.drain_request_queue()
+
+        assert run(scenario()) == 1
+
+    def test_a_drive_does_not_starve_a_quiet_guild(self, window, publish_spy):
+        window(1)
+
+        async def scenario():
+            await bot.publish_to_vrc_checker("0", "usr", "drive", None)
+            for n in range(1, 4):
+                await bot.publish_to_vrc_checker(str(n), "usr", "drive", None)
+            await bot.publish_to_vrc_checker("9", "usr", "quiet", None)
+            for n in range(4):
+                self.answer(publish_spy, n)
+                await bot.drain_request_queue()
+
+        run(scenario())
+        assert self.published_guilds(publish_spy) == [
+            "drive", "drive", "quiet", "drive", "drive"
+        ]
+
+    def test_premium_guilds_get_more_turns_and_keep_their_priority(
+        self, window, publish_spy
+    ):
+        window(1, premium_weight=2)
+        premium = bot.PREMIUM_REQUEST_PRIORITY
+
+        async def scenario():
+            await bot.publish_to_vrc_checker("0", "usr", "free", None)  # takes the slot
+            for n in range(1, 4):
+                await bot.publish_to_vrc_checker(str(n), "usr", "paid", None, priority=premium)
+            for n in range(4, 6):
+                await bot.publish_to_vrc_checker(str(n), "usr", "free", None)
+            for n in range(5):
+                self.answer(publish_spy, n)
+                await bot.drain_request_queue()
+
+        run(scenario())
+        assert self.published_guilds(publish_spy) == [
+            "free", "paid", "paid", "free", "paid", "free"
+        ]
+        assert publish_spy.publishes[1]["properties"].priority == premium
+
+    def test_an_identical_held_request_is_coalesced(self, window, publish_spy):
+        window(1)
+
+        async def scenario():
+            await bot.publish_to_vrc_checker("1", "usr_a", "A", None)
+            await bot.publish_to_vrc_checker("2", "usr_b", "A", None)
+            # The duplicate marker lapses while the request is still held.
+            bot._inflight_requests.clear()
+            return await bot.publish_to_vrc_checker("2", "usr_b", "A", None)
+
+        assert run(scenario()) is False
+        assert bot.request_scheduler.held() == 1
+
+    def test_per_guild_waits_are_reported_worst_first(self):
+        scheduler = bot.RequestScheduler(1)
+        scheduler.record_wait("quiet", 0.010)
+        scheduler.record_wait("drive", 0.500)
+        scheduler.record_wait("drive", 0.100)
+        assert scheduler.take_guild_waits() == "drive=300/500,quiet=10/10"
+        assert scheduler.take_guild_waits() == "-", "a new period starts"
+
+    def test_a_zero_window_publishes_everything_at_once(self, window, publish_spy):
+        window(0)
+
+        async def scenario():
+            for n in range(5):
+                await bot.publish_to_vrc_checker(str(n), "usr", "A", None)
+
+        run(scenario())
+        assert len(publish_spy.publishes) == 5
+
+
+class TestPersistentPublisher:
+    """A Verify press costs one frame, not a TCP and AMQP handshake."""
+
+    def test_publishes_share_one_connection(self, publish_spy):
+        async def scenario():
+            for n in range(5):
+                await bot.publish_to_vrc_checker(str(n), "usr_x", GUILD_ID, None)
+
+        run(scenario())
+        assert len(publish_spy.publishes) == 5
+        assert len(publish_spy.connects) == 1
+
+    def test_queue_is_declared_once_per_connection(self, publish_spy):
+        async def scenario():
+            for n in range(3):
+                await bot.publish_to_vrc_checker(str(n), "usr_x", GUILD_ID, None)
+
+        run(scenario())
+        assert len(publish_spy.declares) == 1
+
+    def test_a_closed_connection_is_reopened_and_redeclared(self, publish_spy):
+        async def scenario():
+            await bot.publish_to_vrc_checker("1", "usr_x", GUILD_ID, None)
+            bot.async_rabbit_publisher._client.is_open = False
+            await bot.publish_to_vrc_checker("2", "usr_x", GUILD_ID, None)
+
+        run(scenario())
+        assert len(publish_spy.publishes) == 2
+        assert len(publish_spy.connects) == 2
+        # The old connection's declarations are not evidence the queue still
+        # exists.
+        assert len(publish_spy.declares) == 2
+
+    def test_a_new_event_loop_gets_its_own_connection(self, publish_spy):
+        # A connection belongs to the loop that opened it.
+        run(bot.publish_to_vrc_checker("1", "usr_x", GUILD_ID, None))
+        run(bot.publish_to_vrc_checker("2", "usr_x", GUILD_ID, None))
+        assert len(publish_spy.connects) == 2
+
+    def test_group_jobs_share_one_blocking_connection(self, publish_spy):
+        assert bot.publish_group_invite_job({"type": "x"}, queue="invites")
+        assert bot.publish_group_invite_job({"type": "y"}, queue="invites")
+        assert len(publish_spy.sync_connects) == 1
+        # The invite queue must not inherit x-max-priority, or the worker's
+        # declare 406s.
+        assert [d["arguments"] for d in publish_spy.declares] == [None]
+
+    def test_stale_blocking_connection_is_replaced_without_spending_an_attempt(
+        self, publish_spy, monkeypatch
+    ):
+        sleeps = []
+        monkeypatch.setattr(bot.time, "sleep", sleeps.append)
+        assert bot.publish_group_invite_job({"type": "x"}, queue="invites")
+
+        def gone(time_limit=None):
+            raise pika.exceptions.StreamLostError("idle disconnect")
+
+        bot.rabbit_publisher._connection.process_data_events = gone
+        assert bot.publish_group_invite_job({"type": "x"}, queue="invites")
+
+        assert len(publish_spy.publishes) == 2
+        assert len(publish_spy.sync_connects) == 2
+        assert sleeps == []
+        assert len(publish_spy.declares) == 2
+
+
+class TestAsyncRabbitChannel:
+    """The broker answers a bad declare by closing the channel, not replying."""
+
+    def test_a_close_fails_whatever_is_awaiting_a_reply(self):
+        async def scenario():
+            client = bot.AsyncRabbitChannel()
+            client.closed = asyncio.get_running_loop().create_future()
+
+            class Channel:
+                def queue_declare(self, queue, durable, arguments, callback):
+                    client._on_closed(channel_closed_406())
+
+            client.channel = Channel()
+            with pytest.raises(pika.exceptions.ChannelClosedByBroker) as raised:
+                await client.queue_declare("q", arguments={"x-max-priority": 5})
+            return raised.value, client.closed.result()
+
+        error, reason = run(scenario())
+        assert bot.is_queue_argument_mismatch(error)
+        assert reason is error
+
+    def test_a_string_reason_becomes_an_amqp_error(self):
+        async def scenario():
+            client = bot.AsyncRabbitChannel()
+            client.closed = asyncio.get_running_loop().create_future()
+            client._on_closed("socket gone")
+            return client.closed.result()
+
+        assert isinstance(run(scenario()), pika.exceptions.AMQPError)
+
+
 class TestCheckerDeclare:
     """The consumer side of the invariant.
 
@@ -277,21 +622,21 @@ class TestQueueArgumentMismatch:
         """
         attempts = []
 
-        def connect(**kwargs):
+        async def connect():
             attempts.append(1)
             raise channel_closed_406()
 
-        monkeypatch.setattr(bot, "_rabbitmq_connect_with_retry", connect)
+        monkeypatch.setattr(bot, "_open_async_rabbitmq", connect)
         monkeypatch.setenv("RABBITMQ_PUBLISH_TRIES", "3")
 
         run(bot.publish_to_vrc_checker("1", "usr_x", GUILD_ID, None))
         assert len(attempts) == 1
 
     def test_the_operator_is_told_how_to_fix_it(self, monkeypatch, caplog):
-        def connect(**kwargs):
+        async def connect():
             raise channel_closed_406()
 
-        monkeypatch.setattr(bot, "_rabbitmq_connect_with_retry", connect)
+        monkeypatch.setattr(bot, "_open_async_rabbitmq", connect)
         with caplog.at_level("ERROR"):
             run(bot.publish_to_vrc_checker("1", "usr_x", GUILD_ID, None))
 
@@ -303,18 +648,199 @@ class TestQueueArgumentMismatch:
         # The early return must be specific to the 406, not swallow everything.
         attempts = []
 
-        def connect(**kwargs):
+        async def connect():
             attempts.append(1)
             raise pika.exceptions.AMQPConnectionError("down")
 
-        monkeypatch.setattr(bot, "_rabbitmq_connect_with_retry", connect)
+        monkeypatch.setattr(bot, "_open_async_rabbitmq", connect)
         monkeypatch.setenv("RABBITMQ_PUBLISH_TRIES", "3")
-        monkeypatch.setattr(bot.time, "sleep", lambda s: None)
+        monkeypatch.setattr(bot, "publish_retry_delay", lambda attempt: 0)
 
         run(bot.publish_to_vrc_checker("1", "usr_x", GUILD_ID, None))
         assert len(attempts) == 3
 
 
+# ---------------------------------------------------------------
+# Consuming on the event loop
+# ---------------------------------------------------------------
+class TestResultConsumer:
+    """Results are handled on the loop; no executor thread is parked."""
+
+    def capture_on_message(self, monkeypatch):
+        captured = {}
+
+        async def fake_consume(queue, on_message, **kwargs):
+            captured.update(queue=queue, on_message=on_message, **kwargs)
+
+        monkeypatch.setattr(bot, "consume_rabbitmq_queue", fake_consume)
+        run(bot.consume_results_queue())
+        return captured
+
+    def test_consumes_the_result_queue(self, monkeypatch):
+        captured = self.capture_on_message(monkeypatch)
+        assert captured["queue"] == bot.RABBITMQ_RESULT_QUEUE
+
+    def test_a_result_reaches_the_handler_on_the_loop(self, monkeypatch):
+        captured = self.capture_on_message(monkeypatch)
+        handled, acked = [], []
+
+        async def handler(data):
+            handled.append(data)
+
+        monkeypatch.setattr(bot, "handle_verification_result", handler)
+        channel = SimpleNamespace(basic_ack=lambda delivery_tag: acked.append(delivery_tag))
+
+        async def scenario():
+            captured["on_message"](
+                channel, SimpleNamespace(delivery_tag=7), None, b'{"discordID": "1"}'
+            )
+            await asyncio.gather(*bot._result_handler_tasks)
+
+        run(scenario())
+        assert handled == [{"discordID": "1"}]
+        assert acked == [7]
+
+    def test_invalid_json_is_dropped_not_requeued(self, monkeypatch):
+        captured = self.capture_on_message(monkeypatch)
+        nacks = []
+        channel = SimpleNamespace(
+            basic_nack=lambda delivery_tag, requeue: nacks.append((delivery_tag, requeue))
+        )
+        captured["on_message"](channel, SimpleNamespace(delivery_tag=3), None, b"{nope")
+        assert nacks == [(3, False)]
+
+
+class TestResultDispatcher:
+    """Results are acked when handled, a bounded number at a time, with
+    guilds taking turns."""
+
+    def test_the_prefetch_is_the_bounded_window(self, monkeypatch):
+        captured = TestResultConsumer().capture_on_message(monkeypatch)
+        assert captured["prefetch_count"] == bot.RESULT_PREFETCH
+        assert bot.RESULT_PREFETCH >= bot.RESULT_HANDLER_CONCURRENCY
+
+    def test_ack_waits_for_the_handler(self, monkeypatch):
+        captured = TestResultConsumer().capture_on_message(monkeypatch)
+        acked = []
+        release = None
+
+        async def handler(data):
+            await release.wait()
+
+        monkeypatch.setattr(bot, "handle_verification_result", handler)
+        channel = SimpleNamespace(basic_ack=lambda delivery_tag: acked.append(delivery_tag))
+
+        async def scenario():
+            nonlocal release
+            release = asyncio.Event()
+            captured["on_message"](
+                channel, SimpleNamespace(delivery_tag=9), None, b'{"guildID": "1"}'
+            )
+            await asyncio.sleep(0)
+            assert acked == [], "acked before the handler finished"
+            release.set()
+            await asyncio.gather(*bot._result_handler_tasks)
+
+        run(scenario())
+        assert acked == [9]
+
+    def test_a_failing_handler_is_still_acked(self, monkeypatch):
+        captured = TestResultConsumer().capture_on_message(monkeypatch)
+        acked = []
+
+        async def handler(data):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(bot, "handle_verification_result", handler)
+        channel = SimpleNamespace(basic_ack=lambda delivery_tag: acked.append(delivery_tag))
+
+        async def scenario():
+            captured["on_message"](channel, SimpleNamespace(delivery_tag=4), None, b"{}")
+            await asyncio.gather(*bot._result_handler_tasks)
+
+        run(scenario())
+        assert acked == [4]
+
+    def test_guilds_take_turns(self):
+        order = []
+
+        def job(tag):
+            async def go():
+                order.append(tag)
+
+            return go
+
+        async def scenario():
+            dispatcher = bot.FairDispatcher("test_results", concurrency=1, per_key=1)
+            gate = asyncio.Event()
+
+            async def hold():
+                await gate.wait()
+
+            dispatcher.submit("busy", hold)  # occupies the only slot
+            for n in range(3):
+                dispatcher.submit("busy", job(f"busy{n}"))
+            dispatcher.submit("quiet", job("quiet0"))
+            gate.set()
+            while dispatcher.in_flight or dispatcher.queued():
+                await asyncio.sleep(0)
+
+        run(scenario())
+        assert order == ["busy0", "quiet0", "busy1", "busy2"]
+
+    def test_one_guild_cannot_hold_every_slot(self):
+        async def scenario():
+            dispatcher = bot.FairDispatcher("test_results", concurrency=4, per_key=2)
+            gate = asyncio.Event()
+
+            async def hold():
+                await gate.wait()
+
+            for _ in range(5):
+                dispatcher.submit("drive", hold)
+            in_flight_for_the_drive = dispatcher.in_flight
+            dispatcher.submit("other", hold)
+            in_flight_with_another = dispatcher.in_flight
+            gate.set()
+            while dispatcher.in_flight or dispatcher.queued():
+                await asyncio.sleep(0)
+            return in_flight_for_the_drive, in_flight_with_another
+
+        assert run(scenario()) == (2, 3)
+
+    def test_a_job_from_a_closed_channel_is_left_for_redelivery(self):
+        ran, done = [], []
+
+        async def job():
+            ran.append(1)
+
+        async def scenario():
+            dispatcher = bot.FairDispatcher("test_results", concurrency=1, per_key=1)
+            gate = asyncio.Event()
+
+            async def hold():
+                await gate.wait()
+
+            dispatcher.submit("g", hold)
+            dispatcher.submit("g", job, on_done=lambda: done.append(1), is_live=lambda: False)
+            gate.set()
+            while dispatcher.in_flight or dispatcher.queued():
+                await asyncio.sleep(0)
+
+        run(scenario())
+        assert ran == [] and done == []
+
+    def test_depth_and_latency_are_in_the_runtime_stats_line(self):
+        snapshot = bot.runtime_stats.snapshot()
+        for name in (
+            "results_queued",
+            "results_in_flight",
+            "results_wait_avg_ms",
+            "results_handler_max_ms",
+        ):
+            assert name in snapshot
+
+
 # ---------------------------------------------------------------
 # Call-site wiring
 # ---------------------------------------------------------------
@@ -388,3 +914,319 @@ class TestCallSiteWiring:
         assert (
             self.published_priority(monkeypatch, []) == bot.DEFAULT_REQUEST_PRIORITY
         )
+
+
+# ---------------------------------------------------------------
+# Wait estimates
+# ---------------------------------------------------------------
+def add_unverified_member():
+    """A member with a linked VRChat id, so pressing starts a no-code re-check."""
+    make_server(row_id=NEW_ID)
+    with bot.session_scope() as session:
+        session.add(
+            bot.User(discord_id="42", verification_status=False, vrc_user_id="usr_x")
+        )
+
+
+def press_recheck(replies, entitlements=()):
+    """The member presses Begin Verification; what they are told goes in `replies`."""
+
+    async def send(*a, **kw):
+        replies.append(a[0])
+
+    async def defer(ephemeral=False):
+        pass
+
+    interaction = SimpleNamespace(
+        guild_id=int(GUILD_ID),
+        user=SimpleNamespace(id=42),
+        locale="en-US",
+        entitlements=list(entitlements),
+        response=SimpleNamespace(is_done=lambda: False, defer=defer, send_message=send),
+        followup=SimpleNamespace(send=send),
+    )
+    run(bot.process_verification(interaction))
+
+
+class TestQueueEstimates:
+    """A member whose request is held is told roughly how long it will be,
+    and pressing again meanwhile gets that back instead of another request."""
+
+    @pytest.fixture
+    def backed_up(self, monkeypatch, publish_spy):
+        """A full window, five other requests held, and a checker that has
+        been answering one request every nine seconds."""
+        clock = [0.0]
+        scheduler = bot.RequestScheduler(1, clock=lambda: clock[0])
+        monkeypatch.setattr(bot, "request_scheduler", scheduler)
+        monkeypatch.setattr(bot, "_queue_estimates", {})
+        monkeypatch.setattr(bot, "_verification_cooldowns", {})
+        for n in range(10):
+            clock[0] += 9
+            scheduler.occupy(("answered", n))
+            scheduler.release(("answered", n))
+        clock[0] += 9
+        scheduler.occupy(("busy",))
+        for n in range(5):
+            scheduler.hold(
+                bot.HeldRequest(("other", n), "111", "{}", None, 1, clock[0])
+            )
+        return scheduler
+
+    @pytest.fixture
+    def replies(self):
+        return []
+
+    def test_a_held_request_is_told_its_place_and_wait(self, backed_up, replies):
+        add_unverified_member()
+        press_recheck(replies)
+        # Six held (the other guild's five and this one) plus one outstanding,
+        # at 10 answers in 90 s.
+        assert backed_up.held() == 6
+        assert "#7 in line" in replies[0]
+        assert "roughly 2 min" in replies[0]
+        assert bot.queue_estimate_remaining("42", GUILD_ID) > 0
+
+    def test_pressing_again_gets_the_estimate_not_another_request(
+        self, backed_up, replies
+    ):
+        add_unverified_member()
+        press_recheck(replies)
+        press_recheck(replies)
+        assert backed_up.held() == 6, "no second request"
+        assert "still in line" in replies[1]
+        # Turned away before the cooldown, so it does not start one for later.
+        assert len(bot._verification_cooldowns) == 1
+
+    def test_the_answer_ends_the_estimate(self, backed_up, replies):
+        add_unverified_member()
+        press_recheck(replies)
+        run(
+            bot.handle_verification_result(
+                {
+                    "discordID": "42",
+                    "guildID": GUILD_ID,
+                    "verificationCode": None,
+                    "is_18_plus": False,
+                }
+            )
+        )
+        assert bot.queue_estimate_remaining("42", GUILD_ID) == 0
+
+    def test_no_estimate_while_the_window_has_room(
+        self, monkeypatch, publish_spy, replies
+    ):
+        monkeypatch.setattr(bot, "_queue_estimates", {})
+        monkeypatch.setattr(bot, "_verification_cooldowns", {})
+        add_unverified_member()
+        press_recheck(replies)
+        assert len(publish_spy.publishes) == 1
+        assert replies == [bot.localizations["en-US"]["recheck_started"]]
+        assert bot.queue_estimate_remaining("42", GUILD_ID) == 0
+
+    def test_a_request_the_queue_cannot_reach_in_time_is_turned_away(
+        self, backed_up, replies, monkeypatch
+    ):
+        # The estimate is 63 s; the request would be dropped at 30.
+        monkeypatch.setattr(bot, "REQUEST_TTL_SECONDS", 30)
+        add_unverified_member()
+        press_recheck(replies)
+        assert replies == [bot.localizations["en-US"]["queue_busy"]]
+        assert backed_up.held() == 5, "taken back out"
+        assert bot._inflight_requests == {}, "pressing later must work"
+        assert bot.queue_estimate_remaining("42", GUILD_ID) == 0
+
+    def test_dropping_an_expired_request_ends_its_estimate(self, backed_up, replies):
+        add_unverified_member()
+        press_recheck(replies)
+        held = backed_up.find("42", GUILD_ID)
+        held.deadline = bot.time.monotonic() - 1
+        # Only this request left, and room in the window to publish it.
+        backed_up.clear()
+        backed_up.hold(held)
+        run(bot.drain_request_queue())
+        assert bot.queue_estimate_remaining("42", GUILD_ID) == 0
+
+    def test_no_estimate_without_enough_answers_to_measure(self, backed_up):
+        backed_up._answers.clear()
+        assert backed_up.estimate_wait() is None
+
+    def test_a_short_wait_is_not_worth_a_line(self, backed_up, replies, monkeypatch):
+        monkeypatch.setattr(bot, "QUEUE_ETA_MIN_SECONDS", 600)
+        add_unverified_member()
+        press_recheck(replies)
+        assert replies == [bot.localizations["en-US"]["recheck_started"]]
+
+    def test_the_rate_only_counts_recent_answers(self):
+        clock = [0.0]
+        scheduler = bot.RequestScheduler(1, clock=lambda: clock[0])
+        for n in range(bot.QUEUE_ETA_MIN_ANSWERS):
+            scheduler.occupy(n)
+            scheduler.release(n)
+        assert scheduler.service_rate() is not None
+        clock[0] += bot.QUEUE_ETA_WINDOW_SECONDS
+        assert scheduler.service_rate() is None
+        # A key that never took a slot is not an answer from the checker.
+        for n in range(bot.QUEUE_ETA_MIN_ANSWERS):
+            scheduler.release(("never", n))
+        assert scheduler.service_rate() is None
+
+    def test_the_answer_rate_is_in_the_runtime_stats_line(self):
+        assert "checker_answers_per_min" in bot.runtime_stats.snapshot()
+
+
+# ---------------------------------------------------------------
+# Admission control and request expiry
+# ---------------------------------------------------------------
+class TestAdmissionControl:
+    """Past the depth or age limit free guilds' presses are turned away, and
+    no request outlives the point where its answer could still be used."""
+
+    @pytest.fixture
+    def replies(self, monkeypatch):
+        monkeypatch.setattr(bot, "_verification_cooldowns", {})
+        return []
+
+    @pytest.fixture
+    def backlog(self, monkeypatch, publish_spy):
+        """A full window with `n` requests from another guild held behind it."""
+        clock = [1000.0]
+        scheduler = bot.RequestScheduler(1, clock=lambda: clock[0])
+        monkeypatch.setattr(bot, "request_scheduler", scheduler)
+        scheduler.occupy(("busy",))
+
+        def make(n, waited=0.0):
+            for i in range(n):
+                scheduler.hold(
+                    bot.HeldRequest(("other", i), "111", "{}", None, 1, clock[0] - waited)
+                )
+            return scheduler
+
+        return make
+
+    def busy(self):
+        return bot.localizations["en-US"]["queue_busy"]
+
+    def test_a_free_press_is_turned_away_past_the_depth_limit(
+        self, backlog, replies, monkeypatch
+    ):
+        monkeypatch.setattr(bot, "REQUEST_QUEUE_MAX_DEPTH", 3)
+        scheduler = backlog(3)
+        add_unverified_member()
+        press_recheck(replies)
+        # The tier is off here, so there is no paying guild to exempt.
+        assert replies == [self.busy()]
+        assert scheduler.held() == 3
+        # Turned away before the cooldown, so trying later is not blocked.
+        assert bot._verification_cooldowns == {}
+
+    def test_a_free_press_is_turned_away_past_the_age_limit(
+        self, backlog, replies, monkeypatch
+    ):
+        monkeypatch.setattr(bot, "REQUEST_QUEUE_MAX_AGE_SECONDS", 60)
+        backlog(1, waited=61)
+        add_unverified_member()
+        press_recheck(replies)
+        assert replies == [self.busy()]
+
+    def test_below_both_limits_the_press_is_held(self, backlog, replies, monkeypatch):
+        monkeypatch.setattr(bot, "REQUEST_QUEUE_MAX_DEPTH", 3)
+        monkeypatch.setattr(bot, "REQUEST_QUEUE_MAX_AGE_SECONDS", 60)
+        scheduler = backlog(2, waited=30)
+        add_unverified_member()
+        press_recheck(replies)
+        assert replies == [bot.localizations["en-US"]["recheck_started"]]
+        assert scheduler.held() == 3
+
+    def test_a_premium_press_is_still_admitted(
+        self, backlog, replies, enforced, monkeypatch
+    ):
+        monkeypatch.setattr(bot, "REQUEST_QUEUE_MAX_DEPTH", 3)
+        scheduler = backlog(3)
+        add_unverified_member()
+        press_recheck(replies, entitlements=[FakeEntitlement()])
+        assert replies != [self.busy()]
+        assert scheduler.held() == 4
+
+    def test_an_unpaid_guild_is_turned_away_once_the_tier_is_on(
+        self, backlog, replies, enforced, monkeypatch
+    ):
+        monkeypatch.setattr(bot, "REQUEST_QUEUE_MAX_DEPTH", 3)
+        backlog(3)
+        add_unverified_member()
+        press_recheck(replies)
+        assert replies == [self.busy()]
+
+    def test_zero_turns_the_limits_off(self, backlog, monkeypatch):
+        monkeypatch.setattr(bot, "REQUEST_QUEUE_MAX_DEPTH", 0)
+        monkeypatch.setattr(bot, "REQUEST_QUEUE_MAX_AGE_SECONDS", 0)
+        backlog(500, waited=3600)
+        assert not bot.request_queue_saturated()
+
+    def test_a_published_request_expires_in_rabbitmq(self, publish_spy):
+        run(bot.publish_to_vrc_checker("1", "usr_a", GUILD_ID, None))
+        expiration = int(publish_spy.publishes[0]["properties"].expiration)
+        assert bot.REQUEST_TTL_SECONDS * 1000 - 5000 < expiration
+        assert expiration <= bot.REQUEST_TTL_SECONDS * 1000
+
+    def test_a_code_check_expires_with_its_pending_code(self, publish_spy):
+        expires_at = bot.datetime.now(bot.timezone.utc) + bot.timedelta(seconds=90)
+        run(
+            bot.publish_to_vrc_checker(
+                "1", "usr_a", GUILD_ID, "VRC-ABCDEF", expires_at=expires_at
+            )
+        )
+        expiration = int(publish_spy.publishes[0]["properties"].expiration)
+        assert 85_000 < expiration <= 90_000
+
+    def test_the_body_carries_a_deadline_the_checker_reads(self, publish_spy):
+        expires_at = bot.datetime.now(bot.timezone.utc) + bot.timedelta(seconds=90)
+        run(
+            bot.publish_to_vrc_checker(
+                "1", "usr_a", GUILD_ID, "VRC-ABCDEF", expires_at=expires_at
+            )
+        )
+        sent = json.loads(publish_spy.publishes[0]["body"])
+        stamped = bot.datetime.fromisoformat(sent["expiresAt"])
+        assert abs((stamped - expires_at).total_seconds()) < 1
+        assert bot.datetime.fromisoformat(sent["enqueuedAt"]) < stamped
+        assert checker.request_expired(sent) is False
+        later = expires_at + bot.timedelta(seconds=checker.REQUEST_EXPIRY_GRACE_SECONDS + 1)
+        assert checker.request_expired(sent, now=later) is True
+
+    def test_a_request_past_its_deadline_is_not_published(self, publish_spy):
+        expires_at = bot.datetime.now(bot.timezone.utc) - bot.timedelta(seconds=1)
+        key = bot.inflight_request_key("1", GUILD_ID, "VRC-ABCDEF")
+        assert (
+            run(
+                bot.publish_to_vrc_checker(
+                    "1", "usr_a", GUILD_ID, "VRC-ABCDEF", expires_at=expires_at
+                )
+            )
+            is False
+        )
+        assert publish_spy.publishes == []
+        assert key not in bot._inflight_requests, "pressing again must work"
+
+    def test_a_held_request_past_its_deadline_is_dropped(self, monkeypatch, publish_spy):
+        monkeypatch.setattr(bot, "request_scheduler", bot.RequestScheduler(5))
+        key = bot.inflight_request_key("1", GUILD_ID, None)
+        bot._inflight_requests[key] = bot.time.monotonic() + 60
+        bot.request_scheduler.hold(
+            bot.HeldRequest(
+                key, GUILD_ID, "{}", pika.BasicProperties(), 1,
+                bot.time.monotonic() - 700, bot.time.monotonic() - 100,
+            )
+        )
+        before = bot.runtime_stats.get("checker_requests_expired_held")
+        assert run(bot.drain_request_queue()) == 0
+        assert publish_spy.publishes == []
+        assert key not in bot._inflight_requests
+        assert bot.runtime_stats.get("checker_requests_expired_held") == before + 1
+
+    def test_the_window_slot_comes_back_when_the_message_expires(self):
+        clock = [0.0]
+        scheduler = bot.RequestScheduler(1, clock=lambda: clock[0])
+        scheduler.occupy("key", expires_in=30)
+        clock[0] += 30
+        assert scheduler.has_room()
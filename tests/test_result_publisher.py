@@ -0,0 +1,196 @@
+"""Results go out on the consumer's own connection, confirmed.
+
+Both workers used to open a fresh connection per result. These pin down the
+replacement: one confirm-mode channel per connection, the result queue
+declared once, publishes from a worker thread handed to the consumer thread,
+and every way the hand-over can fail surfacing as the AMQPError the callers'
+retry loops already handle.
+"""
+
+import threading
+
+import pytest
+from pika.exceptions import AMQPError, NackError
+
+import vrc_group_inviter as inviter
+import vrc_online_checker as checker
+from result_publisher import ResultPublisher
+
+
+class FakeChannel:
+    def __init__(self, nack=False):
+        self.is_open = True
+        self.confirming = 0
+        self.declared = []
+        self.published = []
+        self.publish_threads = []
+        self.nack = nack
+
+    def confirm_delivery(self):
+        self.confirming += 1
+
+    def queue_declare(self, queue, durable=True, arguments=None):
+        self.declared.append(queue)
+
+    def basic_publish(self, exchange, routing_key, body, properties=None):
+        self.publish_threads.append(threading.get_ident())
+        if self.nack:
+            raise NackError([])
+        self.published.append((routing_key, body))
+
+
+class FakeConnection:
+    """Runs add_callback_threadsafe callbacks on a pretend consumer thread."""
+
+    def __init__(self, channel=None, run_callbacks=True, closed=False):
+        self.channel_obj = channel or FakeChannel()
+        self.channels_opened = 0
+        self.run_callbacks = run_callbacks
+        self.closed = closed
+        self.callbacks = []
+
+    def channel(self):
+        self.channels_opened += 1
+        return self.channel_obj
+
+    def add_callback_threadsafe(self, callback):
+        if self.closed:
+            raise AMQPError("connection closed")
+        self.callbacks.append(callback)
+        if self.run_callbacks:
+            callback()
+
+
+class TestResultPublisher:
+    def test_owner_thread_publishes_inline_in_confirm_mode(self):
+        conn = FakeConnection()
+        publisher = ResultPublisher(conn)
+
+        publisher.publish("results", "a", None)
+        publisher.publish("results", "b", None)
+
+        assert conn.callbacks == [], "the consumer thread needs no hand-over"
+        assert conn.channels_opened == 1
+        assert conn.channel_obj.confirming == 1
+        assert conn.channel_obj.declared == ["results"], "declared once, not per result"
+        assert conn.channel_obj.published == [("results", "a"), ("results", "b")]
+        assert publisher.publishes == 2
+
+    def test_other_threads_hand_the_publish_to_the_connection(self):
+        conn = FakeConnection()
+        publisher = ResultPublisher(conn)
+        errors = []
+
+        def worker():
+            try:
+                publisher.publish("results", "from-worker", None)
+            except Exception as e:  # pragma: no cover - surfaced below
+                errors.append(e)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join(5)
+
+        assert errors == []
+        assert len(conn.callbacks) == 1
+        assert conn.channel_obj.published == [("results", "from-worker")]
+
+    def test_reopens_and_redeclares_after_the_channel_closes(self):
+        conn = FakeConnection()
+        publisher = ResultPublisher(conn)
+        publisher.publish("results", "a", None)
+
+        conn.channel_obj.is_open = False
+        conn.channel_obj = FakeChannel()
+        publisher.publish("results", "b", None)
+
+        assert conn.channels_opened == 2
+        assert conn.channel_obj.confirming == 1
+        assert conn.channel_obj.declared == ["results"]
+
+    def test_a_nack_raises(self):
+        publisher = ResultPublisher(FakeConnection(FakeChannel(nack=True)))
+        with pytest.raises(AMQPError):
+            publisher.publish("results", "a", None)
+
+    def test_a_nack_on_a_worker_thread_reaches_the_worker(self):
+        publisher = ResultPublisher(FakeConnection(FakeChannel(nack=True)))
+        raised = []
+
+        def worker():
+            try:
+                publisher.publish("results", "a", None)
+            except AMQPError as e:
+                raised.append(e)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join(5)
+        assert len(raised) == 1
+
+    def test_a_closed_connection_raises_amqp_error(self):
+        publisher = ResultPublisher(FakeConnection(closed=True))
+        raised = []
+
+        def worker():
+            try:
+                publisher.publish("results", "a", None)
+            except AMQPError as e:
+                raised.append(e)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join(5)
+        assert len(raised) == 1
+
+    def test_an_unconfirmed_publish_times_out_as_amqp_error(self):
+        """A connection that dies after accepting the callback never runs it."""
+        publisher = ResultPublisher(FakeConnection(run_callbacks=False), confirm_timeout=0.05)
+        raised = []
+
+        def worker():
+            try:
+                publisher.publish("results", "a", None)
+            except AMQPError as e:
+                raised.append(e)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join(5)
+        assert len(raised) == 1
+
+
+class TestWorkersUseIt:
+    def test_checker_publishes_on_the_bound_publisher(self, monkeypatch):
+        conn = FakeConnection()
+        monkeypatch.setattr(checker, "result_publisher", ResultPublisher(conn))
+        monkeypatch.setattr(
+            checker, "_rabbitmq_connect_with_retry",
+            lambda max_tries=0: pytest.fail("opened a connection per result"),
+        )
+
+        checker.send_verification_result({"discord_id": "1", "status": "ok"})
+
+        assert [q for q, _ in conn.channel_obj.published] == [checker.RESULT_QUEUE_NAME]
+
+    def test_inviter_publishes_on_the_bound_publisher(self, monkeypatch):
+        conn = FakeConnection()
+        monkeypatch.setattr(inviter, "result_publisher", ResultPublisher(conn))
+        monkeypatch.setattr(
+            inviter, "_rabbitmq_connect_with_retry",
+            lambda max_tries=0: pytest.fail("opened a connection per result"),
+        )
+
+        inviter.publish_result({"state": "ready"})
+
+        assert [q for q, _ in conn.channel_obj.published] == [inviter.RESULT_QUEUE_NAME]
+
+    def test_inviter_still_raises_when_the_bound_publisher_fails(self, monkeypatch):
+        monkeypatch.setattr(
+            inviter, "result_publisher", ResultPublisher(FakeConnection(FakeChannel(nack=True)))
+        )
+        monkeypatch.setenv("RABBITMQ_PUBLISH_TRIES", "1")
+        monkeypatch.setattr(inviter.time, "sleep", lambda s: None)
+
+        with pytest.raises(AMQPError):
+            inviter.publish_result({"state": "ready"})
@@ -12,6 +12,7 @@ live ProgrammingError on a member pressing the invite button.
 """
 
 import logging
+from types import SimpleNamespace
 
 import pytest
 from sqlalchemy import Column, Integer, String, inspect
@@ -87,3 +88,102 @@ class TestTheStatementCarriesTheRightType:
         rendered = bot._ddl_type_for("group_seat_lease", "no_such_column")
         assert rendered
         assert "ALTER" not in rendered.upper()
+
+
+class TestTheHotPathIsIndexed:
+    """create_all() builds indexes only with their table, so the ones added to
+    tables that already shipped come from _ensure_indexes() at startup."""
+
+    HOT = {
+        "users": "ix_users_vrc_user_id",
+        "pending_verifications": "ix_pending_verifications_discord_id_guild_id",
+        "group_invite_request": "ix_group_invite_request_server_id_job_id",
+        "guild_onboarding": "ix_guild_onboarding_nudge_due",
+    }
+
+    def indexes_on(self, table):
+        return {index["name"] for index in inspect(bot.engine).get_indexes(table)}
+
+    def test_the_hot_filters_have_indexes(self):
+        for table, name in self.HOT.items():
+            assert name in self.indexes_on(table), table
+        assert "ix_pending_verifications_expires_at" in self.indexes_on(
+            "pending_verifications"
+        )
+
+    def test_an_index_missing_from_a_live_table_is_created_at_startup(self):
+        """The case create_all() cannot reach: the table predates the index."""
+        from sqlalchemy import text
+
+        with bot.engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_users_vrc_user_id"))
+        assert "ix_users_vrc_user_id" not in self.indexes_on("users")
+
+        bot._ensure_indexes()
+        assert "ix_users_vrc_user_id" in self.indexes_on("users")
+
+    def test_a_second_run_is_quiet(self, caplog):
+        with caplog.at_level(logging.WARNING):
+            bot._ensure_indexes()
+        assert "Could not create index" not in caplog.text
+
+    def test_the_modal_lookup_uses_the_index(self):
+        """The plan, not just the index's existence: an index the planner
+        ignores is a full scan with extra writes."""
+        from sqlalchemy import text
+
+        with bot.engine.connect() as conn:
+            plan = conn.execute(
+                text("EXPLAIN QUERY PLAN SELECT * FROM users WHERE vrc_user_id = 'usr_x'")
+            ).all()
+        assert any("ix_users_vrc_user_id" in str(row) for row in plan)
+
+    def test_postgres_builds_without_blocking_writes(self, monkeypatch):
+        """A plain CREATE INDEX on Postgres stalls every write to the table
+        until the build ends. CONCURRENTLY does not, but refuses to run in a
+        transaction, so it needs an AUTOCOMMIT connection of its own."""
+        from sqlalchemy.dialects import postgresql
+
+        statements = []
+
+        class RecordingConnection:
+            isolation_level = None
+
+            def execution_options(self, **options):
+                self.isolation_level = options.get("isolation_level")
+                return self
+
+            def execute(self, statement):
+                compiled = str(statement.compile(dialect=postgresql.dialect())).strip()
+                statements.append((compiled, self.isolation_level))
+                return SimpleNamespace(scalars=lambda: ["ix_users_vrc_user_id"])
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        monkeypatch.setattr(
+            bot,
+            "engine",
+            SimpleNamespace(
+                dialect=postgresql.dialect(), connect=RecordingConnection
+            ),
+        )
+        bot._ensure_indexes()
+
+        created = [sql for sql, _ in statements if sql.startswith("CREATE")]
+        assert created
+        assert all("CREATE INDEX CONCURRENTLY IF NOT EXISTS" in sql for sql in created)
+        assert all(
+            level == "AUTOCOMMIT" for sql, level in statements if "INDEX" in sql
+        )
+        assert "DROP INDEX CONCURRENTLY IF EXISTS ix_users_vrc_user_id" in [
+            sql for sql, _ in statements
+        ], "an invalid index left by an interrupted build is rebuilt"
+
+        users = bot.Base.metadata.tables["users"]
+        assert not any(
+            index.dialect_options["postgresql"]["concurrently"] for index in users.indexes
+        ), "create_all() must still get plain CREATE INDEX inside its transaction"
@@ -0,0 +1,177 @@
+"""The per-guild config the verification path reads from memory.
+
+Settings change a few times in a server's life and were read several times per
+verification. These pin down the cache that replaced those reads: a hit costs
+no query, every in-process writer invalidates, a read racing a write cannot
+re-cache the old value, and the cache stays bounded.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import event
+
+import bot
+
+GUILD_ID = "246813579"
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def make_server(**overrides):
+    fields = dict(server_id=GUILD_ID, owner_id="1", role_id="11", instructions_locale="en-US")
+    fields.update(overrides)
+    with bot.session_scope() as session:
+        session.add(bot.Server(**fields))
+
+
+def update_server(**fields):
+    """A write that bypasses every writer, as a hand-run UPDATE would."""
+    with bot.session_scope() as session:
+        srv = session.query(bot.Server).filter_by(server_id=GUILD_ID).one()
+        for name, value in fields.items():
+            setattr(srv, name, value)
+
+
+@pytest.fixture(autouse=True)
+def clean_db():
+    def wipe():
+        with bot.session_scope() as session:
+            session.query(bot.Server).delete()
+            session.query(bot.VerificationLogChannel).delete()
+
+    wipe()
+    yield
+    wipe()
+
+
+@pytest.fixture
+def config_queries():
+    """Statements touching the two config tables, as they are executed."""
+    seen = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "servers" in statement or "verification_log_channel" in statement:
+            seen.append(statement)
+
+    event.listen(bot.engine, "before_cursor_execute", record)
+    yield seen
+    event.remove(bot.engine, "before_cursor_execute", record)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestReads:
+    def test_a_hit_runs_no_query(self, config_queries):
+        make_server(auto_nickname_change=True)
+        first = bot.load_guild_config(GUILD_ID)
+        config_queries.clear()
+
+        assert bot.load_guild_config(GUILD_ID) is first
+        assert bot.get_server_locale_code(GUILD_ID) == "en-US"
+        assert bot.load_log_channel_id(GUILD_ID) is None
+        assert run(bot.guild_config(GUILD_ID)) is first
+        assert config_queries == []
+
+    def test_the_snapshot_carries_what_verification_reads(self):
+        make_server(
+            unverified_role_id="12",
+            auto_nickname_change=True,
+            instructions_locale="de",
+            custom_verification_requested_message="hi",
+            auto_verify_new_members=False,
+        )
+        bot.set_log_channel(GUILD_ID, "99")
+
+        config = bot.load_guild_config(GUILD_ID)
+        assert config == bot.GuildConfig(
+            exists=True,
+            role_id="11",
+            unverified_role_id="12",
+            auto_nickname_change=True,
+            instructions_locale="de",
+            custom_verification_requested_message="hi",
+            auto_verify_new_members=False,
+            log_channel_id="99",
+        )
+
+    def test_an_unset_up_guild_is_cached_too(self, config_queries):
+        assert bot.load_guild_config(GUILD_ID).exists is False
+        config_queries.clear()
+        bot.load_guild_config(GUILD_ID)
+        assert config_queries == []
+
+
+class TestInvalidation:
+    def test_an_outside_write_is_not_seen_until_invalidated(self):
+        make_server()
+        bot.load_guild_config(GUILD_ID)
+        update_server(role_id="22")
+
+        assert bot.load_guild_config(GUILD_ID).role_id == "11"
+        bot.server_config_cache.invalidate(GUILD_ID)
+        assert bot.load_guild_config(GUILD_ID).role_id == "22"
+
+    def test_setting_the_log_channel_invalidates(self):
+        make_server()
+        assert bot.load_log_channel_id(GUILD_ID) is None
+        bot.set_log_channel(GUILD_ID, "77")
+        assert bot.load_log_channel_id(GUILD_ID) == "77"
+        bot.set_log_channel(GUILD_ID, None)
+        assert bot.load_log_channel_id(GUILD_ID) is None
+
+    def test_a_read_that_raced_a_write_is_not_cached(self):
+        make_server()
+
+        def slow_read(key):
+            config = bot.read_guild_config(key)
+            # The write lands, and invalidates, while this read is in flight.
+            update_server(role_id="22")
+            bot.server_config_cache.invalidate(GUILD_ID)
+            return config
+
+        assert bot.server_config_cache.get(GUILD_ID, load=slow_read).role_id == "11"
+        assert bot.load_guild_config(GUILD_ID).role_id == "22"
+
+
+class TestBounds:
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = bot.ServerConfigCache(max_entries=10, ttl=30, clock=clock)
+        loads = []
+
+        def load(key):
+            loads.append(key)
+            return bot.GuildConfig()
+
+        cache.get("1", load=load)
+        clock.now = 29
+        cache.get("1", load=load)
+        clock.now = 31
+        cache.get("1", load=load)
+        assert loads == ["1", "1"]
+
+    def test_least_recently_used_is_evicted_first(self):
+        cache = bot.ServerConfigCache(max_entries=2, ttl=30, clock=FakeClock())
+        load = lambda key: bot.GuildConfig()  # noqa: E731
+        cache.get("1", load=load)
+        cache.get("2", load=load)
+        cache.get("1", load=load)
+        cache.get("3", load=load)
+
+        assert cache.peek("1") is not None
+        assert cache.peek("2") is None
+        assert len(cache) == 2
+
+    def test_ttl_zero_never_caches(self):
+        cache = bot.ServerConfigCache(max_entries=10, ttl=0, clock=FakeClock())
+        cache.get("1", load=lambda key: bot.GuildConfig())
+        assert len(cache) == 0
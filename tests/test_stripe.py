@@ -155,6 +155,7 @@ def clean_db():
             # point of the ledger -- so a test that writes one would otherwise
             # make every later test's server look like a returning customer.
             session.query(bot.PremiumEntitlementSeen).delete()
+            session.query(bot.PremiumEntitlementCursor).delete()
 
     wipe()
     bot.stripe_status_cache.clear()
@@ -325,6 +326,70 @@ class TestTheFailureRule:
         assert bot.stripe_status_cache.get_last_known(GUILD_ID) is None
 
 
+# ---------------------------------------------------------------
+# Refresh-ahead
+# ---------------------------------------------------------------
+OTHER_GUILD_ID = "222333444"
+
+
+class TestRefreshAhead:
+    """One query recomputes every guild, so no verification waits on expiry."""
+
+    @pytest.fixture
+    def guilds(self, monkeypatch):
+        in_guilds = [SimpleNamespace(id=int(GUILD_ID)), SimpleNamespace(id=int(OTHER_GUILD_ID))]
+        monkeypatch.setattr(type(bot.bot), "guilds", property(lambda client: in_guilds))
+
+    def test_every_guild_is_answered_from_one_read(self, stripe_on, guilds, monkeypatch):
+        store_subscription()
+        store_subscription(server_id="999", status="unpaid", subscription_id="sub_other")
+        assert run(bot.refresh_stripe_status()) == 3
+
+        def boom():
+            raise AssertionError("the hot path must not read the table")
+
+        monkeypatch.setattr(bot, "session_scope", boom)
+        assert bot.stripe_active(GUILD_ID) is True
+        assert bot.stripe_active(OTHER_GUILD_ID) is False  # in the bot, no row
+        assert bot.stripe_active("999") is False
+
+    def test_any_paid_row_wins_in_bulk_too(self, stripe_on, guilds):
+        store_subscription(status="unpaid", subscription_id="sub_a")
+        store_subscription(status="active", subscription_id="sub_b")
+        assert bot.load_stripe_paid_by_guild() == {GUILD_ID: True}
+
+    def test_a_webhook_during_the_read_wins(self, stripe_on, guilds, monkeypatch):
+        real_load = bot.load_stripe_paid_by_guild
+
+        def load_then_webhook():
+            paid = real_load()
+            # The webhook commits and invalidates while the read is in flight.
+            bot.stripe_status_cache.invalidate(OTHER_GUILD_ID)
+            return paid
+
+        monkeypatch.setattr(bot, "load_stripe_paid_by_guild", load_then_webhook)
+        run(bot.refresh_stripe_status())
+        assert bot.stripe_status_cache.get_fresh(GUILD_ID) is False
+        assert bot.stripe_status_cache.get_fresh(OTHER_GUILD_ID) is None
+
+    def test_a_failed_read_keeps_the_old_contents(self, stripe_on, guilds, monkeypatch):
+        bot.stripe_status_cache.set(GUILD_ID, True)
+
+        def boom():
+            raise RuntimeError("database is down")
+
+        monkeypatch.setattr(bot, "session_scope", boom)
+        assert run(bot.refresh_stripe_status()) is None
+        assert bot.stripe_status_cache.get_fresh(GUILD_ID) is True
+
+    def test_inert_while_stripe_is_off(self, monkeypatch):
+        def boom():
+            raise AssertionError("the table must not be read with Stripe off")
+
+        monkeypatch.setattr(bot, "session_scope", boom)
+        assert run(bot.refresh_stripe_status()) == 0
+
+
 # ---------------------------------------------------------------
 # The gate
 # ---------------------------------------------------------------
@@ -1267,14 +1332,27 @@ class TestTheEntitlementSweep:
     """The backfill, without which everything that ended before this shipped
     looks like a server that has never paid."""
 
-    def sweep_over(self, monkeypatch, *guild_ids):
+    def sweep_over(self, monkeypatch, *guild_ids, fail_after=None):
+        """Serve one entitlement per guild, with ids 1, 2, 3... in order.
+
+        Honours `after` and `limit` the way Discord does, so a sweep that
+        resumes from its cursor is only shown what came later. Returns the
+        sweep's result; the `after` ids asked for land in self.asked_after.
+        """
         entitlements = [
-            SimpleNamespace(guild_id=gid, sku_id=SKU_ID) for gid in guild_ids
+            SimpleNamespace(id=n, guild_id=gid, sku_id=SKU_ID)
+            for n, gid in enumerate(guild_ids, start=1)
         ]
+        self.asked_after = []
+
+        def _entitlements(after=None, limit=None, **kwargs):
+            self.asked_after.append(after.id)
 
-        def _entitlements(**kwargs):
             async def generate():
-                for item in entitlements:
+                newer = [e for e in entitlements if e.id > after.id]
+                for served, item in enumerate(newer[:limit], start=1):
+                    if fail_after is not None and served > fail_after:
+                        raise RuntimeError("Discord dropped the connection")
                     yield item
 
             return generate()
@@ -1282,6 +1360,9 @@ class TestTheEntitlementSweep:
         monkeypatch.setattr(bot.bot, "entitlements", _entitlements)
         return run(bot.sweep_entitlement_history())
 
+    def cursor(self):
+        return bot.load_entitlement_cursor(bot.PREMIUM_SKU_ID)
+
     def test_it_records_guilds_whose_entitlement_has_already_ended(
         self, enforced, stripe_on, monkeypatch
     ):
@@ -1317,12 +1398,66 @@ class TestTheEntitlementSweep:
         monkeypatch.setattr(bot.bot, "entitlements", boom)
         assert run(bot.sweep_entitlement_history()) == 0
 
-    def test_it_stops_at_the_cap_and_says_so(
+    def test_the_next_start_only_reads_what_came_after(
+        self, enforced, stripe_on, monkeypatch
+    ):
+        """Boot cost follows what changed, not the size of the business."""
+        assert self.sweep_over(monkeypatch, "1", "2", "3") == 3
+        assert self.asked_after == [0]
+        assert self.cursor() == 3
+
+        assert self.sweep_over(monkeypatch, "1", "2", "3", "4") == 1
+        assert self.asked_after == [3]
+        assert self.cursor() == 4
+
+    def test_an_empty_list_saves_no_cursor(self, enforced, stripe_on, monkeypatch):
+        assert self.sweep_over(monkeypatch) == 0
+        assert self.cursor() is None
+
+    def test_a_user_entitlement_moves_the_cursor_but_records_nothing(
+        self, enforced, stripe_on, monkeypatch
+    ):
+        assert self.sweep_over(monkeypatch, None, "2") == 1
+        assert self.cursor() == 2
+
+    def test_the_cap_only_defers_the_rest_to_the_next_start(
         self, enforced, stripe_on, monkeypatch, caplog
     ):
-        """Overflow means the ledger is incomplete, which is worth shouting
-        about: some server past the cap gets a second free trial."""
+        """The cap used to mean a permanently incomplete ledger. With the
+        cursor saved it only means the next start finishes the walk."""
         monkeypatch.setattr(bot, "ENTITLEMENT_SWEEP_MAX", 2)
-        with caplog.at_level("ERROR"):
-            self.sweep_over(monkeypatch, "1", "2", "3", "4")
-        assert any("INCOMPLETE" in record.message for record in caplog.records)
+        with caplog.at_level("WARNING"):
+            assert self.sweep_over(monkeypatch, "1", "2", "3", "4") == 2
+        assert any("cap" in record.message for record in caplog.records)
+        assert self.cursor() == 2
+
+        assert self.sweep_over(monkeypatch, "1", "2", "3", "4") == 2
+        assert self.cursor() == 4
+        for guild_id in ("1", "2", "3", "4"):
+            assert bot.has_ever_paid(guild_id) is True
+
+    def test_a_walk_cut_short_keeps_its_committed_batches(
+        self, enforced, stripe_on, monkeypatch
+    ):
+        monkeypatch.setattr(bot, "ENTITLEMENT_SWEEP_BATCH", 2)
+        assert self.sweep_over(monkeypatch, "1", "2", "3", "4", fail_after=3) == 2
+        # The third was fetched but never committed, so the cursor stops
+        # short of it and the next start reads it again.
+        assert self.cursor() == 2
+        assert bot.has_ever_paid("3") is False
+
+        assert self.sweep_over(monkeypatch, "1", "2", "3", "4") == 2
+        assert self.asked_after == [2]
+
+    def test_guilds_the_gateway_already_recorded_are_not_counted(
+        self, enforced, stripe_on
+    ):
+        bot.record_entitlement_seen("2")
+        assert bot.record_entitlement_batch(bot.PREMIUM_SKU_ID, ["1", "2", "2"], 7) == 1
+        assert self.cursor() == 7
+
+    def test_the_cursor_is_per_sku(self, enforced, stripe_on, monkeypatch):
+        """A new product's history is not skipped by the old product's mark."""
+        bot.record_entitlement_batch("some-other-sku", [], 50)
+        self.sweep_over(monkeypatch, "1")
+        assert self.asked_after == [0]
\ No newline at end of file
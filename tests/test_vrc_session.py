@@ -11,6 +11,9 @@ other's state" is the entire reason this module was split out.
 """
 
 import email.utils
+import io
+import json
+import threading
 from http.cookiejar import Cookie, MozillaCookieJar
 from types import SimpleNamespace
 
@@ -48,6 +51,9 @@ def account(session_file="", label="test") -> vrcs.VRChatAccount:
     )
 
 
+real_fetch_status_summary = vrcs.fetch_status_summary
+
+
 @pytest.fixture(autouse=True)
 def no_status_page(monkeypatch):
     """Never hit status.vrchat.com from tests."""
@@ -684,3 +690,195 @@ class TestStale2faCodes:
 
         src = inspect.getsource(vrcs.login)
         assert "fetch_latest_2fa_code(account, not_before=" in src
+
+
+class TestTokenBucket:
+    """The account's VRChat budget, shared by every lookup worker."""
+
+    class Clock:
+        def __init__(self):
+            self.now = 0.0
+            self.slept = []
+
+        def __call__(self):
+            return self.now
+
+        def sleep(self, seconds):
+            self.slept.append(seconds)
+            self.now += seconds
+
+    def bucket(self, rate, burst):
+        clock = self.Clock()
+        return vrcs.TokenBucket(rate, burst, clock=clock, sleep=clock.sleep), clock
+
+    def test_a_full_bucket_does_not_wait(self):
+        bucket, clock = self.bucket(rate=2, burst=3)
+        for _ in range(3):
+            assert bucket.acquire() == 0.0
+        assert clock.slept == []
+
+    def test_an_empty_bucket_waits_for_the_next_token(self):
+        bucket, clock = self.bucket(rate=2, burst=1)
+        bucket.acquire()
+        assert bucket.acquire() == pytest.approx(0.5)
+
+    def test_sustained_rate_is_the_configured_rate(self):
+        # However many callers there are, ten calls past the burst take five
+        # seconds at two per second.
+        bucket, clock = self.bucket(rate=2, burst=1)
+        for _ in range(11):
+            bucket.acquire()
+        assert clock.now == pytest.approx(5.0)
+
+    def test_idle_time_refills_only_up_to_the_burst(self):
+        bucket, clock = self.bucket(rate=1, burst=2)
+        bucket.acquire()
+        bucket.acquire()
+        clock.now += 100
+        bucket.acquire()
+        bucket.acquire()
+        assert clock.slept == []
+        assert bucket.acquire() == pytest.approx(1.0)
+
+    def test_zero_rate_is_unlimited(self):
+        bucket, clock = self.bucket(rate=0, burst=1)
+        for _ in range(100):
+            assert bucket.acquire() == 0.0
+        assert clock.slept == []
+
+
+class TestCircuitBreaker:
+    """Fast-fail during outages instead of every lookup timing out in turn."""
+
+    class Clock:
+        def __init__(self):
+            self.now = 0.0
+
+        def __call__(self):
+            return self.now
+
+    def breaker(self, threshold=3, cooldown=30.0):
+        clock = self.Clock()
+        return vrcs.CircuitBreaker(threshold, cooldown, clock=clock), clock
+
+    def test_opens_after_threshold_consecutive_failures(self):
+        breaker, _ = self.breaker(threshold=3)
+        for _ in range(2):
+            assert breaker.allow()
+            breaker.record_failure()
+        assert breaker.state == breaker.CLOSED
+        breaker.record_failure()
+        assert breaker.state == breaker.OPEN
+        assert not breaker.allow()
+        assert breaker.short_circuited == 1
+
+    def test_a_success_resets_the_count(self):
+        breaker, _ = self.breaker(threshold=3)
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == breaker.CLOSED
+
+    def test_exactly_one_probe_after_the_cooldown(self):
+        breaker, clock = self.breaker(threshold=1, cooldown=30)
+        breaker.record_failure()
+        clock.now = 29.9
+        assert not breaker.allow()
+        clock.now = 30
+        assert breaker.allow(), "the probe"
+        assert breaker.state == breaker.HALF_OPEN
+        assert not breaker.allow(), "a second caller while the probe is out"
+
+    def test_a_good_probe_closes(self):
+        breaker, clock = self.breaker(threshold=1, cooldown=30)
+        breaker.record_failure()
+        clock.now = 30
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == breaker.CLOSED
+        assert breaker.allow()
+
+    def test_a_bad_probe_reopens_for_a_full_cooldown(self):
+        breaker, clock = self.breaker(threshold=3, cooldown=30)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 30
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == breaker.OPEN
+        assert breaker.opened == 2
+        clock.now = 59
+        assert not breaker.allow()
+        clock.now = 60
+        assert breaker.allow()
+
+    def test_threshold_zero_disables(self):
+        breaker, _ = self.breaker(threshold=0)
+        for _ in range(10):
+            breaker.record_failure()
+        assert breaker.allow()
+        assert breaker.state == breaker.CLOSED
+
+
+class TestCircuitOpenError:
+    def test_reads_as_an_outage_with_status_page_detail(self, monkeypatch):
+        monkeypatch.setattr(
+            vrcs, "extract_relevant_status",
+            lambda: {"vrchat_outage": True, "vrchat_outage_confirmed": True,
+                     "vrchat_status_message": "API degraded", "vrchat_status_indicator": "major"},
+        )
+        meta = vrcs.circuit_open_error()
+        assert meta["lookup_ok"] is False
+        assert meta["error_type"] == "vrchat_upstream_error"
+        assert meta["vrchat_outage"] is True
+        assert meta["vrchat_outage_confirmed"] is True
+        assert meta["vrchat_status_message"] == "API degraded"
+
+
+class TestStatusPageCache:
+    """The status page is read when VRChat is failing, which is when it is
+    most likely to be slow or down itself."""
+
+    @pytest.fixture
+    def status_page(self, monkeypatch):
+        monkeypatch.setattr(vrcs, "fetch_status_summary", real_fetch_status_summary)
+        monkeypatch.setattr(vrcs, "_status_cache", {"expires_at": 0.0, "value": None})
+        calls = []
+
+        def install(answer):
+            def urlopen(req, timeout):
+                calls.append(req.full_url)
+                if isinstance(answer, Exception):
+                    raise answer
+                return io.BytesIO(json.dumps(answer).encode("utf-8"))
+
+            monkeypatch.setattr(vrcs.urllib_request, "urlopen", urlopen)
+            return calls
+
+        return install
+
+    def test_a_failed_fetch_is_not_retried_by_every_refused_lookup(self, status_page):
+        calls = status_page(TimeoutError("status page timed out"))
+        for _ in range(20):
+            meta = vrcs.circuit_open_error()
+        assert len(calls) == 1
+        assert meta["vrchat_outage"] is True
+        assert meta["vrchat_outage_confirmed"] is False
+
+    def test_a_failed_fetch_keeps_the_last_good_answer(self, status_page, monkeypatch):
+        status_page({"status": {"indicator": "major", "description": "Outage"}})
+        good = vrcs.fetch_status_summary()
+        monkeypatch.setitem(vrcs._status_cache, "expires_at", 0.0)
+        calls = status_page(TimeoutError())
+        assert vrcs.fetch_status_summary() == good
+        assert vrcs.fetch_status_summary() == good
+        assert len(calls) == 2, "one good fetch, one failed, then the cache"
+
+    def test_a_fetch_in_flight_is_not_joined(self, status_page, monkeypatch):
+        calls = status_page({"status": {}})
+        monkeypatch.setattr(vrcs, "_status_fetch_lock", threading.Lock())
+        vrcs._status_fetch_lock.acquire()
+        assert vrcs.fetch_status_summary() is None
+        assert calls == []